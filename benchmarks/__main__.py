@@ -0,0 +1,171 @@
+"""
+Run the benchmark suite, emit machine-readable results and compare them with a stored baseline.
+
+    python -m benchmarks                              # run all benchmarks and compare with benchmarks/baseline.json
+    python -m benchmarks bench_token_unit bench_hash  # run the selected benchmarks only
+    python -m benchmarks --output results.json        # also write the results as json
+    python -m benchmarks --save-baseline              # store the results as the new baseline
+    python -m benchmarks --threshold 1.3              # a case 30% slower than the baseline is a regression
+    python -m benchmarks --confirm 0                  # fail on the first measurement without running again
+
+Timings are compared as they are. A synthetic reference workload did not track the cases on a loaded machine,
+e.g. it ran faster while the cases ran slower, so normalizing by it only added noise.
+Timings on a busy machine only get slower, so the modules with regressions are run again ``--confirm`` times
+and the best timing of every case is compared, which filters out the cases slowed down by other processes.
+Cases listed in the ``REFERENCE_CASES`` of a module, e.g. the stdlib or third-party implementations
+compared with, are reported but never counted as regressions.
+The exit code is 1 if any regression is found and the baseline was saved on the same machine,
+otherwise the comparison is only reported; ``--strict`` also fails on baselines of other machines.
+"""
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import sys
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+import benchmarks
+from benchmarks._utils import (
+    report,
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 1.5
+DEFAULT_CONFIRM_ROUNDS = 3
+
+
+def discover() -> List[str]:
+    return sorted(
+        module.name for module in pkgutil.iter_modules(benchmarks.__path__)
+        if module.name.startswith("bench_")
+    )
+
+
+def machine() -> Dict[str, Any]:
+    """
+    The description of the machine, timings are only comparable between the same machines
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(names: List[str]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name in names:
+        module = importlib.import_module(f"benchmarks.{name}")
+        unit = getattr(module, "UNIT", "ns/op")
+        module_results = module.collect()
+        report(module.TITLE, module_results, unit)
+        results[name] = {
+            "unit": unit,
+            "reference_cases": list(getattr(module, "REFERENCE_CASES", ())),
+            "results": module_results,
+        }
+    return {**machine(), "benchmarks": results}
+
+
+def confirm(current: Dict[str, Any], names: List[str], rounds: int) -> None:
+    """
+    Run the modules again and keep the best result of every case in `current`
+    """
+    for _ in range(rounds):
+        rerun = run(names)
+        for name in names:
+            results = current["benchmarks"][name]["results"]
+            for case, value in rerun["benchmarks"][name]["results"].items():
+                results[case] = min(results.get(case, value), value)
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float, verbose: bool = True
+) -> List[str]:
+    """
+    Print the ratio of every case to the baseline and return the regressed cases.
+    The reference cases of the modules are never regressions.
+    """
+    regressions: List[str] = []
+    log = print if verbose else lambda *args: None
+    log(f"comparison with baseline (python {baseline.get('python')}, threshold {threshold}x)")
+    for name, module_results in current["benchmarks"].items():
+        baseline_module = baseline["benchmarks"].get(name, {})
+        baseline_results = baseline_module.get("results", {})
+        reference_cases = set(module_results.get("reference_cases", ()))
+        for case, value in module_results["results"].items():
+            if case not in baseline_results or baseline_results[case] <= 0:
+                continue
+            ratio = value / baseline_results[case]
+            flag = ""
+            if case in reference_cases:
+                flag = "  (reference)"
+            elif ratio > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name}: {case}")
+            log(f"  {name}: {case:<50} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def same_machine(current: Dict[str, Any], baseline: Dict[str, Any]) -> bool:
+    return all(baseline.get(key) == current[key] for key in machine())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("names", nargs="*", help="benchmark modules to run, defaults to all")
+    parser.add_argument("--output", help="path to write the results as json")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="path of the baseline json")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="max allowed ratio of a result to the baseline")
+    parser.add_argument("--strict", action="store_true",
+                        help="fail on regressions even if the baseline was saved on another machine")
+    parser.add_argument("--confirm", type=int, default=DEFAULT_CONFIRM_ROUNDS,
+                        help="times to run the modules with regressions again before reporting them")
+    args = parser.parse_args()
+
+    current = run(args.names or discover())
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.save_baseline:
+        baseline = current
+        if os.path.exists(args.baseline):
+            # keep the stored results of the benchmarks not run this time
+            with open(args.baseline) as f:
+                stored_results = json.load(f)["benchmarks"]
+            stored_results.update(current["benchmarks"])
+            baseline = {**current, "benchmarks": stored_results}
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline found at {args.baseline}, run with --save-baseline to create one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.threshold, verbose=False)
+    if regressions and args.confirm > 0:
+        regressed_modules = sorted({regression.partition(": ")[0] for regression in regressions})
+        print(f"running {', '.join(regressed_modules)} again to confirm {len(regressions)} regression(s)")
+        confirm(current, regressed_modules, args.confirm)
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) found")
+        if args.strict or same_machine(current, baseline):
+            return 1
+        print("the baseline was saved on another machine, so the regressions are only reported")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Loader of modules from the baseline commit, i.e. the implementation before the optimizations,
+which is compared with by some benchmarks, e.g. the token units storing values as :class:`decimal.Decimal`.
+
+The sources are read from git, so nothing of the baseline is copied into the tree.
+The loaders return None if git or the baseline commit is not available, e.g. in a source distribution.
+"""
+import functools
+import os
+import subprocess
+import sys
+import types
+from typing import (
+    Dict,
+    Optional,
+)
+from unittest import (
+    mock,
+)
+
+BASELINE_COMMIT = "b695f1e"
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read_source(path: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "show", f"{BASELINE_COMMIT}:{path}"],
+            cwd=_REPO_ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_module(
+    path: str, name: str, dependencies: Optional[Dict[str, types.ModuleType]] = None
+) -> Optional[types.ModuleType]:
+    """
+    Execute the baseline source of `path` as a new module named `name`
+
+    :param str path: the path of the source file relative to the repository root
+    :param str name: the name of the new module, which should not collide with the current modules
+    :param dependencies: modules replacing the current ones while the source is executed,
+        e.g. the baseline `cfx_utils.decorators`
+    """
+    source = _read_source(path)
+    if source is None:
+        return None
+    module = types.ModuleType(name)
+    module.__file__ = f"{BASELINE_COMMIT}:{path}"
+    # registered so that the classes defined by the module can be pickled or inspected
+    sys.modules[name] = module
+    with mock.patch.dict(sys.modules, dependencies or {}):
+        exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+
+@functools.lru_cache(maxsize=None)
+def load_token_unit() -> Optional[types.ModuleType]:
+    """
+    The baseline `cfx_utils.token_unit` together with the baseline `combomethod` it was built on.
+    Exceptions are shared with the current package.
+    """
+    decorators = load_module("cfx_utils/decorators.py", "_baseline_decorators")
+    if decorators is None:
+        return None
+    return load_module(
+        "cfx_utils/token_unit.py", "_baseline_token_unit", {"cfx_utils.decorators": decorators}
+    )
@@ -0,0 +1,20 @@
+import timeit
+from typing import (
+    Callable,
+    Dict,
+)
+
+
+def measure(func: Callable[[], object], number: int = 10000, repeat: int = 5) -> float:
+    """
+    Return the best observed time of a single `func()` call in nanoseconds
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def report(title: str, results: Dict[str, float], unit: str = "ns/op") -> None:
+    print(title)
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"  {name:<{width}}  {value:>14.1f} {unit}")
@@ -0,0 +1,67 @@
+"""
+Benchmarks of validating hex addresses in batch, e.g. checking the recipients of imported transfers,
+compared with eth_utils which computes the keccak checksum for every mixed-case address.
+
+Run with ``python -m benchmarks.bench_address``
+"""
+import random
+from typing import (
+    Dict,
+    List,
+)
+
+from eth_utils import (
+    is_address,
+    to_checksum_address,
+)
+from cfx_utils.address import (
+    is_hex_address,
+    validate_hex_addresses,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 1_000_000
+TITLE = f"hex address validation ({SIZE} addresses)"
+# eth_utils is compared with, but its speed is not gated
+REFERENCE_CASES = ("eth_utils.is_address(checksummed)", "[eth_utils.is_address(a) for a in addresses]")
+
+_random = random.Random(0)
+# recipients repeat across transfers, half of them are checksummed and a few are invalid
+_recipients = [
+    "0x1" + "".join(_random.choice("0123456789abcdef") for _ in range(39))
+    for _ in range(1000)
+]
+_recipients = [to_checksum_address(address) if i % 2 else address for i, address in enumerate(_recipients)]
+_recipients.append("0x1" + "g" * 39)
+addresses = [_random.choice(_recipients) for _ in range(SIZE)]
+
+
+def eth_utils_is_address() -> List[bool]:
+    return [is_address(address) for address in addresses]
+
+
+def collect() -> Dict[str, float]:
+    checksummed = _recipients[1]
+    return {
+        "is_hex_address(checksummed)": measure(lambda: is_hex_address(checksummed), number=100000),
+        "eth_utils.is_address(checksummed)": measure(lambda: is_address(checksummed), number=100000),
+        "[eth_utils.is_address(a) for a in addresses]": measure(eth_utils_is_address, number=1, repeat=3),
+        "validate_hex_addresses(addresses)": measure(lambda: validate_hex_addresses(addresses), number=1, repeat=3),
+        "validate_hex_addresses(addresses, conflux=True)": measure(
+            lambda: validate_hex_addresses(addresses, conflux=True), number=1, repeat=3
+        ),
+        "validate_hex_addresses(addresses, return_errors=True)": measure(
+            lambda: validate_hex_addresses(addresses, return_errors=True), number=1, repeat=3
+        ),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
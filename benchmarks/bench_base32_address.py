@@ -0,0 +1,61 @@
+"""
+Benchmarks of encoding and decoding CIP-37 base32 addresses, compared with the cfx-address package.
+
+Run with ``python -m benchmarks.bench_base32_address``
+"""
+import random
+from typing import (
+    Dict,
+)
+
+from cfx_address import (
+    Base32Address,
+)
+from cfx_utils.base32_address import (
+    ADDRESS_SIZE,
+    decode_base32_address,
+    decode_many,
+    encode_base32_address,
+    encode_many,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 100_000
+TITLE = f"base32 address ({SIZE} addresses)"
+# cfx-address is compared with, but its speed is not gated
+REFERENCE_CASES = ("cfx_address.Base32Address(hex, 1029)", "cfx_address.Base32Address.decode(address)")
+
+_random = random.Random(0)
+data = b"".join(bytes([0x10 | _random.randrange(16)]) + _random.randbytes(ADDRESS_SIZE - 1) for _ in range(SIZE))
+hex_addresses = [
+    "0x" + data[i:i + ADDRESS_SIZE].hex() for i in range(0, len(data), ADDRESS_SIZE)
+]
+base32_addresses = encode_many(data, 1029)
+out = bytearray(len(data))
+hex_address = hex_addresses[0]
+base32_address = base32_addresses[0]
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "cfx_address.Base32Address(hex, 1029)": measure(lambda: Base32Address(hex_address, 1029), number=10000),
+        "encode_base32_address(hex, 1029)": measure(lambda: encode_base32_address(hex_address, 1029), number=10000),
+        "cfx_address.Base32Address.decode(address)": measure(lambda: Base32Address.decode(base32_address), number=10000),
+        "decode_base32_address(address)": measure(lambda: decode_base32_address(base32_address), number=10000),
+        "encode_many(data, 1029)": measure(lambda: encode_many(data, 1029), number=1, repeat=3),
+        "decode_many(addresses, out)": measure(lambda: decode_many(base32_addresses, out), number=1, repeat=3),
+    }
+
+
+def main() -> None:
+    results = collect()
+    report(TITLE, results)
+    print(f"  encode_many: {SIZE / results['encode_many(data, 1029)'] * 1e9:,.0f} addresses/s")
+    print(f"  decode_many: {SIZE / results['decode_many(addresses, out)'] * 1e9:,.0f} addresses/s")
+
+
+if __name__ == "__main__":
+    main()
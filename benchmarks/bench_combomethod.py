@@ -0,0 +1,75 @@
+"""
+Benchmarks of :class:`~cfx_utils.decorators.combomethod` against the previous closure based descriptor and `classmethod`.
+
+Run with ``python -m benchmarks.bench_combomethod``
+"""
+import functools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+)
+
+from cfx_utils.decorators import (
+    combomethod,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+TITLE = "combomethod"
+# the previous closure implementation and the builtin classmethod are compared with, but their speed is not gated
+REFERENCE_CASES = (
+    "closure descriptor (class)",
+    "closure descriptor (instance)",
+    "classmethod (class)",
+    "classmethod (instance)",
+)
+
+
+class closure_combomethod:
+    # the previous implementation, which creates a closure and copies metadata on every access
+    def __init__(self, method: Callable[..., Any]) -> None:
+        self.method = method
+
+    def __get__(self, obj: object = None, objtype: Any = None) -> Callable[..., Any]:
+        @functools.wraps(self.method)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            if obj is not None:
+                return self.method(obj, *args, **kwargs)
+            else:
+                return self.method(objtype, *args, **kwargs)
+
+        return _wrapper
+
+
+class Sample:
+    def _method(cls_or_self: Any, value: int) -> int:
+        return value
+
+    closure = closure_combomethod(_method)
+    combo = combomethod(_method)
+    klass = classmethod(_method)
+
+
+sample = Sample()
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "closure descriptor (class)": measure(lambda: Sample.closure(1), number=100000),
+        "closure descriptor (instance)": measure(lambda: sample.closure(1), number=100000),
+        "combomethod (class)": measure(lambda: Sample.combo(1), number=100000),
+        "combomethod (instance)": measure(lambda: sample.combo(1), number=100000),
+        "classmethod (class)": measure(lambda: Sample.klass(1), number=100000),
+        "classmethod (instance)": measure(lambda: sample.klass(1), number=100000),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
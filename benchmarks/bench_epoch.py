@@ -0,0 +1,42 @@
+"""
+Benchmarks of validating and encoding epoch number params.
+
+Run with ``python -m benchmarks.bench_epoch``
+"""
+from typing import (
+    Dict,
+)
+
+from cfx_utils.epoch import (
+    EpochRangePlanner,
+    normalize_epoch,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+TITLE = "epoch"
+
+
+def plan_all() -> None:
+    planner = EpochRangePlanner(0, 10**7 - 1, window=1000, max_window=1000)
+    for window in planner:
+        planner.complete(window, 100)
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "normalize_epoch('latest_state')": measure(lambda: normalize_epoch("latest_state")),
+        "normalize_epoch(12345678)": measure(lambda: normalize_epoch(12345678)),
+        "normalize_epoch('0xbc614e')": measure(lambda: normalize_epoch("0xbc614e")),
+        "plan 10^7 epochs in 1000 epoch windows": measure(plan_all, number=1, repeat=3),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmarks of hashing token objects in set/dict heavy workloads, e.g. grouping transfers by amount.
+
+Run with ``python -m benchmarks.bench_hash``
+"""
+import collections
+import random
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 100_000
+TITLE = f"hash ({SIZE} transfers)"
+
+_random = random.Random(0)
+# transfers in mixed units, many of them share the same amount, e.g. CFX(1) and GDrip(10**9)
+transfers = [
+    CFX(amount) if _random.random() < 0.5 else GDrip(amount * 10**9)
+    for amount in (_random.randrange(100) for _ in range(SIZE))
+]
+one_cfx = CFX(1)
+
+
+def group_by_amount() -> None:
+    groups = collections.defaultdict(list)
+    for transfer in transfers:
+        groups[transfer].append(transfer)
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "hash(CFX(1))": measure(lambda: hash(one_cfx), number=100000),
+        "Counter(transfers)": measure(lambda: collections.Counter(transfers), number=3),
+        "set(transfers)": measure(lambda: set(transfers), number=3),
+        "group by amount": measure(group_by_amount, number=3),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+    # should be 100 if hash is consistent with __eq__ across units
+    print(f"  distinct amounts: {len(set(transfers))}")
+
+
+if __name__ == "__main__":
+    main()
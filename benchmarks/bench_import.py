@@ -0,0 +1,110 @@
+"""
+Benchmarks of import costs: the overhead :class:`~cfx_utils.post_import_hook.PostImportFinder` adds to imports
+of a large dependency tree, and the startup time of `import cfx_utils` in a fresh interpreter.
+The finder is only on `sys.meta_path` while hooks are pending, so importing with no pending hook costs nothing.
+
+Run with ``python -m benchmarks.bench_import``
+"""
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import (
+    Dict,
+    List,
+)
+
+from cfx_utils.post_import_hook import (
+    _post_import_hooks,
+    when_imported,
+)
+from benchmarks._utils import (
+    report,
+)
+
+MODULE_COUNT = 1000
+TITLE = f"import (a dependency tree of {MODULE_COUNT} modules)"
+# the difference of 2 timings swings much more than the timings themselves, so it is only reported
+REFERENCE_CASES = ("pending hook overhead per import",)
+
+
+def _create_modules(directory: str) -> List[str]:
+    """
+    Create modules forming a binary dependency tree, importing the first module imports all of them
+    """
+    names = [f"_cfx_bench_module_{i}" for i in range(MODULE_COUNT)]
+    for i, name in enumerate(names):
+        children = [names[child] for child in (2 * i + 1, 2 * i + 2) if child < MODULE_COUNT]
+        with open(os.path.join(directory, f"{name}.py"), "w") as f:
+            f.writelines(f"import {child}\n" for child in children)
+            f.write("VALUE = 1\n")
+    return names
+
+
+def _import_tree(names: List[str], hooked: str = "") -> float:
+    for name in names:
+        sys.modules.pop(name, None)
+    importlib.invalidate_caches()
+    if hooked:
+        when_imported(hooked)(lambda module: None)
+    start = time.perf_counter()
+    importlib.import_module(names[0])
+    return time.perf_counter() - start
+
+
+def measure_finder_overhead(repeat: int = 5) -> Dict[str, float]:
+    """
+    Measure importing a fresh dependency tree without hooks, with a hook pending during the whole import,
+    and with a hook on a module in the middle of the tree, after which the finder removes itself
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        names = _create_modules(directory)
+        try:
+            without_hook = min(_import_tree(names) for _ in range(repeat))
+            # a hook of a module which is never imported keeps the finder installed
+            pending = min(_import_tree(names, "_cfx_bench_never_imported") for _ in range(repeat))
+            _post_import_hooks.pop("_cfx_bench_never_imported", None)
+            fired = min(_import_tree(names, names[MODULE_COUNT // 2]) for _ in range(repeat))
+        finally:
+            sys.path.remove(directory)
+            for name in names:
+                sys.modules.pop(name, None)
+            _post_import_hooks.clear()
+    return {
+        "import tree without hooks": without_hook * 1e9,
+        "import tree with a pending hook": pending * 1e9,
+        "import tree with a hook fired in the middle": fired * 1e9,
+        "pending hook overhead per import": (pending - without_hook) / MODULE_COUNT * 1e9,
+    }
+
+
+def measure_startup(statement: str, repeat: int = 10) -> float:
+    """
+    Return the best wall time in nanoseconds to run `statement` in a fresh interpreter
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e9
+
+
+def collect() -> Dict[str, float]:
+    results = measure_finder_overhead()
+    interpreter = measure_startup("pass")
+    results["python -c pass"] = interpreter
+    results["python -c 'import cfx_utils'"] = measure_startup("import cfx_utils")
+    results["import cfx_utils (startup - interpreter)"] = results["python -c 'import cfx_utils'"] - interpreter
+    return results
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmarks of token operations with the instrumentation disabled and enabled.
+The disabled case should be as fast as the uninstrumented code because the original methods are restored.
+
+Run with ``python -m benchmarks.bench_instrumentation``
+"""
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+)
+from cfx_utils.token_instrumentation import (
+    TokenInstrumentation,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+TITLE = "instrumentation"
+
+one_cfx = CFX(1)
+one_drip = Drip(1)
+
+
+def operations() -> None:
+    one_cfx.to(Drip)
+    one_cfx + one_drip
+    CFX(1)
+
+
+def collect() -> Dict[str, float]:
+    instrumentation = TokenInstrumentation()
+    results = {"operations (disabled)": measure(operations)}
+    instrumentation.enable()
+    try:
+        results["operations (counting)"] = measure(operations)
+        instrumentation.enable(timing=True)
+        results["operations (counting and timing)"] = measure(operations)
+    finally:
+        instrumentation.disable()
+    results["operations (disabled again)"] = measure(operations)
+    return results
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
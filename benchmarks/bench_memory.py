@@ -0,0 +1,98 @@
+"""
+Memory benchmark reporting the bytes allocated per token object of each token unit,
+before (the baseline token units holding a :class:`decimal.Decimal` in a per-instance ``__dict__``)
+and after (the slotted token units holding the base unit integer).
+
+Run with ``python -m benchmarks.bench_memory``
+"""
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+    TokenUnitFactory,
+)
+from benchmarks._baseline import (
+    load_token_unit,
+)
+from benchmarks._utils import (
+    report,
+)
+
+COUNT = 100_000
+TITLE = f"memory ({COUNT} objects, input integers excluded)"
+UNIT = "bytes/object"
+
+Wei = TokenUnitFactory.factory_base_unit("BenchWei")
+Ether = TokenUnitFactory.factory_derived_unit("BenchEther", 18, Wei)
+
+
+def bytes_per_instance(factory: Callable[[int], Any]) -> float:
+    tracemalloc.start()
+    # values are large enough to never be cached small ints, and are allocated before measuring objects
+    values = [10**20 + i for i in range(COUNT)]
+    after_values = tracemalloc.get_traced_memory()[0]
+    objects = [factory(value) for value in values]
+    after_objects = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects, values
+    # the list holding the objects takes 8 bytes per pointer
+    return (after_objects - after_values) / COUNT - 8
+
+
+CASES: Dict[str, Callable[[int], Any]] = {
+    "Drip": Drip,
+    "CFX": lambda value: CFX(Drip(value)),
+    "GDrip": lambda value: GDrip(Drip(value)),
+    "factory base unit": Wei,
+    "factory derived unit": lambda value: Ether(Wei(value)),
+}
+
+# the same units of the baseline, where the Decimal of each object is included as it is created by the constructor
+baseline = load_token_unit()
+BASELINE_CASES: Dict[str, Callable[[int], Any]] = {}
+if baseline is not None:
+    BaselineWei = baseline.TokenUnitFactory.factory_base_unit("BenchWei")
+
+    # the baseline factory_derived_unit passes a generic alias to type(), which fails, so the unit is declared
+    class BaselineEther(baseline.AbstractDerivedTokenUnit[BaselineWei]):  # type: ignore
+        _decimals = 18
+
+    BaselineWei.register_derived_unit(BaselineEther)
+    BASELINE_CASES = {
+        "Drip": baseline.Drip,
+        "CFX": lambda value: baseline.CFX(baseline.Drip(value)),
+        "GDrip": lambda value: baseline.GDrip(baseline.Drip(value)),
+        "factory base unit": BaselineWei,
+        "factory derived unit": lambda value: BaselineEther(BaselineWei(value)),
+    }
+# the baseline is compared with, but its memory is not gated
+REFERENCE_CASES = tuple(f"{name} (before)" for name in BASELINE_CASES)
+
+
+def collect() -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for name, factory in CASES.items():
+        if name in BASELINE_CASES:
+            results[f"{name} (before)"] = bytes_per_instance(BASELINE_CASES[name])
+        results[f"{name} (after)"] = bytes_per_instance(factory)
+    return results
+
+
+def main() -> None:
+    results = collect()
+    report(TITLE, results, UNIT)
+    if not BASELINE_CASES:
+        print("  the baseline is not available from git, so only the current token units are measured")
+    for name in BASELINE_CASES:
+        print(f"  saved by {name}: {results[f'{name} (before)'] - results[f'{name} (after)']:.0f} bytes/object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmarks of token operations from 1 to N threads, e.g. token math in a large ThreadPoolExecutor.
+The read paths (registry lookups, conversions and arithmetic) take no lock, so the throughput scales
+with the number of cores on free-threaded CPython, while with the GIL the time per operation stays flat.
+
+Run with ``python -m benchmarks.bench_threads``
+"""
+import os
+import sys
+import threading
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from benchmarks._utils import (
+    report,
+)
+
+OPERATIONS = 20_000
+THREAD_COUNTS = (1, 2, 4, 8)
+TITLE = f"threads ({OPERATIONS} operations per thread, wall time per operation)"
+
+registry = Drip.get_unit_registry()
+one_cfx = CFX(1)
+gdrip = GDrip(20)
+
+
+def conversions() -> None:
+    for _ in range(OPERATIONS):
+        one_cfx.to("GDrip").to_base_unit()
+
+
+def arithmetic() -> None:
+    for _ in range(OPERATIONS):
+        (one_cfx + gdrip) * 2 - one_cfx
+
+
+def registry_lookups() -> None:
+    get = registry.get
+    for _ in range(OPERATIONS):
+        get("cfx")
+
+
+def run_threads(work: Callable[[], None], thread_count: int, repeat: int = 3) -> float:
+    """
+    Return the best wall time in nanoseconds per operation of `thread_count` threads running `work` together
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        barrier = threading.Barrier(thread_count + 1)
+
+        def target() -> None:
+            barrier.wait()
+            work()
+
+        threads: List[threading.Thread] = [threading.Thread(target=target) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        best = min(best, time.perf_counter() - start)
+    return best / (OPERATIONS * thread_count) * 1e9
+
+
+def collect() -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for name, work in (("conversions", conversions), ("arithmetic", arithmetic), ("registry lookups", registry_lookups)):
+        for thread_count in THREAD_COUNTS:
+            results[f"{name} (threads={thread_count})"] = run_threads(work, thread_count)
+    return results
+
+
+def main() -> None:
+    results = collect()
+    report(TITLE, results)
+    cores = os.cpu_count() or 1
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"  {cores} cores, GIL {'enabled' if gil else 'disabled'}")
+    for case, ns_per_op in results.items():
+        name, _, thread_count = case[:-1].partition(" (threads=")
+        threads = int(thread_count)
+        speedup = results[f"{name} (threads=1)"] / ns_per_op
+        per_core = 1e9 / ns_per_op / min(threads, cores)
+        print(f"  {case:<30} {1e9 / ns_per_op:>12,.0f} ops/s  {per_core:>12,.0f} ops/s per core  {speedup:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmarks of summing mixed unit token values with :class:`~cfx_utils.token_accumulator.TokenAccumulator`.
+
+Run with ``python -m benchmarks.bench_token_accumulator``
+"""
+import random
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from cfx_utils.token_accumulator import (
+    TokenAccumulator,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 100_000
+TITLE = f"token_accumulator ({SIZE} mixed unit values)"
+
+_random = random.Random(0)
+transfers = [
+    _random.choice([CFX, GDrip, Drip])(_random.randrange(10**6))
+    for _ in range(SIZE)
+]
+
+
+def sum_with_add() -> None:
+    total = Drip(0)
+    for value in transfers:
+        total = total + value
+
+
+def sum_with_accumulator_add() -> None:
+    acc = TokenAccumulator(Drip)
+    for value in transfers:
+        acc.add(value)
+    acc.result(CFX)
+
+
+def sum_with_accumulator_add_many() -> None:
+    acc = TokenAccumulator(Drip)
+    acc.add_many(transfers)
+    acc.result(CFX)
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "total = total + value": measure(sum_with_add, number=3),
+        "TokenAccumulator.add": measure(sum_with_accumulator_add, number=3),
+        "TokenAccumulator.add_many": measure(sum_with_accumulator_add_many, number=3),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmarks of batch operations on :class:`~cfx_utils.token_array.TokenArray` against lists of token objects.
+
+Run with ``python -m benchmarks.bench_token_array``
+"""
+import functools
+import operator
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    Drip,
+)
+from cfx_utils.token_array import (
+    TokenArray,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 100_000
+TITLE = f"token_array ({SIZE} elements)"
+
+units = [Drip(i * 10**9) for i in range(SIZE)]
+array = TokenArray.from_units(units)
+threshold = Drip(SIZE // 2 * 10**9)
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "reduce(add, list)": measure(lambda: functools.reduce(operator.add, units), number=5),
+        "TokenArray.sum": measure(array.sum, number=5),
+        "[x > t for x in list]": measure(lambda: [x > threshold for x in units], number=5),
+        "TokenArray > t": measure(lambda: array > threshold, number=5),
+        "TokenArray.from_units": measure(lambda: TokenArray.from_units(units), number=5),
+        "TokenArray.to_units": measure(array.to_units, number=5),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
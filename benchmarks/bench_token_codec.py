@@ -0,0 +1,82 @@
+"""
+Benchmarks of encoding token values to bytes, compared with json decimal strings and pickle.
+
+Run with ``python -m benchmarks.bench_token_codec``
+"""
+import json
+import pickle
+import random
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    Drip,
+)
+from cfx_utils.token_array import (
+    TokenArray,
+)
+from cfx_utils.token_codec import (
+    decode_many,
+    encode_many,
+    encoded_size,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 100_000
+TITLE = f"token codec ({SIZE} balances)"
+# json and pickle are compared with, but their speed is not gated
+REFERENCE_CASES = (
+    "json.dumps([str(v.value) for v in values])",
+    "pickle.dumps(values)",
+    "[Drip(int(v)) for v in json.loads(data)]",
+    "pickle.loads(data)",
+)
+
+_random = random.Random(0)
+values = [Drip(_random.randrange(10**24)) for _ in range(SIZE)]
+array = TokenArray.from_units(values)
+uint256_buffer = bytearray(encoded_size(values))
+varint_buffer = bytearray(encoded_size(values, "varint"))
+encode_many(values, uint256_buffer)
+encode_many(values, varint_buffer, encoding="varint")
+json_data = json.dumps([str(value.value) for value in values])
+pickle_data = pickle.dumps(values)
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "json.dumps([str(v.value) for v in values])": measure(
+            lambda: json.dumps([str(value.value) for value in values]), number=1, repeat=3
+        ),
+        "pickle.dumps(values)": measure(lambda: pickle.dumps(values), number=1, repeat=3),
+        "encode_many(values, buffer)": measure(lambda: encode_many(values, uint256_buffer), number=1, repeat=3),
+        "encode_many(array, buffer)": measure(lambda: encode_many(array, uint256_buffer), number=1, repeat=3),
+        "encode_many(values, buffer, 'varint')": measure(
+            lambda: encode_many(values, varint_buffer, encoding="varint"), number=1, repeat=3
+        ),
+        "[Drip(int(v)) for v in json.loads(data)]": measure(
+            lambda: [Drip(int(value)) for value in json.loads(json_data)], number=1, repeat=3
+        ),
+        "pickle.loads(data)": measure(lambda: pickle.loads(pickle_data), number=1, repeat=3),
+        "decode_many(buffer, Drip)": measure(lambda: decode_many(uint256_buffer, Drip), number=1, repeat=3),
+        "decode_many(buffer, Drip, as_array=True)": measure(
+            lambda: decode_many(uint256_buffer, Drip, as_array=True), number=1, repeat=3
+        ),
+        "decode_many(buffer, Drip, 'varint')": measure(
+            lambda: decode_many(varint_buffer, Drip, encoding="varint"), number=1, repeat=3
+        ),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+    print(f"  json: {len(json_data)} bytes, pickle: {len(pickle_data)} bytes, "
+          f"uint256: {len(uint256_buffer)} bytes, varint: {len(varint_buffer)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmarks of the lookup overhead of :class:`~cfx_utils.token_context.TokenContext`.
+
+Run with ``python -m benchmarks.bench_token_context``
+"""
+import decimal
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+)
+from cfx_utils.token_context import (
+    get_token_context,
+    token_context,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+TITLE = "token_context"
+# the decimal module is compared with, but its speed is not gated
+REFERENCE_CASES = ("decimal.getcontext()", "Decimal / Decimal (global context)")
+
+cfx, drip = CFX(1), Drip(3)
+a, b = decimal.Decimal(10**18), decimal.Decimal(3)
+
+
+def enter_token_context() -> None:
+    with token_context(precision=40):
+        pass
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "decimal.getcontext()": measure(decimal.getcontext, number=100000),
+        "get_token_context()": measure(get_token_context, number=100000),
+        "Decimal / Decimal (global context)": measure(lambda: a / b, number=100000),
+        "get_token_context().divide": measure(
+            lambda: get_token_context().divide(a, b), number=100000
+        ),
+        "CFX / Drip": measure(lambda: cfx / drip, number=100000),
+        "with token_context(...)": measure(enter_token_context, number=10000),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
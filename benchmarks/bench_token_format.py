@@ -0,0 +1,58 @@
+"""
+Benchmarks of formatting token values as fixed-point strings,
+compared with formatting the Decimal value.
+
+Run with ``python -m benchmarks.bench_token_format``
+"""
+import random
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    format_many,
+)
+from cfx_utils.token_array import (
+    TokenArray,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 100_000
+TITLE = f"token format ({SIZE} values for columns)"
+# formatting the Decimal value is compared with, but its speed is not gated
+REFERENCE_CASES = ("f'{CFX.value:,.4f} CFX'", "[f'{v.to(CFX).value:,.4f} CFX' for v in values]")
+
+_random = random.Random(0)
+values = [Drip(_random.randrange(10**24)) for _ in range(SIZE)]
+array = TokenArray.from_units(values)
+amount = values[0]
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "str(CFX)": measure(lambda: str(amount.to(CFX))),
+        "f'{CFX.value:,.4f} CFX'": measure(lambda: f"{amount.to(CFX).value:,.4f} CFX"),
+        "Drip.format(CFX, decimals=4, grouping=True)": measure(lambda: amount.format(CFX, decimals=4, grouping=True)),
+        "[f'{v.to(CFX).value:,.4f} CFX' for v in values]": measure(
+            lambda: [f"{v.to(CFX).value:,.4f} CFX" for v in values], number=1, repeat=3
+        ),
+        "format_many(values, CFX, decimals=4, grouping=True)": measure(
+            lambda: format_many(values, CFX, decimals=4, grouping=True), number=1, repeat=3
+        ),
+        "TokenArray.format(CFX, decimals=4, grouping=True)": measure(
+            lambda: array.format(CFX, decimals=4, grouping=True), number=1, repeat=3
+        ),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmarks of parsing human readable amounts such as "1.5 CFX",
+compared with splitting the amount and initializing the token unit from a Decimal.
+
+Run with ``python -m benchmarks.bench_token_parser``
+"""
+import decimal
+import random
+from typing import (
+    Dict,
+    List,
+)
+
+from cfx_utils.token_unit import (
+    AbstractTokenUnit,
+    Drip,
+)
+from cfx_utils.token_parser import (
+    parse_amount,
+    parse_amounts,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 1_000_000
+TITLE = f"token parser ({SIZE} amounts)"
+# parsing with Decimal is compared with, but its speed is not gated
+REFERENCE_CASES = ("split + Decimal + CFX(...)",)
+
+_random = random.Random(0)
+amounts = [
+    f"{_random.randrange(10**6)}.{_random.randrange(10**4):04d} {_random.choice(['CFX', 'GDrip'])}"
+    for _ in range(SIZE)
+]
+
+
+def split_and_decimal() -> List[AbstractTokenUnit]:
+    units = Drip.get_derived_units_dict()
+    result = []
+    for amount in amounts:
+        value, unit_name = amount.split()
+        result.append(units[unit_name](decimal.Decimal(value)))
+    return result
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "parse_amount('1.5 CFX')": measure(lambda: parse_amount("1.5 CFX"), number=100000),
+        "split + Decimal + CFX(...)": measure(split_and_decimal, number=1, repeat=3),
+        "[parse_amount(a) for a in amounts]": measure(lambda: [parse_amount(a) for a in amounts], number=1, repeat=3),
+        "parse_amounts(amounts)": measure(lambda: parse_amounts(amounts), number=1, repeat=3),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
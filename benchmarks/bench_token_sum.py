@@ -0,0 +1,53 @@
+"""
+Benchmarks of summing token values with builtin :func:`sum`, :func:`functools.reduce`
+and :func:`~cfx_utils.token_accumulator.token_sum`.
+
+Run with ``python -m benchmarks.bench_token_sum``
+"""
+import functools
+import operator
+import random
+from typing import (
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    GDrip,
+)
+from cfx_utils.token_accumulator import (
+    token_sum,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 1_000_000
+TITLE = f"token_sum ({SIZE} values)"
+
+_random = random.Random(0)
+same_unit = [CFX.from_base_int_unchecked(_random.randrange(10**20)) for _ in range(SIZE)]
+mixed_units = [
+    (CFX if i % 2 else GDrip).from_base_int_unchecked(value._base_value)
+    for i, value in enumerate(same_unit)
+]
+
+
+def collect() -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for name, values in (("same unit", same_unit), ("mixed units", mixed_units)):
+        results[f"reduce(operator.add, ...) {name}"] = measure(
+            lambda: functools.reduce(operator.add, values), number=1, repeat=3
+        )
+        results[f"sum(...) {name}"] = measure(lambda: sum(values), number=1, repeat=3)
+        results[f"token_sum(...) {name}"] = measure(lambda: token_sum(values), number=1, repeat=3)
+    return results
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmarks of the token unit hot paths: construction, conversion, arithmetic and comparison.
+
+Run with ``python -m benchmarks.bench_token_unit``
+"""
+import decimal
+from typing import (
+    Callable,
+    Dict,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+    to_int_if_drip_units,
+)
+from cfx_utils.token_context import (
+    token_context,
+)
+from benchmarks._baseline import (
+    load_token_unit,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+TITLE = "token_unit"
+
+cfx_a, cfx_b = CFX(12), CFX(3)
+gdrip_a = GDrip(20)
+drip_a, drip_b = Drip(10**18), Drip(5 * 10**17)
+decimal_value = decimal.Decimal("1.5")
+
+CASES: Dict[str, Callable[[], object]] = {
+    # construction
+    "Drip(int)": lambda: Drip(123456789),
+    "Drip(hex str, 16)": lambda: Drip("0x3b9aca00", 16),
+    "Drip.from_base_int_unchecked(int)": lambda: Drip.from_base_int_unchecked(123456789),
+    "CFX(int)": lambda: CFX(12),
+    "CFX(str)": lambda: CFX("0.000000001"),
+    "CFX(Decimal)": lambda: CFX(decimal_value),
+    "CFX(float)": lambda: CFX(1.5),
+    "GDrip(20)": lambda: GDrip(20),
+    "GDrip.interned(20)": lambda: GDrip.interned(20),
+    # conversion
+    "CFX.to(Drip)": lambda: cfx_a.to(Drip),
+    "CFX.to(GDrip)": lambda: cfx_a.to(GDrip),
+    "CFX.to('GDrip')": lambda: cfx_a.to("GDrip"),
+    "CFX.to('gdrip')": lambda: cfx_a.to("gdrip"),
+    "Drip.to(CFX)": lambda: drip_a.to(CFX),
+    "GDrip.to(CFX)": lambda: gdrip_a.to(CFX),
+    "CFX.to_base_unit()": lambda: cfx_a.to_base_unit(),
+    "to_int_if_drip_units(CFX)": lambda: to_int_if_drip_units(cfx_a),
+    # arithmetic
+    "CFX + CFX": lambda: cfx_a + cfx_b,
+    "CFX - CFX": lambda: cfx_a - cfx_b,
+    "Drip + Drip": lambda: drip_a + drip_b,
+    "CFX + GDrip": lambda: cfx_a + gdrip_a,
+    "CFX - GDrip": lambda: cfx_a - gdrip_a,
+    "CFX * 3": lambda: cfx_a * 3,
+    "CFX * Decimal": lambda: cfx_a * decimal_value,
+    "CFX / 3": lambda: cfx_a / 3,
+    "CFX / CFX": lambda: cfx_a / cfx_b,
+    "CFX / Drip": lambda: cfx_a / drip_a,
+    # comparison and hash
+    "CFX < CFX": lambda: cfx_a < cfx_b,
+    "CFX < Drip": lambda: cfx_a < drip_a,
+    "CFX == Drip": lambda: cfx_a == drip_a,
+    "CFX > 0": lambda: cfx_a > 0,
+    "hash(CFX)": lambda: hash(cfx_a),
+    # presentation
+    "CFX.value": lambda: cfx_a.value,
+    "str(CFX)": lambda: str(cfx_a),
+}
+
+# the same operations on the previous Decimal based token units of the baseline commit, to reproduce the speedup,
+# which are skipped if the baseline is not available from git
+reference = load_token_unit()
+DECIMAL_REFERENCE_CASES: Dict[str, Callable[[], object]] = {}
+if reference is not None:
+    reference_cfx_a, reference_cfx_b = reference.CFX(12), reference.CFX(3)
+    reference_gdrip_a = reference.GDrip(20)
+    reference_drip_a = reference.Drip(10**18)
+    DECIMAL_REFERENCE_CASES = {
+        "Drip(int)": lambda: reference.Drip(123456789),
+        "CFX(int)": lambda: reference.CFX(12),
+        "CFX(str)": lambda: reference.CFX("0.000000001"),
+        "CFX.to(Drip)": lambda: reference_cfx_a.to(reference.Drip),
+        "Drip.to(CFX)": lambda: reference_drip_a.to(reference.CFX),
+        "CFX + CFX": lambda: reference_cfx_a + reference_cfx_b,
+        "CFX + GDrip": lambda: reference_cfx_a + reference_gdrip_a,
+        "CFX * 3": lambda: reference_cfx_a * 3,
+        "CFX < CFX": lambda: reference_cfx_a < reference_cfx_b,
+        "CFX == Drip": lambda: reference_cfx_a == reference_drip_a,
+        "CFX / Drip": lambda: reference_cfx_a / reference_drip_a,
+    }
+# the previous implementation is compared with, but its speed is not gated
+REFERENCE_CASES = tuple(f"Decimal reference: {name}" for name in DECIMAL_REFERENCE_CASES)
+
+hex_page = [hex(i * 10**15) for i in range(1000)]
+
+BATCH_CASES: Dict[str, Callable[[], object]] = {
+    "[Drip(x, 16) for x in page]": lambda: [Drip(x, 16) for x in hex_page],
+    "Drip.from_hex_many(page)": lambda: Drip.from_hex_many(hex_page),
+}
+
+
+def collect() -> Dict[str, float]:
+    # float construction is measured without emitting warnings
+    with token_context(float_warning="ignore"):
+        results = {name: measure(func) for name, func in CASES.items()}
+        results.update(
+            (f"Decimal reference: {name}", measure(func)) for name, func in DECIMAL_REFERENCE_CASES.items()
+        )
+    results.update(
+        (f"{name} ({len(hex_page)} values)", measure(func, number=20))
+        for name, func in BATCH_CASES.items()
+    )
+    return results
+
+
+def main() -> None:
+    results = collect()
+    report(TITLE, results)
+    for name in DECIMAL_REFERENCE_CASES:
+        print(f"  speedup over Decimal of {name}: {results[f'Decimal reference: {name}'] / results[name]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmarks of normalizing batches of transaction dicts,
+compared with converting the token value fields one by one with `to_int_if_drip_units`.
+
+Run with ``python -m benchmarks.bench_tx_normalizer``
+"""
+import random
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from cfx_utils.token_unit import (
+    CFX,
+    GDrip,
+    to_int_if_drip_units,
+)
+from cfx_utils.tx_normalizer import (
+    normalize_txs,
+)
+from benchmarks._utils import (
+    measure,
+    report,
+)
+
+SIZE = 100_000
+TITLE = f"tx normalizer ({SIZE} transactions)"
+
+_random = random.Random(0)
+txs: List[Dict[str, Any]] = [
+    {
+        "from": "cfxtest:aak2rra2njvd77ezwjvx04kkds9fzagfe6d5r8e957",
+        "to": "cfxtest:aak2rra2njvd77ezwjvx04kkds9fzagfe6d5r8e957",
+        "value": CFX(_random.randrange(100)),
+        "maxFeePerGas": GDrip(_random.randrange(1, 100)),
+        "maxPriorityFeePerGas": GDrip(1),
+        "gas": 21000,
+        "nonce": i,
+        "chainId": 1,
+        "epochHeight": 100,
+        "storageLimit": 0,
+        "data": b"\x00" * 4,
+    }
+    for i in range(SIZE)
+]
+
+
+def field_by_field() -> List[Dict[str, Any]]:
+    results = []
+    for tx in txs:
+        tx = dict(tx)
+        for field in ("value", "gasPrice", "maxFeePerGas", "maxPriorityFeePerGas"):
+            if field in tx:
+                tx[field] = to_int_if_drip_units(tx[field])
+        tx["data"] = "0x" + tx["data"].hex()
+        results.append(tx)
+    return results
+
+
+def collect() -> Dict[str, float]:
+    return {
+        "field by field to_int_if_drip_units (no checks)": measure(field_by_field, number=1, repeat=3),
+        "normalize_txs(txs)": measure(lambda: normalize_txs(txs), number=1, repeat=3),
+        "normalize_txs(txs, data_format='bytes')": measure(
+            lambda: normalize_txs(txs, data_format="bytes"), number=1, repeat=3
+        ),
+    }
+
+
+def main() -> None:
+    report(TITLE, collect())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,62 @@
-from cfx_utils.token_unit import (
-    CFX,
-    GDrip,
-    Drip
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
 )
 
+if TYPE_CHECKING:
+    from cfx_utils.token_unit import (
+        CFX,
+        GDrip,
+        Drip
+    )
+
+# public names -> the module defining them, which is imported on first access (PEP 562)
+# so that `import cfx_utils` stays cheap for short-lived processes
+_LAZY_EXPORTS = {
+    "CFX": "cfx_utils.token_unit",
+    "GDrip": "cfx_utils.token_unit",
+    "Drip": "cfx_utils.token_unit",
+}
+
+# submodules which used to be loaded by `import cfx_utils`,
+# so `cfx_utils.token_unit` and the like keep working without importing them explicitly
+_LAZY_SUBMODULES = frozenset([
+    "address",
+    "base32_address",
+    "decorators",
+    "epoch",
+    "exceptions",
+    "post_import_hook",
+    "token_accumulator",
+    "token_array",
+    "token_codec",
+    "token_context",
+    "token_instrumentation",
+    "token_parser",
+    "token_unit",
+    "tx_normalizer",
+    "types",
+])
+
 __all__ = [
     "CFX",
     "GDrip",
     "Drip",
 ]
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        if name in _LAZY_SUBMODULES:
+            # importing a submodule also binds it as an attribute of the package
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # cached so later lookups do not reach __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,213 @@
+import functools
+import re
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
+
+from typing_extensions import (
+    Literal,
+)
+
+from cfx_utils.exceptions import (
+    AddressNotMatch,
+    InvalidConfluxHexAddress,
+    InvalidHexAddress,
+)
+
+if TYPE_CHECKING:
+    from eth_typing.evm import (
+        ChecksumAddress,
+    )
+
+HexAddressType = Literal["user", "contract", "builtin"]
+"""
+The type of a Conflux hex address, decided by its first hex digit: "0x1" user, "0x8" contract and "0x0" builtin
+"""
+
+CHECKSUM_CACHE_SIZE = 4096
+"""
+The maximum number of checksums kept by the LRU cache of :func:`to_checksum_hex_address`
+"""
+
+_HEX_ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
+_CONFLUX_HEX_ADDRESS_TYPES = {"0": "builtin", "1": "user", "8": "contract"}
+
+
+@functools.lru_cache(maxsize=CHECKSUM_CACHE_SIZE)
+def _checksum_body(lower_body: str) -> str:
+    """
+    Return the EIP-55 checksum form of the 40 lower-cased hex digits of an address
+    """
+    # eth_utils takes long to import, so it is only imported when a checksum is computed
+    from eth_utils.crypto import keccak
+    address_hash = keccak(text=lower_body).hex()
+    return "".join(
+        char.upper() if char > "9" and address_hash[i] >= "8" else char
+        for i, char in enumerate(lower_body)
+    )
+
+
+def checksum_cache_info() -> Any:
+    """
+    :return: the statistics of the checksum LRU cache, see :func:`functools.lru_cache`
+    """
+    return _checksum_body.cache_info()
+
+
+def checksum_cache_clear() -> None:
+    _checksum_body.cache_clear()
+
+
+def to_checksum_hex_address(value: str) -> "ChecksumAddress":
+    """
+    Return the EIP-55 checksum form of a hex address. Results are kept in a bounded LRU cache.
+
+    :raises InvalidHexAddress: the value is not a valid hex address
+
+    >>> from cfx_utils.address import to_checksum_hex_address
+    >>> to_checksum_hex_address("0x1ecde7223747601823f7535d7968ba98b4881e09")
+    '0x1ECdE7223747601823f7535d7968Ba98b4881E09'
+    """
+    validate_hex_address(value)
+    return cast("ChecksumAddress", "0x" + _checksum_body(value[2:].lower()))
+
+
+def _hex_address_error(value: Any) -> Optional[InvalidHexAddress]:
+    """
+    Return the error of an invalid hex address, or :const:`None` if the value is valid
+    """
+    if not isinstance(value, str) or _HEX_ADDRESS_PATTERN.fullmatch(value) is None:
+        return InvalidHexAddress(f"Expected a hex40 address. Receives {value!r}")
+    body = value[2:]
+    lower_body = body.lower()
+    # all lower-cased or all upper-cased addresses are not checksummed
+    if body == lower_body or body == body.upper():
+        return None
+    if _checksum_body(lower_body) != body:
+        return InvalidHexAddress(f"Checksum of hex address {value} is invalid")
+    return None
+
+
+def _conflux_hex_address_error(
+    value: Any, address_type: Optional[HexAddressType] = None
+) -> Optional[InvalidHexAddress]:
+    error = _hex_address_error(value)
+    if error is not None:
+        return error
+    actual_type = _CONFLUX_HEX_ADDRESS_TYPES.get(value[2])
+    if actual_type is None:
+        return InvalidConfluxHexAddress(f"Conflux hex address is expected to start with 0x0, 0x1 or 0x8. Receives {value}")
+    if address_type is not None and actual_type != address_type:
+        return AddressNotMatch(f"A {address_type} address is expected, but {value} is a {actual_type} address")  # type: ignore
+    return None
+
+
+def is_hex_address(value: Any) -> bool:
+    """
+    Whether the value is a hex address with valid checksum, or all lower-cased or upper-cased
+    """
+    return _hex_address_error(value) is None
+
+
+def validate_hex_address(value: Any) -> Literal[True]:
+    """
+    Check if the value is a hex address. A mixed-case address should have valid EIP-55 checksum.
+
+    :raises InvalidHexAddress: the value is not a valid hex address
+    :return Literal[True]: returns True if valid
+
+    >>> from cfx_utils.address import validate_hex_address
+    >>> validate_hex_address("0x1ecde7223747601823f7535d7968ba98b4881e09")
+    True
+    """
+    error = _hex_address_error(value)
+    if error is not None:
+        raise error
+    return True
+
+
+def validate_conflux_hex_address(value: Any, address_type: Optional[HexAddressType] = None) -> Literal[True]:
+    """
+    Check if the value is a hex address used in Conflux, which starts with 0x0, 0x1 or 0x8.
+
+    :param Optional[HexAddressType] address_type: the expected address type, "user", "contract" or "builtin"
+    :raises InvalidHexAddress: the value is not a valid hex address
+    :raises InvalidConfluxHexAddress: the address doesn't start with 0x0, 0x1 or 0x8
+    :raises AddressNotMatch: the address is not of `address_type`
+    :return Literal[True]: returns True if valid
+
+    >>> from cfx_utils.address import validate_conflux_hex_address
+    >>> validate_conflux_hex_address("0x1ecde7223747601823f7535d7968ba98b4881e09", "user")
+    True
+    """
+    error = _conflux_hex_address_error(value, address_type)
+    if error is not None:
+        raise error
+    return True
+
+
+@overload
+def validate_hex_addresses(
+    values: Iterable[Any],
+    conflux: bool = False,
+    address_type: Optional[HexAddressType] = None,
+    return_errors: Literal[False] = False,
+) -> int:
+    ...
+
+
+@overload
+def validate_hex_addresses(
+    values: Iterable[Any],
+    conflux: bool = False,
+    address_type: Optional[HexAddressType] = None,
+    return_errors: Literal[True] = ...,
+) -> List[Tuple[int, ValueError]]:
+    ...
+
+
+def validate_hex_addresses(
+    values: Iterable[Any],
+    conflux: bool = False,
+    address_type: Optional[HexAddressType] = None,
+    return_errors: bool = False,
+) -> Union[int, List[Tuple[int, ValueError]]]:
+    """
+    Validate hex addresses in batch without raising for invalid ones.
+
+    :param Iterable[Any] values: the addresses to validate
+    :param bool conflux: whether the addresses should be Conflux hex addresses, see :func:`validate_conflux_hex_address`
+    :param Optional[HexAddressType] address_type: the expected Conflux address type, implies `conflux`
+    :param bool return_errors: return the errors of invalid addresses instead of a bitmask
+    :return: a bitmask whose i-th bit is 1 if the i-th address is valid,
+        or a list of `(index, error)` of the invalid addresses if `return_errors` is True
+
+    >>> from cfx_utils.address import validate_hex_addresses
+    >>> bin(validate_hex_addresses(["0x1ecde7223747601823f7535d7968ba98b4881e09", "0x123", "0x8ecde7223747601823f7535d7968ba98b4881e09"]))
+    '0b101'
+    """
+    if conflux or address_type is not None:
+        get_error = functools.partial(_conflux_hex_address_error, address_type=address_type)
+    else:
+        get_error = _hex_address_error
+    values = list(values)
+    # addresses repeat a lot in batches, e.g. recipients of transfers, so each distinct value is validated once
+    try:
+        errors = {value: get_error(value) for value in dict.fromkeys(values)}
+        found_errors: Iterable[Optional[ValueError]] = [errors[value] for value in values]
+    except TypeError:
+        # unhashable values
+        found_errors = list(map(get_error, values))
+    if return_errors:
+        return [(index, error) for index, error in enumerate(found_errors) if error is not None]
+    # build the bitmask from a binary string, which is linear to the number of addresses
+    bits = "".join(["0" if error else "1" for error in found_errors])
+    return int(bits[::-1], 2) if bits else 0
@@ -0,0 +1,405 @@
+import functools
+import operator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from typing_extensions import (
+    Literal,
+)
+
+from cfx_utils.address import (
+    _checksum_body,
+    validate_hex_address,
+)
+from cfx_utils.exceptions import (
+    Base32AddressNotMatch,
+    InvalidBase32Address,
+    InvalidConfluxHexAddress,
+    InvalidNetworkId,
+)
+
+if TYPE_CHECKING:
+    from eth_typing.evm import (
+        ChecksumAddress,
+    )
+
+AddressType = Literal["null", "builtin", "user", "contract", "invalid"]
+"""
+The CIP-37 address type, decided by the first hex digit of the address
+"""
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+ADDRESS_SIZE = 20
+MAINNET_NETWORK_ID = 1029
+TESTNET_NETWORK_ID = 1
+CHARSET = "abcdefghjkmnprstuvwxyz0123456789"
+"""
+The CIP-37 base32 alphabet, where the i-th character stands for the 5-bit word i
+"""
+
+# a base32 address is "<network prefix>[:<options>]:<payload><checksum>",
+# where the payload is a version byte 0 followed by the 20 address bytes, and 2 zero bits of padding
+_PAYLOAD_LENGTH = 34
+_CHECKSUM_LENGTH = 8
+_ENCODED_LENGTH = _PAYLOAD_LENGTH + _CHECKSUM_LENGTH
+_CHECKSUM_MASK = (1 << 40) - 1
+
+# the generators of the BCH code, the polymod step xors the generators chosen by the 5 bits shifted out
+_GENERATORS = (0x98f2bc8e61, 0x79b76d99e2, 0xf33e5fb3c4, 0xae2eabe2a8, 0x1e4f43e470)
+_POLYMOD_TABLE = tuple(
+    functools.reduce(operator.xor, (g for i, g in enumerate(_GENERATORS) if top >> i & 1), 0)
+    for top in range(32)
+)
+
+# CIP-37 characters are translated to the digits of int(..., 32), and all other bytes to b"!" which int() rejects
+_DECODE_TABLE = bytes.maketrans(
+    CHARSET.encode() + bytes(c for c in range(256) if chr(c) not in CHARSET),
+    b"0123456789abcdefghijklmnopqrstuv" + b"!" * (256 - len(CHARSET)),
+)
+_ENCODE_TABLE = bytes.maketrans(bytes(range(len(CHARSET))), CHARSET.encode())
+# the 5-bit words packed in an integer are spread to one word per byte in 6 steps rather than 42 shifts,
+# the i-th word moves 3 * i bits, so step b moves the words whose index has bit b set by 3 << b bits
+_SPREAD_STEPS = tuple(
+    (
+        functools.reduce(
+            operator.or_,
+            (31 << (5 * i + 3 * (i & -(2 << b))) for i in range(_ENCODED_LENGTH) if i >> b & 1),
+        ),
+        3 << b,
+    )
+    for b in range(5, -1, -1)
+)
+
+_ADDRESS_TYPES = {0x0: "builtin", 0x1: "user", 0x8: "contract"}
+_KNOWN_TYPE_OPTIONS = frozenset(f"type.{t}" for t in ("null", "builtin", "user", "contract", "invalid"))
+
+
+def _polymod(words: Iterable[int], c: int = 1) -> int:
+    for d in words:
+        c = ((c & 0x07ffffffff) << 5) ^ d ^ _POLYMOD_TABLE[c >> 35]
+    return c
+
+
+def _payload_contribution(address_int: int) -> int:
+    # the 34 payload words followed by 8 zero words of checksum template, from a zero polymod state
+    payload = address_int << 2
+    return _polymod(
+        [(payload >> (5 * i)) & 31 for i in range(_PAYLOAD_LENGTH - 1, -1, -1)] + [0] * _CHECKSUM_LENGTH, 0
+    )
+
+
+# the polymod is linear, so the checksum is the xor of the contribution of the prefix
+# and the contributions of each address byte, which are precomputed for every position and byte value
+_BYTE_TABLES = []
+for _position in range(ADDRESS_SIZE):
+    _bits = [_payload_contribution(1 << (8 * (ADDRESS_SIZE - 1 - _position) + bit)) for bit in range(8)]
+    _BYTE_TABLES.append([
+        functools.reduce(operator.xor, (_bits[bit] for bit in range(8) if value >> bit & 1), 0)
+        for value in range(256)
+    ])
+del _position, _bits
+
+
+def _address_contribution(address: Buffer) -> int:
+    return functools.reduce(operator.xor, map(list.__getitem__, _BYTE_TABLES, address), 0)
+
+
+@functools.lru_cache(maxsize=256)
+def _prefix_checksum(prefix: str) -> int:
+    """
+    The checksum of the network prefix with an all-zero payload
+    """
+    words = [c & 0x1f for c in prefix.encode("ascii")]
+    return _polymod(words + [0] * (1 + _ENCODED_LENGTH)) ^ 1
+
+
+@functools.lru_cache(maxsize=256)
+def _network_prefix(network_id: int) -> str:
+    if network_id == MAINNET_NETWORK_ID:
+        return "cfx"
+    if network_id == TESTNET_NETWORK_ID:
+        return "cfxtest"
+    return f"net{network_id}"
+
+
+@functools.lru_cache(maxsize=256)
+def _prefix_network_id(prefix: str) -> Optional[int]:
+    if prefix == "cfx":
+        return MAINNET_NETWORK_ID
+    if prefix == "cfxtest":
+        return TESTNET_NETWORK_ID
+    digits = prefix[3:]
+    # CIP-37: the network id is positive without leading zeros, e.g. not "net0" or "net010",
+    # and the network ids of mainnet and testnet only use their named prefixes
+    if prefix.startswith("net") and digits.isdigit() and digits.isascii() and digits[0] != "0":
+        network_id = int(digits)
+        if network_id not in (MAINNET_NETWORK_ID, TESTNET_NETWORK_ID):
+            return network_id
+    return None
+
+
+def _validate_network_id(network_id: Any) -> None:
+    if not isinstance(network_id, int) or isinstance(network_id, bool) or network_id <= 0:
+        raise InvalidNetworkId(
+            f"Expected network_id to be a positive integer. Receives {network_id} of type {type(network_id)}"
+        )
+
+
+def _address_type(address: Buffer) -> AddressType:
+    address_type = _ADDRESS_TYPES.get(address[0] >> 4)
+    if address_type is None:
+        return "invalid"
+    if address_type == "builtin" and not any(address):
+        return "null"
+    return address_type  # type: ignore
+
+
+def _encode(address: Buffer, prefix: str, prefix_checksum: int) -> str:
+    address_int = int.from_bytes(address, "big")
+    encoded = ((address_int << 2) << 40) | (prefix_checksum ^ _address_contribution(address))
+    for mask, shift in _SPREAD_STEPS:
+        moved = encoded & mask
+        encoded = encoded ^ moved | moved << shift
+    return prefix + ":" + encoded.to_bytes(_ENCODED_LENGTH, "big").translate(_ENCODE_TABLE).decode()
+
+
+def _decode(base32_address: Any) -> Tuple[int, int, Optional[str]]:
+    """
+    Decode a base32 address to its network id, address integer and the option field
+
+    :raises InvalidBase32Address: the value is not a valid base32 address
+    """
+    if not isinstance(base32_address, str):
+        raise InvalidBase32Address(f"Receives an argument of type {type(base32_address)}, expected a string")
+    lower = base32_address.lower()
+    if base32_address != lower and base32_address != base32_address.upper():
+        raise InvalidBase32Address(
+            f"Base32 address is supposed to be composed of all uppercase or lower case, Receives {base32_address}"
+        )
+    prefix, _, rest = lower.partition(":")
+    option, _, encoded = rest.rpartition(":")
+    network_id = _prefix_network_id(prefix)
+    if network_id is None or not rest:
+        raise InvalidBase32Address(
+            "Address needs to be encode in Base32 format, such as cfx:aaejuaaaaaaaaaaaaaaaaaaaaaaaaaaaajrwuc9jnb. "
+            f"Received: {base32_address}"
+        )
+    if len(encoded) != _ENCODED_LENGTH or ":" in option:
+        raise InvalidBase32Address(f"Invalid Base32 address length or format: {base32_address}")
+    try:
+        value = int(encoded.encode("ascii").translate(_DECODE_TABLE), 32)
+    except (UnicodeEncodeError, ValueError):
+        raise InvalidBase32Address(f"Invalid character in Base32 address {base32_address}")
+    payload = value >> 40
+    # the padding bits and the version byte should be 0
+    if payload & 3 or payload >> 162:
+        raise InvalidBase32Address(f"Invalid Base32 address payload: {base32_address}")
+    address_int = payload >> 2
+    checksum = _prefix_checksum(prefix) ^ _address_contribution(address_int.to_bytes(ADDRESS_SIZE, "big"))
+    if checksum != value & _CHECKSUM_MASK:
+        raise InvalidBase32Address("Invalid Base32 address: checksum verification failed")
+    return network_id, address_int, option or None
+
+
+def _check_option(option: Optional[str], address_type: AddressType) -> None:
+    # CIP-37: a known type option should match the address type, and unknown options are ignored
+    if option is not None and option != f"type.{address_type}" and option in _KNOWN_TYPE_OPTIONS:
+        raise InvalidBase32Address(
+            "Invalid address type field: the address type field does not match expected, "
+            f"expected type.{address_type} but receives {option}, which is a known address type"
+        )
+
+
+class Base32AddressParts(NamedTuple):
+    network_id: int
+    hex_address: "ChecksumAddress"
+    address_type: AddressType
+
+
+def encode_base32_address(
+    address: Union[str, Buffer], network_id: int, verbose: bool = False, ignore_invalid_type: bool = False
+) -> str:
+    """
+    Encode a hex address, or the 20 bytes of an address, to a CIP-37 base32 address.
+
+    :param Union[str,Buffer] address: a hex address, or the 20 address bytes
+    :param int network_id: the network id, e.g. 1 for testnet and 1029 for mainnet
+    :param bool verbose: whether to encode in the verbose form with address type, which is upper-cased
+    :param bool ignore_invalid_type: whether to allow addresses not starting with 0x0, 0x1 or 0x8
+    :raises InvalidHexAddress: `address` is not a valid hex address
+    :raises InvalidNetworkId: `network_id` is not a positive integer
+    :raises InvalidConfluxHexAddress: the address type is invalid and `ignore_invalid_type` is False
+
+    >>> from cfx_utils.base32_address import encode_base32_address
+    >>> encode_base32_address("0x1ecde7223747601823f7535d7968ba98b4881e09", 1)
+    'cfxtest:aatp533cg7d0agbd87kz48nj1mpnkca8be1rz695j4'
+    >>> encode_base32_address("0x1ecde7223747601823f7535d7968ba98b4881e09", 1029, verbose=True)
+    'CFX:TYPE.USER:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE7GGP3VPU'
+    """
+    if isinstance(address, str):
+        validate_hex_address(address)
+        address_bytes: Buffer = bytes.fromhex(address[2:])
+    else:
+        address_bytes = address
+        if len(address_bytes) != ADDRESS_SIZE:
+            raise InvalidBase32Address(f"Expected {ADDRESS_SIZE} address bytes, receives {len(address_bytes)}")
+    _validate_network_id(network_id)
+    prefix = _network_prefix(network_id)
+    address_type = _address_type(address_bytes)
+    if address_type == "invalid" and not ignore_invalid_type:
+        raise InvalidConfluxHexAddress(
+            f"The hex address should start with 0x0, 0x1 or 0x8, received 0x{bytes(address_bytes).hex()}"
+        )
+    encoded = _encode(address_bytes, prefix, _prefix_checksum(prefix))
+    if verbose:
+        prefix, _, payload = encoded.partition(":")
+        return f"{prefix}:type.{address_type}:{payload}".upper()
+    return encoded
+
+
+def decode_base32_address(base32_address: str) -> Base32AddressParts:
+    """
+    Decode a CIP-37 base32 address to its network id, checksum hex address and address type
+
+    :raises InvalidBase32Address: the value is not a valid base32 address
+
+    >>> from cfx_utils.base32_address import decode_base32_address
+    >>> decode_base32_address("cfxtest:aatp533cg7d0agbd87kz48nj1mpnkca8be1rz695j4")
+    Base32AddressParts(network_id=1, hex_address='0x1ECdE7223747601823f7535d7968Ba98b4881E09', address_type='user')
+    """
+    network_id, address_int, option = _decode(base32_address)
+    address_bytes = address_int.to_bytes(ADDRESS_SIZE, "big")
+    address_type = _address_type(address_bytes)
+    _check_option(option, address_type)
+    return Base32AddressParts(
+        network_id, cast("ChecksumAddress", "0x" + _checksum_body(address_bytes.hex())), address_type
+    )
+
+
+def is_valid_base32_address(value: Any) -> bool:
+    try:
+        decode_base32_address(value)
+        return True
+    except InvalidBase32Address:
+        return False
+
+
+def encode_many(
+    data: Buffer,
+    network_id: int,
+    offset: int = 0,
+    count: Optional[int] = None,
+    verbose: bool = False,
+    ignore_invalid_type: bool = False,
+) -> List[str]:
+    """
+    Encode addresses stored contiguously as 20 bytes each in a buffer to base32 addresses.
+    The network prefix and its checksum are computed once for all addresses.
+
+    :param Buffer data: the address bytes
+    :param int network_id: the network id of the encoded addresses
+    :param int offset: the position in `data` to start reading at
+    :param Optional[int] count: the number of addresses to encode, defaults to all addresses till the end of `data`
+    :raises InvalidNetworkId: `network_id` is not a positive integer
+    :raises InvalidBase32Address: the data is truncated, or `offset` or `count` is negative
+    :raises InvalidConfluxHexAddress: any of the address types is invalid and `ignore_invalid_type` is False
+
+    >>> from cfx_utils.base32_address import encode_many
+    >>> encode_many(bytes.fromhex("1ecde7223747601823f7535d7968ba98b4881e09") * 2, 1029)
+    ['cfx:aatp533cg7d0agbd87kz48nj1mpnkca8be7ggp3vpu', 'cfx:aatp533cg7d0agbd87kz48nj1mpnkca8be7ggp3vpu']
+    """
+    _validate_network_id(network_id)
+    if offset < 0:
+        raise InvalidBase32Address(f"The offset {offset} is negative")
+    if count is not None and count < 0:
+        raise InvalidBase32Address(f"The count {count} is negative")
+    view = memoryview(data).cast("B")
+    if count is None:
+        remaining = len(view) - offset
+        if remaining % ADDRESS_SIZE:
+            raise InvalidBase32Address(f"The data length {remaining} is not a multiple of {ADDRESS_SIZE}")
+        count = remaining // ADDRESS_SIZE
+    end = offset + count * ADDRESS_SIZE
+    if end > len(view):
+        raise InvalidBase32Address(f"Truncated data, {end} bytes are expected but {len(view)} received")
+    prefix = _network_prefix(network_id)
+    prefix_checksum = _prefix_checksum(prefix)
+    data_bytes = view[offset:end].tobytes()
+    results: List[str] = []
+    append = results.append
+    for position in range(0, len(data_bytes), ADDRESS_SIZE):
+        address = data_bytes[position:position + ADDRESS_SIZE]
+        if not ignore_invalid_type and (address[0] >> 4) not in _ADDRESS_TYPES:
+            raise InvalidConfluxHexAddress(
+                f"The hex address at index {position // ADDRESS_SIZE} should start with 0x0, 0x1 or 0x8, "
+                f"received 0x{address.hex()}"
+            )
+        if verbose:
+            append(encode_base32_address(address, network_id, True, ignore_invalid_type))
+        else:
+            append(_encode(address, prefix, prefix_checksum))
+    return results
+
+
+def decode_many(
+    base32_addresses: Iterable[str],
+    out: Union[bytearray, memoryview],
+    offset: int = 0,
+    network_id: Optional[int] = None,
+) -> int:
+    """
+    Decode base32 addresses into a caller-provided buffer, 20 bytes for each address.
+
+    :param Iterable[str] base32_addresses: the base32 addresses
+    :param Union[bytearray,memoryview] out: a writable buffer
+    :param int offset: the position in `out` to start writing at
+    :param Optional[int] network_id: the expected network id of the addresses, not checked if None
+    :return int: the number of bytes written
+    :raises InvalidBase32Address: any of the addresses is invalid, the error message contains its index
+    :raises Base32AddressNotMatch: any of the addresses is not of `network_id`
+    :raises ValueError: `offset` is negative or `out` is too small to hold the decoded addresses
+
+    >>> from cfx_utils.base32_address import decode_many
+    >>> out = bytearray(20)
+    >>> decode_many(["cfx:aatp533cg7d0agbd87kz48nj1mpnkca8be7ggp3vpu"], out)
+    20
+    >>> out.hex()
+    '1ecde7223747601823f7535d7968ba98b4881e09'
+    """
+    if offset < 0:
+        raise ValueError(f"The offset {offset} is negative")
+    base32_addresses = base32_addresses if isinstance(base32_addresses, Sequence) else list(base32_addresses)
+    view = memoryview(out).cast("B")
+    # the size is known, so nothing is written if the buffer is too small
+    end = offset + ADDRESS_SIZE * len(base32_addresses)
+    if end > len(view):
+        raise ValueError(f"The buffer is too small, at least {end} bytes are required")
+    position = offset
+    for index, base32_address in enumerate(base32_addresses):
+        try:
+            address_network_id, address_int, option = _decode(base32_address)
+            address_bytes = address_int.to_bytes(ADDRESS_SIZE, "big")
+            if option is not None:
+                _check_option(option, _address_type(address_bytes))
+        except InvalidBase32Address as e:
+            raise InvalidBase32Address(f"Invalid base32 address at index {index}: {e}") from e
+        if network_id is not None and address_network_id != network_id:
+            raise Base32AddressNotMatch(
+                f"Expected address of network {network_id}, but the address at index {index} "
+                f"{base32_address} is of network {address_network_id}"
+            )
+        end = position + ADDRESS_SIZE
+        view[position:end] = address_bytes
+        position = end
+    return position - offset
@@ -10,25 +10,25 @@ from typing_extensions import (
     Concatenate
 )
 import functools
+import types
 
 R = TypeVar("R") # return value
 P = ParamSpec("P")
 
 class combomethod(Generic[P, R], object):
+    """
+    A method which binds to the instance if accessed from an instance, or to the class if accessed from the class.
+    Binding returns a plain bound method, so no wrapper function is created when the attribute is visited.
+    """
     def __init__(self, method: Callable[Concatenate[Any, P], R]) -> None:
         self.method = method
+        functools.update_wrapper(self, method) # type: ignore
 
     def __get__(
         self, obj: object = None, objtype: Union[type, None] = None
     ) -> Callable[P, R]:
-        @functools.wraps(self.method)
-        def _wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            if obj is not None:
-                # classmethod
-                return self.method(obj, *args, **kwargs)
-            else:
-                # not a classmethod
-                return self.method(objtype, *args, **kwargs)
-
-        return _wrapper
-
+        if obj is not None:
+            # not a classmethod
+            return types.MethodType(self.method, obj)
+        # classmethod
+        return types.MethodType(self.method, objtype)
@@ -0,0 +1,240 @@
+from typing import (
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from typing_extensions import (
+    get_args,
+)
+
+from cfx_utils.exceptions import (
+    InvalidEpochNumebrParam,
+)
+from cfx_utils.types import (
+    EpochLiteral,
+    EpochNumberParam,
+)
+
+# literal -> literal, so that a valid literal is found and returned by one dict lookup
+_EPOCH_LITERALS: Dict[str, str] = {literal: literal for literal in get_args(EpochLiteral)}
+
+
+def _epoch_int(param: Union[EpochNumberParam, str]) -> int:
+    """
+    Return the epoch number of a non-literal epoch param
+
+    :raises InvalidEpochNumebrParam: the param is not a non-negative integer or a hex string of it
+    """
+    if type(param) is int:
+        epoch = param
+    elif isinstance(param, str) and param[:2] in ("0x", "0X"):
+        digits = param[2:]
+        # int(..., 16) also accepts underscores, surrounding whitespace and a sign
+        if not (digits.isascii() and digits.isalnum()):
+            raise InvalidEpochNumebrParam(f"{param!r} is not a valid hex epoch number")
+        try:
+            epoch = int(digits, 16)
+        except ValueError:
+            raise InvalidEpochNumebrParam(f"{param!r} is not a valid hex epoch number")
+    elif isinstance(param, int) and not isinstance(param, bool):
+        epoch = int(param)
+    else:
+        raise InvalidEpochNumebrParam(
+            f"{param!r} is not a valid epoch number param, which is expected to be a non-negative integer "
+            f"or one of {list(_EPOCH_LITERALS)}"
+        )
+    if epoch < 0:
+        raise InvalidEpochNumebrParam(f"Epoch number should be non-negative, received {param}")
+    return epoch
+
+
+def normalize_epoch(param: Union[EpochNumberParam, str]) -> str:
+    """
+    Validate an epoch number param and encode it as a JSON-RPC param
+
+    :param param: an epoch literal such as "latest_state", a non-negative integer, or a hex string of it
+    :return str: the literal, or the epoch number as a hex string without leading zeros
+    :raises InvalidEpochNumebrParam: the param is not a valid epoch number param
+
+    >>> from cfx_utils.epoch import normalize_epoch
+    >>> normalize_epoch(100)
+    '0x64'
+    >>> normalize_epoch("latest_state")
+    'latest_state'
+    >>> normalize_epoch("0x0064")
+    '0x64'
+    """
+    literal = _EPOCH_LITERALS.get(param) if isinstance(param, str) else None
+    if literal is not None:
+        return literal
+    return hex(_epoch_int(param))
+
+
+class EpochWindow(NamedTuple):
+    """
+    An inclusive epoch range to query
+    """
+    from_epoch: int
+    to_epoch: int
+
+    @property
+    def size(self) -> int:
+        return self.to_epoch - self.from_epoch + 1
+
+    def to_filter_params(self) -> Dict[str, str]:
+        """
+        :return: the `fromEpoch` and `toEpoch` fields of a `cfx_getLogs` filter
+
+        >>> EpochWindow(16, 31).to_filter_params()
+        {'fromEpoch': '0x10', 'toEpoch': '0x1f'}
+        """
+        return {"fromEpoch": hex(self.from_epoch), "toEpoch": hex(self.to_epoch)}
+
+
+class EpochRangePlanner:
+    """
+    Split a large epoch range into bounded windows for queries such as `cfx_getLogs`.
+    The window size adapts to the result count of each window: it is halved when a window returns
+    more than `target_results` results and doubled when a window returns less than half of it.
+    All epochs before :attr:`checkpoint` have been queried, so a stopped query can resume from it.
+
+    >>> from cfx_utils.epoch import EpochRangePlanner
+    >>> planner = EpochRangePlanner(0, 99_999, window=1000)
+    >>> for window in planner:
+    ...     try:
+    ...         logs = client.cfx.get_logs(**window.to_filter_params(), address=address)
+    ...     except TooManyLogsError:
+    ...         planner.shrink(window)
+    ...         continue
+    ...     planner.complete(window, len(logs))
+    ...     save_checkpoint(planner.checkpoint)
+    """
+
+    def __init__(
+        self,
+        from_epoch: Union[EpochNumberParam, str],
+        to_epoch: Union[EpochNumberParam, str],
+        window: int = 1000,
+        min_window: int = 1,
+        max_window: int = 10000,
+        target_results: int = 1000,
+        checkpoint: Optional[Union[EpochNumberParam, str]] = None,
+    ) -> None:
+        """
+        :param from_epoch: the first epoch to query, literals are not accepted
+        :param to_epoch: the last epoch to query (inclusive), literals are not accepted
+        :param int window: the initial window size
+        :param int min_window: the minimum window size
+        :param int max_window: the maximum window size
+        :param int target_results: the expected result count of a window
+        :param checkpoint: resume from the checkpoint, which should be in [from_epoch, to_epoch + 1], literals are not accepted
+        :raises InvalidEpochNumebrParam: the epochs or the checkpoint are invalid
+        :raises ValueError: the window sizes or `target_results` are invalid
+        """
+        self.from_epoch = _epoch_int(from_epoch)
+        self.to_epoch = _epoch_int(to_epoch)
+        if self.from_epoch > self.to_epoch:
+            raise InvalidEpochNumebrParam(f"from_epoch {self.from_epoch} is greater than to_epoch {self.to_epoch}")
+        if not 1 <= min_window <= window <= max_window:
+            raise ValueError(f"1 <= min_window <= window <= max_window is expected, received {min_window}, {window}, {max_window}")
+        if target_results < 1:
+            raise ValueError(f"target_results should be positive, received {target_results}")
+        if checkpoint is None:
+            checkpoint_epoch = self.from_epoch
+        else:
+            checkpoint_epoch = _epoch_int(checkpoint)
+            if not self.from_epoch <= checkpoint_epoch <= self.to_epoch + 1:
+                raise InvalidEpochNumebrParam(
+                    f"Checkpoint {checkpoint} is out of range [{self.from_epoch}, {self.to_epoch + 1}]"
+                )
+        self.min_window = min_window
+        self.max_window = max_window
+        self.target_results = target_results
+        self._window = window
+        self._checkpoint = checkpoint_epoch
+        self._pending: Optional[EpochWindow] = None
+
+    @property
+    def checkpoint(self) -> int:
+        """
+        The first epoch not queried yet
+        """
+        return self._checkpoint
+
+    @property
+    def window(self) -> int:
+        """
+        The current window size
+        """
+        return self._window
+
+    @property
+    def done(self) -> bool:
+        return self._checkpoint > self.to_epoch
+
+    def next_window(self) -> Optional[EpochWindow]:
+        """
+        Return the next window to query, or :const:`None` if all epochs are queried.
+        The same window is returned until it is reported by :meth:`complete` or :meth:`shrink`.
+        """
+        if self.done:
+            return None
+        if self._pending is None:
+            self._pending = EpochWindow(
+                self._checkpoint, min(self._checkpoint + self._window - 1, self.to_epoch)
+            )
+        return self._pending
+
+    def __iter__(self) -> Iterator[EpochWindow]:
+        """
+        Yield windows until all epochs are queried.
+
+        :raises RuntimeError: a window is neither completed nor shrunk before the next iteration
+        """
+        while True:
+            window = self.next_window()
+            if window is None:
+                return
+            yield window
+            if self._pending is window:
+                raise RuntimeError(f"{window} should be reported by complete() or shrink() before the next window")
+
+    def complete(self, window: EpochWindow, result_count: int) -> None:
+        """
+        Mark the window as queried, advance the checkpoint and adapt the window size to the result count
+
+        :raises ValueError: the window is not the pending window
+        """
+        self._check_pending(window)
+        self._pending = None
+        self._checkpoint = window.to_epoch + 1
+        if result_count > self.target_results:
+            self._window = max(self.min_window, window.size // 2)
+        elif result_count * 2 < self.target_results and window.size == self._window:
+            self._window = min(self.max_window, self._window * 2)
+
+    def shrink(self, window: EpochWindow) -> None:
+        """
+        Report that the query of the window failed because of too many results,
+        so the window is halved and queried again
+
+        :raises ValueError: the window is not the pending window, or is already of `min_window` size
+        """
+        self._check_pending(window)
+        if window.size <= self.min_window:
+            raise ValueError(f"{window} cannot be shrunk because the minimum window size is {self.min_window}")
+        self._pending = None
+        self._window = max(self.min_window, window.size // 2)
+
+    def _check_pending(self, window: EpochWindow) -> None:
+        if window != self._pending:
+            raise ValueError(f"{window} is not the pending window {self._pending}")
+
+    def __repr__(self) -> str:
+        return (
+            f"EpochRangePlanner({self.from_epoch}..{self.to_epoch}, "
+            f"checkpoint={self._checkpoint}, window={self._window})"
+        )
@@ -34,6 +34,12 @@ class InvalidEpochNumebrParam(ValueError):
     """
     pass
 
+class InvalidTransaction(ValueError):
+    """
+    The supplied transaction dict is invalid, e.g. a field is not in the expected type or out of uint256 range
+    """
+    pass
+
 class AddressNotMatch(ValueError):
     """
     The supplied address is legal, but does not satisfy some specific requirements, e.g. a Base32Address is expected 
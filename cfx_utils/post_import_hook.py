@@ -1,10 +1,7 @@
 from importlib.machinery import ModuleSpec
-import importlib.util
 import sys
 import functools
-from collections import (
-    defaultdict
-)
+import threading
 from types import (
     ModuleType
 )
@@ -15,7 +12,6 @@ from typing import (
     Dict,
     Optional,
     Sequence,
-    Set,
     TypeVar,
 )
 from typing_extensions import (
@@ -25,50 +21,89 @@ from typing_extensions import (
 T = TypeVar("T")
 P = ParamSpec("P")
 
-_post_import_hooks: Dict[Any, List[Any]] = defaultdict(list)
+# hooks of the modules not imported yet, a module's hooks are removed once it is executed successfully
+_post_import_hooks: Dict[str, List[Callable[[ModuleType], Any]]] = {}
+# guards _post_import_hooks and the installation of the finder, but not the lookup in find_spec
+_lock = threading.Lock()
 
 def execute_module_and_post(exec: Callable[[ModuleType], Any], posts: Sequence[Callable[[ModuleType], Any]]) -> Callable[[ModuleType], Any]:
+    """
+    Wrap `exec` so the `posts` are called with the module after the module is executed.
+    The posts are called only once even if the module is executed again.
+    """
+    executed = False
     @functools.wraps(exec)
     def wrap(module: ModuleType) -> Any:
+        nonlocal executed
         rtn = exec(module)
-        for post in posts:
-            post(module)
+        if not executed:
+            executed = True
+            for post in posts:
+                post(module)
         return rtn
     return wrap
 
 class PostImportFinder:
-    def __init__(self) -> None:
-        self._skip: Set = set()
+    """
+    A meta path finder running the hooks registered by :func:`when_imported` after a module is imported.
+    It is only on :data:`sys.meta_path` while any hook is pending, so imports cost nothing otherwise.
+    """
 
-    def find_spec(self, fullname: str, package: Optional[str]=None, *args: Sequence[Any]) -> Optional[ModuleSpec]:
-        # we simply ignore args
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]]=None, target: Optional[ModuleType]=None) -> Optional[ModuleSpec]:
         if fullname not in _post_import_hooks:
             return None
-        # print(fullname)
-        # print(args)
-        if fullname in self._skip:
-            return None
-        self._skip.add(fullname)
-    
-        spec = importlib.util.find_spec(fullname, package)
-        if spec is None:
+        # the spec is found by the other finders directly rather than a re-entrant importlib.util.find_spec
+        spec = None
+        for finder in list(sys.meta_path):
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
             return None
-        assert spec.loader is not None
         spec.loader.exec_module = execute_module_and_post( # type: ignore
-            spec.loader.exec_module, _post_import_hooks[fullname] # type: ignore
+            spec.loader.exec_module, [functools.partial(_run_hooks, fullname)] # type: ignore
         )
-        self._skip.remove(fullname)
-        # change _post_import_hooks[fullname] to empty to avoid modify the module multiple times
-        # _post_import_hooks[fullname] = []
         return spec
-    
+
+def _run_hooks(fullname: str, module: ModuleType) -> None:
+    # the hooks are taken only after the module is executed successfully,
+    # so they stay pending for the next import if the module raises
+    with _lock:
+        hooks = _post_import_hooks.pop(fullname, None)
+        if not _post_import_hooks:
+            _uninstall_finder()
+    if hooks is None:
+        # the hooks are taken by another thread
+        return
+    for hook in hooks:
+        hook(module)
+
+_finder = PostImportFinder()
+
+def _install_finder() -> None:
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder) # type: ignore
+
+def _uninstall_finder() -> None:
+    try:
+        sys.meta_path.remove(_finder) # type: ignore
+    except ValueError:
+        pass
+
 def when_imported(fullname: str) -> Callable[[Callable[[ModuleType], T]], Callable[[ModuleType], T]]:
+    """
+    Register a hook called with the module once the module `fullname` is imported.
+    If the module is already imported, the hook is called immediately.
+    Each hook is called exactly once.
+    """
     def decorate(func: Callable[[ModuleType], T]) -> Callable[[ModuleType], T]:
         if fullname in sys.modules:
             func(sys.modules[fullname])
         else:
-            _post_import_hooks[fullname].append(func)
+            with _lock:
+                _post_import_hooks.setdefault(fullname, []).append(func)
+                _install_finder()
         return func
     return decorate
-
-sys.meta_path.insert(0, PostImportFinder()) # type: ignore
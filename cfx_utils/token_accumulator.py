@@ -0,0 +1,203 @@
+import operator
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Optional,
+    Type,
+    overload,
+)
+
+from typing_extensions import (
+    Self,
+)
+
+from cfx_utils.exceptions import (
+    InvalidTokenOperation,
+    InvalidTokenValueType,
+    TokenUnitNotMatch,
+)
+from cfx_utils.token_unit import (
+    AbstractTokenUnit,
+    AnyTokenUnit,
+    BaseTokenUnit,
+    token_operation_error,
+)
+
+_get_base_unit = operator.attrgetter("_base_unit")
+_get_base_value = operator.attrgetter("_base_value")
+
+
+class TokenAccumulator(Generic[BaseTokenUnit]):
+    """
+    A mutable accumulator summing token values of one token unit family, e.g. per-block fee totals.
+    The total is kept as a base unit integer, so token objects are only created by :meth:`result`.
+
+    >>> from cfx_utils.token_unit import CFX, GDrip, Drip
+    >>> from cfx_utils.token_accumulator import TokenAccumulator
+    >>> acc = TokenAccumulator(Drip)
+    >>> acc.add(CFX(1))
+    >>> acc.add_many([GDrip(1), Drip(1)])
+    >>> acc.sub(CFX(1))
+    >>> acc.result()
+    1000000001 Drip
+    >>> acc.result(GDrip)
+    1.000000001 GDrip
+    """
+
+    __slots__ = ("_base_unit", "_total")
+
+    _base_unit: Type[BaseTokenUnit]
+    _total: int
+
+    def __init__(self, unit: Type[AbstractTokenUnit[BaseTokenUnit]]) -> None:
+        """
+        :param Type[AbstractTokenUnit[BaseTokenUnit]] unit: any token unit of the token unit family to accumulate
+        """
+        self._base_unit = unit._base_unit
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        """
+        The accumulated total in base unit
+        """
+        return self._total
+
+    def _base_int_of(self, value: AbstractTokenUnit[Any]) -> int:
+        if not isinstance(value, AbstractTokenUnit):
+            raise InvalidTokenValueType(f"{value} is not a token unit")
+        if value._base_unit is not self._base_unit:
+            raise TokenUnitNotMatch(
+                f"Cannot accumulate token value with different base token unit {value._base_unit} and {self._base_unit}"
+            )
+        return value._base_value
+
+    @token_operation_error
+    def add(self, value: AbstractTokenUnit[BaseTokenUnit]) -> None:
+        """
+        :raises InvalidTokenOperation: the value is not a token value of the accumulated token unit family
+        """
+        self._total += self._base_int_of(value)
+
+    @token_operation_error
+    def sub(self, value: AbstractTokenUnit[BaseTokenUnit]) -> None:
+        """
+        :raises InvalidTokenOperation: the value is not a token value of the accumulated token unit family
+        """
+        self._total -= self._base_int_of(value)
+
+    def add_many(self, values: Iterable[AbstractTokenUnit[BaseTokenUnit]]) -> None:
+        """
+        Add all the values. The total is not changed if any of the values is invalid.
+
+        :raises InvalidTokenOperation: any of the values is not a token value of the accumulated token unit family
+        """
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        # the family is checked once for all values, then the base unit integers are summed in C
+        try:
+            if set(map(_get_base_unit, values)) <= {self._base_unit}:
+                self._total += sum(map(_get_base_value, values))
+                return
+        except (AttributeError, TypeError):
+            pass
+        # locate the invalid value only when the fast path fails
+        # the values are not included in the message because there might be millions of them
+        for value in values:
+            try:
+                self._base_int_of(value)
+            except (InvalidTokenValueType, TokenUnitNotMatch) as e:
+                raise InvalidTokenOperation(
+                    f"Not able to execute operation add_many due to invalid value {value!r}"
+                ) from e
+        raise InvalidTokenOperation("Unreachable")
+
+    def __iadd__(self, value: AbstractTokenUnit[BaseTokenUnit]) -> Self:
+        self.add(value)
+        return self
+
+    def __isub__(self, value: AbstractTokenUnit[BaseTokenUnit]) -> Self:
+        self.sub(value)
+        return self
+
+    def reset(self) -> None:
+        self._total = 0
+
+    @overload
+    def result(self) -> BaseTokenUnit:
+        ...
+
+    @overload
+    def result(self, unit: Type[AnyTokenUnit]) -> AnyTokenUnit:
+        ...
+
+    def result(self, unit: Optional[Type[Any]] = None) -> Any:
+        """
+        Return the total as a token object
+
+        :param Optional[Type[AnyTokenUnit]] unit: the unit of the returned token object, defaults to the base unit
+        :raises TokenUnitNotMatch: `unit` is not in the accumulated token unit family
+        :raises NegativeTokenValueWarning: the total is less than :const:`0`
+        """
+        if unit is None:
+            unit = self._base_unit
+        elif unit._base_unit is not self._base_unit:
+            raise TokenUnitNotMatch(
+                f"Cannot convert {self._base_unit} to {unit} because of different token unit"
+            )
+        return unit._from_operation_result(self._total)
+
+    def __repr__(self) -> str:
+        return f"TokenAccumulator({self._total} {self._base_unit.__name__})"
+
+
+@overload
+def token_sum(values: Iterable[AbstractTokenUnit[BaseTokenUnit]]) -> AbstractTokenUnit[BaseTokenUnit]:
+    ...
+
+
+@overload
+def token_sum(values: Iterable[AbstractTokenUnit[BaseTokenUnit]], unit: Type[AnyTokenUnit]) -> AnyTokenUnit:
+    ...
+
+
+def token_sum(values: Iterable[AbstractTokenUnit[Any]], unit: Optional[Type[Any]] = None) -> Any:
+    """
+    Sum token values of one token unit family without creating intermediate token objects.
+    The units of the values are collected and checked once, then base unit integers are added directly.
+
+    :param Iterable[AbstractTokenUnit] values: token values in the same token unit family
+    :param Optional[Type[AnyTokenUnit]] unit: the unit of the result. If not specified,
+        the result is in the unit of the values if they share the same unit, else in the base unit,
+        which is the same as adding the values with `+`
+    :raises InvalidTokenOperation: the values are not token values in the same token unit family,
+        or `values` is empty and `unit` is not specified
+
+    >>> from cfx_utils.token_unit import CFX, GDrip
+    >>> from cfx_utils.token_accumulator import token_sum
+    >>> token_sum([CFX(1), CFX(2)])
+    3 CFX
+    >>> token_sum([CFX(1), GDrip(1)])
+    1000000001000000000 Drip
+    >>> token_sum([CFX(1), GDrip(1)], unit=GDrip)
+    1000000001 GDrip
+    """
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    units = set(map(type, values))
+    for value_unit in units:
+        if not issubclass(value_unit, AbstractTokenUnit):
+            raise InvalidTokenOperation(
+                f"Not able to execute operation token_sum because {value_unit} is not a token unit"
+            )
+    base_units = {value_unit._base_unit for value_unit in units}
+    if unit is not None:
+        base_units.add(unit._base_unit)
+    if len(base_units) > 1:
+        raise InvalidTokenOperation(
+            f"Not able to execute operation token_sum on token values with different base token units {base_units}"
+        )
+    if unit is None:
+        if not units:
+            raise InvalidTokenOperation("The unit is required to sum empty token values")
+        unit = units.pop() if len(units) == 1 else base_units.pop()
+    return unit._from_operation_result(sum(map(_get_base_value, values)))
@@ -0,0 +1,438 @@
+import decimal
+import itertools
+import operator
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    overload,
+)
+
+from typing_extensions import (
+    Literal,
+    Self,
+)
+
+from cfx_utils.exceptions import (
+    InvalidTokenOperation,
+    InvalidTokenValueType,
+    NegativeTokenValueWarning,
+    TokenUnitNotMatch,
+)
+from cfx_utils.token_context import (
+    _token_context,
+    emit_warning,
+)
+from cfx_utils.token_unit import (
+    AbstractTokenUnit,
+    AnyTokenUnit,
+    _as_integer_ratio,
+    _format_unit,
+    _get_formatter,
+    _grouping_separator,
+    _parse_hex_quantities,
+    token_operation_error,
+)
+
+_Operand = Union["TokenArray[AnyTokenUnit]", AbstractTokenUnit[Any], Literal[0]]
+
+
+def _is_zero(other: Any) -> bool:
+    # False == 0 but is not accepted as zero, the same as AbstractTokenUnit.__radd__
+    return type(other) is int and other == 0
+
+
+def _to_base_int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int(value)
+    raise InvalidTokenValueType(f"{value!r} is not an integer of the base unit")
+
+
+def _warn_negative(unit: Type[Any], base_values: List[int]) -> None:
+    if base_values and min(base_values) < 0:
+        emit_warning(
+            _token_context.get().negative_warning,
+            f"A negative value is found in the TokenArray of {unit}, please check if it is expected.",
+            NegativeTokenValueWarning,
+        )
+
+
+class TokenArray(Generic[AnyTokenUnit]):
+    """
+    A columnar container of token values in the same token unit family.
+    Values are stored as a column of exact base unit integers,
+    so batch operations such as :meth:`sum` or comparisons run without creating token objects.
+    The precision rules are the same as :class:`~cfx_utils.token_unit.AbstractTokenUnit`.
+
+    >>> from cfx_utils.token_unit import CFX, Drip
+    >>> from cfx_utils.token_array import TokenArray
+    >>> arr = TokenArray.from_units([CFX(1), CFX(2), CFX(3)])
+    >>> arr.sum()
+    6 CFX
+    >>> arr > CFX(1)
+    [False, True, True]
+    >>> arr.to(Drip).to_units()
+    [1000000000000000000 Drip, 2000000000000000000 Drip, 3000000000000000000 Drip]
+    """
+
+    __slots__ = ("_unit", "_base_values")
+
+    _unit: Type[AnyTokenUnit]
+    _base_values: List[int]
+
+    def __init__(self, unit: Type[AnyTokenUnit], base_values: Iterable[int] = ()) -> None:
+        """
+        :param Type[AnyTokenUnit] unit: the token unit in which elements are presented
+        :param Iterable[int] base_values: the element values in :attr:`unit._base_unit`, e.g. Drip
+        :raises InvalidTokenValueType: any of the values is not an integer
+        :raises NegativeTokenValueWarning: any of the values is less than :const:`0`
+        """
+        # copied so that the column is not changed through the caller's list
+        column = list(base_values)
+        if not {int}.issuperset(map(type, column)):
+            column = [_to_base_int(value) for value in column]
+        _warn_negative(unit, column)
+        self._unit = unit
+        self._base_values = column
+
+    @classmethod
+    def _from_base_ints(cls, unit: Type[AnyTokenUnit], base_values: List[int]) -> Self:
+        """
+        Create an array owning the `base_values` column, which is known to hold valid integers
+        """
+        instance = cls.__new__(cls)
+        instance._unit = unit
+        instance._base_values = base_values
+        return instance
+
+    @classmethod
+    def from_units(
+        cls, values: Iterable[AbstractTokenUnit[Any]], unit: Optional[Type[AnyTokenUnit]] = None
+    ) -> "TokenArray[AnyTokenUnit]":
+        """
+        Create a :class:`TokenArray` from token objects in the same token unit family.
+
+        :param Iterable[AbstractTokenUnit] values: the token objects
+        :param Optional[Type[AnyTokenUnit]] unit: the unit of the array,
+            defaults to the unit of the first element, or base unit if the elements are in different units
+        :raises TokenUnitNotMatch: the elements are not in the same token unit family
+        :raises InvalidTokenValueType: an element is not a token object
+        """
+        values = values if isinstance(values, Sequence) else list(values)
+        if not values:
+            if unit is None:
+                raise InvalidTokenValueType("The unit is required to create an empty TokenArray")
+            return cls._from_base_ints(unit, [])
+        first = values[0]
+        if not isinstance(first, AbstractTokenUnit):
+            raise InvalidTokenValueType(f"{first} is not a token unit")
+        base_unit = first._base_unit
+        # the unit of the array is inferred from the elements only if not specified
+        infer_unit = unit is None
+        if unit is None:
+            unit = type(first)
+        elif unit._base_unit is not base_unit:
+            raise TokenUnitNotMatch(f"Cannot create TokenArray of {unit} with values in {base_unit}")
+        base_values: List[int] = []
+        append = base_values.append
+        for value in values:
+            if not isinstance(value, AbstractTokenUnit):
+                raise InvalidTokenValueType(f"{value} is not a token unit")
+            if value._base_unit is not base_unit:
+                raise TokenUnitNotMatch(
+                    f"Cannot create TokenArray with values in {base_unit} and {value._base_unit}"
+                )
+            if infer_unit and type(value) is not unit:
+                unit = base_unit
+            append(value._base_value)
+        return cls._from_base_ints(unit, base_values)
+
+    @classmethod
+    def from_hex_many(cls, unit: Type[AnyTokenUnit], values: Iterable[str]) -> "TokenArray[AnyTokenUnit]":
+        """
+        Create a :class:`TokenArray` from JSON-RPC hex quantities in base unit, e.g. Drip.
+
+        :param Type[AnyTokenUnit] unit: the unit of the array
+        :param Iterable[str] values: hex quantities in base unit such as "0x1f"
+        :raises InvalidTokenValueType: any of the values is not a hex quantity
+
+        >>> TokenArray.from_hex_many(GDrip, ["0x3b9aca00"])
+        TokenArray([1 GDrip])
+        """
+        return cls._from_base_ints(unit, _parse_hex_quantities(values))
+
+    @classmethod
+    async def afrom_hex_many(
+        cls, unit: Type[AnyTokenUnit], pages: AsyncIterable[Iterable[str]]
+    ) -> AsyncIterator["TokenArray[AnyTokenUnit]"]:
+        """
+        The asynchronous counterpart of :meth:`from_hex_many`, yielding a :class:`TokenArray` for each page
+        """
+        async for page in pages:
+            yield cls.from_hex_many(unit, page)
+
+    @property
+    def unit(self) -> Type[AnyTokenUnit]:
+        return self._unit
+
+    @property
+    def base_values(self) -> List[int]:
+        """
+        A copy of the element values in base unit
+
+        >>> TokenArray.from_units([CFX(1)]).base_values
+        [1000000000000000000]
+        """
+        return self._base_values.copy()
+
+    def to(self, target_unit: Type[AnyTokenUnit]) -> "TokenArray[AnyTokenUnit]":
+        """
+        Return a view of the array in `target_unit`. The underlying column is shared.
+
+        :raises TokenUnitNotMatch: `target_unit` is not in the same token unit family
+        """
+        if target_unit._base_unit is not self._unit._base_unit:
+            raise TokenUnitNotMatch(
+                f"Cannot convert {self._unit} to {target_unit} because of different token unit"
+            )
+        return TokenArray._from_base_ints(target_unit, self._base_values)
+
+    def to_units(self) -> List[AnyTokenUnit]:
+        """
+        Return a list of token objects of :attr:`unit`
+        """
+        from_base_int = self._unit._from_base_int
+        return [from_base_int(value) for value in self._base_values]
+
+    def format(
+        self,
+        unit: Optional[Union[str, Type[AbstractTokenUnit[Any]]]] = None,
+        decimals: Optional[int] = None,
+        grouping: Union[bool, str] = False,
+        rounding: Optional[str] = None,
+        trim: bool = False,
+        with_unit: bool = True,
+    ) -> List[str]:
+        """
+        Format the elements as fixed-point strings directly from the column,
+        see :meth:`AbstractTokenUnit.format <cfx_utils.token_unit.AbstractTokenUnit.format>` for the parameters
+
+        >>> TokenArray.from_units([CFX(1), CFX(2)]).format(decimals=2)
+        ['1.00 CFX', '2.00 CFX']
+        """
+        target_unit = self._unit if unit is None else _format_unit(self._unit._base_unit, unit)
+        formatter = _get_formatter(
+            target_unit,
+            decimals,
+            _grouping_separator(grouping),
+            rounding or _token_context.get().rounding,
+            trim,
+            with_unit,
+        )
+        return list(map(formatter, self._base_values))
+
+    def __len__(self) -> int:
+        return len(self._base_values)
+
+    def __iter__(self) -> Iterator[AnyTokenUnit]:
+        from_base_int = self._unit._from_base_int
+        return (from_base_int(value) for value in self._base_values)
+
+    @overload
+    def __getitem__(self, index: int) -> AnyTokenUnit:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[AnyTokenUnit, Self]:
+        if isinstance(index, slice):
+            return self._from_base_ints(self._unit, self._base_values[index])
+        return self._unit._from_base_int(self._base_values[index])
+
+    def __repr__(self) -> str:
+        return f"TokenArray({self.to_units()})"
+
+    def compress(self, mask: Iterable[bool]) -> Self:
+        """
+        Return the elements whose corresponding mask is true
+
+        >>> arr = TokenArray.from_units([CFX(1), CFX(2), CFX(3)])
+        >>> arr.compress(arr > CFX(1))
+        TokenArray([2 CFX, 3 CFX])
+        """
+        return self._from_base_ints(self._unit, list(itertools.compress(self._base_values, mask)))
+
+    def sum(self) -> AnyTokenUnit:
+        return self._unit._from_base_int(sum(self._base_values))
+
+    def min(self) -> AnyTokenUnit:
+        """
+        :raises InvalidTokenOperation: the array is empty
+        """
+        if not self._base_values:
+            raise InvalidTokenOperation("Cannot get the min of an empty TokenArray")
+        return self._unit._from_base_int(min(self._base_values))
+
+    def max(self) -> AnyTokenUnit:
+        """
+        :raises InvalidTokenOperation: the array is empty
+        """
+        if not self._base_values:
+            raise InvalidTokenOperation("Cannot get the max of an empty TokenArray")
+        return self._unit._from_base_int(max(self._base_values))
+
+    def _operand_column(self, other: _Operand, operation: str) -> Union[List[int], int]:
+        """
+        Return the base unit column of a :class:`TokenArray` operand,
+        or the base unit integer of a token object or :const:`0`
+        """
+        if isinstance(other, TokenArray):
+            if other._unit._base_unit is not self._unit._base_unit:
+                raise TokenUnitNotMatch(
+                    f"Cannot operate {operation} on token values with different base token unit {other._unit._base_unit} and {self._unit._base_unit}"
+                )
+            if len(other._base_values) != len(self._base_values):
+                raise InvalidTokenOperation(
+                    f"Cannot operate {operation} on TokenArray of length {len(self)} and {len(other)}"
+                )
+            return other._base_values
+        if isinstance(other, AbstractTokenUnit):
+            if other._base_unit is not self._unit._base_unit:
+                raise TokenUnitNotMatch(
+                    f"Cannot operate {operation} on token values with different base token unit {other._base_unit} and {self._unit._base_unit}"
+                )
+            return other._base_value
+        if _is_zero(other):
+            return 0
+        raise InvalidTokenValueType(f"{other} is not a token unit nor a TokenArray")
+
+    def _elementwise(self, other: _Operand, op: Callable[[int, int], Any], operation: str) -> List[Any]:
+        column = self._operand_column(other, operation)
+        if isinstance(column, int):
+            return [op(value, column) for value in self._base_values]
+        return list(map(op, self._base_values, column))
+
+    def _result_unit(self, other: _Operand) -> Type[Any]:
+        # same as AbstractTokenUnit.__add__: different units are added in base unit
+        if isinstance(other, TokenArray):
+            other_unit = other._unit
+        elif isinstance(other, AbstractTokenUnit):
+            other_unit = type(other)
+        else:
+            other_unit = self._unit
+        return self._unit if other_unit is self._unit else self._unit._base_unit
+
+    def _from_result(self, unit: Type[Any], base_values: List[int]) -> "TokenArray[Any]":
+        _warn_negative(unit, base_values)
+        return TokenArray._from_base_ints(unit, base_values)
+
+    @token_operation_error
+    def __add__(self, other: _Operand) -> "TokenArray[Any]":
+        """
+        Elementwise add another :class:`TokenArray` of same length or a token object.
+        If the units differ, the result is in base unit.
+        """
+        return TokenArray._from_base_ints(
+            self._result_unit(other), self._elementwise(other, operator.add, "__add__")
+        )
+
+    def __radd__(self, other: _Operand) -> "TokenArray[Any]":
+        return self + other
+
+    @token_operation_error
+    def __sub__(self, other: _Operand) -> "TokenArray[Any]":
+        return self._from_result(
+            self._result_unit(other), self._elementwise(other, operator.sub, "__sub__")
+        )
+
+    @token_operation_error
+    def __mul__(self, other: Union[int, decimal.Decimal, float]) -> Self:
+        """
+        Multiply every element with a number, following the precision rule of
+        :meth:`~cfx_utils.token_unit.AbstractTokenUnit.__mul__`
+        """
+        if isinstance(other, (AbstractTokenUnit, TokenArray)):
+            raise InvalidTokenOperation(f"{self.__class__} is not allowed to multiply a token unit")
+        self._unit._warn_float_value(other)
+        numerator, denominator = _as_integer_ratio(other)
+        return self._scaled(numerator, denominator)  # type: ignore
+
+    def __rmul__(self, other: Union[int, decimal.Decimal, float]) -> Self:
+        return self * other
+
+    @token_operation_error
+    def __truediv__(self, other: Union[int, decimal.Decimal, float]) -> Self:
+        """
+        Divide every element by a number, following the precision rule of
+        :meth:`~cfx_utils.token_unit.AbstractTokenUnit.__truediv__`
+        """
+        if isinstance(other, (AbstractTokenUnit, TokenArray)):
+            raise InvalidTokenOperation(f"{self.__class__} is only allowed to be divided by a number")
+        self._unit._warn_float_value(other)
+        numerator, denominator = _as_integer_ratio(other)
+        if numerator < 0:
+            numerator, denominator = -numerator, -denominator
+        return self._scaled(denominator, numerator)  # type: ignore
+
+    def _scaled(self, numerator: int, denominator: int) -> "TokenArray[Any]":
+        if denominator == 1:
+            return self._from_result(self._unit, [value * numerator for value in self._base_values])
+        base_values: List[int] = []
+        append = base_values.append
+        for value in self._base_values:
+            quotient, remainder = divmod(value * numerator, denominator)
+            if remainder:
+                raise self._unit._inexact_error(
+                    f"Not able to represent {value * numerator}/{denominator} {self._unit._base_unit} in {self._unit} due to unexpected precision"
+                )
+            append(quotient)
+        return self._from_result(self._unit, base_values)
+
+    def _is_operand(self, other: Any) -> bool:
+        return isinstance(other, (TokenArray, AbstractTokenUnit)) or _is_zero(other)
+
+    def __eq__(self, other: _Operand) -> List[bool]:  # type: ignore
+        """
+        Elementwise equality. Same as :meth:`AbstractTokenUnit.__eq__ <cfx_utils.token_unit.AbstractTokenUnit.__eq__>`,
+        a value which is not a token unit nor :const:`0` equals no element.
+        """
+        if not self._is_operand(other):
+            return [False] * len(self._base_values)
+        return self._elementwise(other, operator.eq, "__eq__")
+
+    def __ne__(self, other: _Operand) -> List[bool]:  # type: ignore
+        if not self._is_operand(other):
+            return [True] * len(self._base_values)
+        return self._elementwise(other, operator.ne, "__ne__")
+
+    def _compare(self, other: _Operand, op: Callable[[int, int], bool], operation: str) -> List[bool]:
+        if not self._is_operand(other):
+            raise InvalidTokenOperation(
+                f"not able to compare TokenArray of {self._unit} and {other} because {other} is not a token unit"
+            )
+        return self._elementwise(other, op, operation)
+
+    def __lt__(self, other: _Operand) -> List[bool]:
+        return self._compare(other, operator.lt, "__lt__")
+
+    def __le__(self, other: _Operand) -> List[bool]:
+        return self._compare(other, operator.le, "__le__")
+
+    def __gt__(self, other: _Operand) -> List[bool]:
+        return self._compare(other, operator.gt, "__gt__")
+
+    def __ge__(self, other: _Operand) -> List[bool]:
+        return self._compare(other, operator.ge, "__ge__")
+
+    __hash__ = None  # type: ignore
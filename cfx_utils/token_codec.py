@@ -0,0 +1,228 @@
+import operator
+import struct
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    overload,
+)
+
+from typing_extensions import (
+    Literal,
+)
+
+from cfx_utils.exceptions import (
+    InvalidTokenValueType,
+)
+from cfx_utils.token_array import (
+    TokenArray,
+)
+from cfx_utils.token_unit import (
+    UINT256_SIZE,
+    AbstractTokenUnit,
+    AnyTokenUnit,
+    _UINT256_LIMIT,
+    _decode_varint,
+    _encode_varint,
+    _uint256_error,
+)
+
+Encoding = Literal["uint256", "varint"]
+"""
+"uint256" encodes each value as 32-byte big-endian integer, "varint" as unsigned LEB128
+"""
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# a uint256 is unpacked as 4 big-endian uint64
+_UINT256_STRUCT = struct.Struct(">4Q")
+# values are encoded chunk by chunk so the temporary memory is bounded
+_CHUNK_SIZE = 4096
+
+_get_base_value = operator.attrgetter("_base_value")
+
+
+def _base_values_of(values: Union[Iterable[AbstractTokenUnit[Any]], TokenArray[Any]]) -> Sequence[int]:
+    if isinstance(values, TokenArray):
+        return values._base_values
+    try:
+        return list(map(_get_base_value, values))
+    except AttributeError:
+        raise InvalidTokenValueType("Token values are expected to encode")
+
+
+def _check_encoding(encoding: str) -> None:
+    if encoding not in ("uint256", "varint"):
+        raise ValueError(f"Invalid encoding {encoding!r}, expected 'uint256' or 'varint'")
+
+
+def _varint_size(base_values: Sequence[int]) -> int:
+    size = 0
+    for value in base_values:
+        if value < 0 or value >= _UINT256_LIMIT:
+            raise _uint256_error(value)
+        # 7 bits per byte, and 0 takes 1 byte
+        size += (value.bit_length() + 6) // 7 or 1
+    return size
+
+
+def encoded_size(
+    values: Union[Iterable[AbstractTokenUnit[Any]], TokenArray[Any]], encoding: Encoding = "uint256"
+) -> int:
+    """
+    Return the number of bytes required by :func:`encode_many` to encode the values
+
+    :raises InvalidTokenValueType: encoding is "varint" and any of the values is negative or overflows uint256
+    """
+    _check_encoding(encoding)
+    base_values = _base_values_of(values)
+    if encoding == "uint256":
+        return UINT256_SIZE * len(base_values)
+    return _varint_size(base_values)
+
+
+def encode_many(
+    values: Union[Iterable[AbstractTokenUnit[Any]], TokenArray[Any]],
+    out: Union[bytearray, memoryview],
+    offset: int = 0,
+    encoding: Encoding = "uint256",
+) -> int:
+    """
+    Encode token values as base unit integers into a caller-provided buffer.
+    No buffer is allocated for each value, and the values are written in chunks,
+    so encoding a large column takes little extra memory.
+
+    :param values: token values, or a :class:`~cfx_utils.token_array.TokenArray`. Units are not encoded
+    :param Union[bytearray,memoryview] out: a writable buffer, which can be sized with :func:`encoded_size`
+    :param int offset: the position in `out` to start writing at
+    :param Encoding encoding: "uint256" or "varint"
+    :return int: the number of bytes written
+    :raises InvalidTokenValueType: any of the values is negative or overflows uint256
+    :raises ValueError: `offset` is negative or `out` is too small to hold the encoded values
+
+    >>> from cfx_utils.token_unit import CFX
+    >>> from cfx_utils.token_codec import encode_many, encoded_size
+    >>> values = [CFX(1), CFX(2)]
+    >>> out = bytearray(encoded_size(values))
+    >>> encode_many(values, out)
+    64
+    """
+    _check_encoding(encoding)
+    if offset < 0:
+        raise ValueError(f"The offset {offset} is negative")
+    base_values = _base_values_of(values)
+    view = memoryview(out).cast("B")
+    # the size is computed first, so nothing is written if the buffer is too small
+    if encoding == "uint256":
+        end = offset + UINT256_SIZE * len(base_values)
+    else:
+        end = offset + _varint_size(base_values)
+    if end > len(view):
+        raise ValueError(f"The buffer is too small, at least {end} bytes are required")
+    position = offset
+    for start in range(0, len(base_values), _CHUNK_SIZE):
+        chunk = base_values[start:start + _CHUNK_SIZE]
+        if encoding == "uint256":
+            # int.to_bytes checks the range in C, and with one join per chunk
+            # it is about 3x faster than packing 4 uint64 limbs of each value into the buffer in python
+            try:
+                data: Union[bytes, bytearray] = b"".join([value.to_bytes(UINT256_SIZE, "big") for value in chunk])
+            except OverflowError:
+                raise _uint256_error(next(value for value in chunk if not 0 <= value < 1 << 256))
+        else:
+            data = bytearray()
+            for value in chunk:
+                _encode_varint(value, data)
+        end = position + len(data)
+        view[position:end] = data
+        position = end
+    return position - offset
+
+
+@overload
+def decode_many(
+    data: Buffer,
+    unit: Type[AnyTokenUnit],
+    offset: int = 0,
+    count: Optional[int] = None,
+    encoding: Encoding = "uint256",
+    as_array: Literal[False] = False,
+) -> List[AnyTokenUnit]:
+    ...
+
+
+@overload
+def decode_many(
+    data: Buffer,
+    unit: Type[AnyTokenUnit],
+    offset: int = 0,
+    count: Optional[int] = None,
+    encoding: Encoding = "uint256",
+    as_array: Literal[True] = ...,
+) -> TokenArray[AnyTokenUnit]:
+    ...
+
+
+def decode_many(
+    data: Buffer,
+    unit: Type[AnyTokenUnit],
+    offset: int = 0,
+    count: Optional[int] = None,
+    encoding: Encoding = "uint256",
+    as_array: bool = False,
+) -> Union[List[AnyTokenUnit], TokenArray[AnyTokenUnit]]:
+    """
+    Decode token values encoded by :func:`encode_many` from a buffer without copying it.
+
+    :param Buffer data: the encoded data
+    :param Type[AnyTokenUnit] unit: the unit of the decoded token values
+    :param int offset: the position in `data` to start reading at
+    :param Optional[int] count: the number of values to decode, defaults to all values till the end of `data`
+    :param Encoding encoding: "uint256" or "varint"
+    :param bool as_array: return a :class:`~cfx_utils.token_array.TokenArray` instead of a list of token objects
+    :raises InvalidTokenValueType: the data is truncated or malformed, or `offset` is negative
+
+    >>> from cfx_utils.token_unit import CFX
+    >>> from cfx_utils.token_codec import decode_many
+    >>> decode_many(bytes.fromhex("00" * 31 + "01"), CFX)
+    [1E-18 CFX]
+    """
+    _check_encoding(encoding)
+    if offset < 0:
+        raise InvalidTokenValueType(f"The offset {offset} is negative")
+    view = memoryview(data).cast("B")
+    if encoding == "uint256":
+        if count is None:
+            remaining = len(view) - offset
+            if remaining % UINT256_SIZE:
+                raise InvalidTokenValueType(
+                    f"The data length {remaining} is not a multiple of {UINT256_SIZE}"
+                )
+            count = remaining // UINT256_SIZE
+        end = offset + count * UINT256_SIZE
+        if end > len(view):
+            raise InvalidTokenValueType(f"Truncated data, {end} bytes are expected but {len(view)} received")
+        base_values = [
+            (high << 192) | (upper << 128) | (lower << 64) | low
+            for high, upper, lower, low in _UINT256_STRUCT.iter_unpack(view[offset:end])
+        ]
+    else:
+        base_values = []
+        append = base_values.append
+        position = offset
+        if count is None:
+            while position < len(view):
+                value, position = _decode_varint(view, position)
+                append(value)
+        else:
+            for _ in range(count):
+                value, position = _decode_varint(view, position)
+                append(value)
+    if as_array:
+        return TokenArray._from_base_ints(unit, base_values)
+    from_base_int = unit._from_base_int
+    return [from_base_int(value) for value in base_values]
@@ -0,0 +1,204 @@
+import contextlib
+import contextvars
+import decimal
+import os
+import sys
+from types import (
+    FrameType,
+)
+from typing import (
+    Any,
+    Iterator,
+    Optional,
+    Type,
+)
+import warnings
+
+from typing_extensions import (
+    Literal,
+)
+
+WarningPolicy = Literal["warn", "ignore", "error"]
+"""
+How a token value warning is handled:
+"warn" emits the warning, "ignore" drops it and "error" raises it as an exception
+"""
+
+# a uint256 has at most 78 decimal digits,
+# so no result computed from on-chain token values is rounded with the default precision
+DEFAULT_PRECISION = 78
+
+
+class TokenContext:
+    """
+    The immutable configuration used by token operations in :mod:`cfx_utils.token_unit`,
+    which is independent of the global :mod:`decimal` context of the host process.
+    The current configuration is stored in a :class:`contextvars.ContextVar`,
+    so it is safe to change it in threads and asyncio tasks with :func:`token_context`.
+
+    >>> from cfx_utils.token_context import get_token_context
+    >>> get_token_context()
+    TokenContext(precision=78, rounding='ROUND_HALF_EVEN', float_warning='warn', negative_warning='warn')
+    """
+
+    __slots__ = ("_decimal_context", "float_warning", "negative_warning")
+
+    # the context is shared by every thread and task using the TokenContext, so it is never exposed
+    _decimal_context: decimal.Context
+    float_warning: WarningPolicy
+    """
+    The policy of :class:`~cfx_utils.exceptions.FloatWarning`
+    """
+    negative_warning: WarningPolicy
+    """
+    The policy of :class:`~cfx_utils.exceptions.NegativeTokenValueWarning`
+    """
+
+    def __init__(
+        self,
+        precision: int = DEFAULT_PRECISION,
+        rounding: str = decimal.ROUND_HALF_EVEN,
+        float_warning: WarningPolicy = "warn",
+        negative_warning: WarningPolicy = "warn",
+    ) -> None:
+        for policy in (float_warning, negative_warning):
+            if policy not in ("warn", "ignore", "error"):
+                raise ValueError(f"Invalid warning policy {policy!r}, expected 'warn', 'ignore' or 'error'")
+        # the traps are the same as the default decimal context
+        object.__setattr__(self, "_decimal_context", decimal.Context(
+            prec=precision,
+            rounding=rounding,
+            traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+        ))
+        object.__setattr__(self, "float_warning", float_warning)
+        object.__setattr__(self, "negative_warning", negative_warning)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace() to create a new one")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace() to create a new one")
+
+    @property
+    def precision(self) -> int:
+        return self._decimal_context.prec
+
+    @property
+    def rounding(self) -> str:
+        return self._decimal_context.rounding
+
+    @property
+    def decimal_context(self) -> decimal.Context:
+        """
+        A copy of the :class:`decimal.Context` used to compute :class:`decimal.Decimal` results,
+        changing the copy does not affect the token context
+        """
+        return self._decimal_context.copy()
+
+    def divide(self, a: decimal.Decimal, b: decimal.Decimal) -> decimal.Decimal:
+        """
+        Return `a / b` computed with the precision and rounding of the token context,
+        e.g. the ratio of 2 token values
+        """
+        return self._decimal_context.divide(a, b)
+
+    def replace(
+        self,
+        precision: Optional[int] = None,
+        rounding: Optional[str] = None,
+        float_warning: Optional[WarningPolicy] = None,
+        negative_warning: Optional[WarningPolicy] = None,
+    ) -> "TokenContext":
+        """
+        Return a new :class:`TokenContext` with the specified fields replaced
+        """
+        return TokenContext(
+            self.precision if precision is None else precision,
+            self.rounding if rounding is None else rounding,
+            self.float_warning if float_warning is None else float_warning,
+            self.negative_warning if negative_warning is None else negative_warning,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenContext(precision={self.precision}, rounding={self.rounding!r}, "
+            f"float_warning={self.float_warning!r}, negative_warning={self.negative_warning!r})"
+        )
+
+
+_token_context: "contextvars.ContextVar[TokenContext]" = contextvars.ContextVar(
+    "cfx_utils_token_context", default=TokenContext()
+)
+
+
+def get_token_context() -> TokenContext:
+    """
+    Return the :class:`TokenContext` of current thread or asyncio task
+    """
+    return _token_context.get()
+
+
+def set_token_context(context: TokenContext) -> "contextvars.Token[TokenContext]":
+    """
+    Set the :class:`TokenContext` of current thread or asyncio task.
+
+    :return: a token which can be passed to :func:`reset_token_context` to restore the previous context
+    """
+    return _token_context.set(context)
+
+
+def reset_token_context(token: "contextvars.Token[TokenContext]") -> None:
+    _token_context.reset(token)
+
+
+@contextlib.contextmanager
+def token_context(
+    precision: Optional[int] = None,
+    rounding: Optional[str] = None,
+    float_warning: Optional[WarningPolicy] = None,
+    negative_warning: Optional[WarningPolicy] = None,
+) -> Iterator[TokenContext]:
+    """
+    A context manager which temporarily replaces fields of current :class:`TokenContext`
+
+    >>> from cfx_utils.token_unit import CFX
+    >>> from cfx_utils.token_context import token_context
+    >>> with token_context(negative_warning="error"):
+    ...     CFX(-1)
+    Traceback (most recent call last):
+        ...
+    cfx_utils.exceptions.NegativeTokenValueWarning: ...
+    """
+    context = _token_context.get().replace(precision, rounding, float_warning, negative_warning)
+    token = _token_context.set(context)
+    try:
+        yield context
+    finally:
+        _token_context.reset(token)
+
+
+_PACKAGE_PREFIX = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+def _user_stacklevel() -> int:
+    """
+    The stacklevel for :func:`warnings.warn` called by :func:`emit_warning`
+    pointing to the first frame outside cfx_utils, which is where the token operation is done
+    """
+    # level 1 is emit_warning itself
+    level = 1
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_PREFIX):
+        frame = frame.f_back
+        level += 1
+    return level
+
+
+def emit_warning(policy: WarningPolicy, message: str, category: Type[Warning]) -> None:
+    """
+    Handle a token value warning according to the policy
+    """
+    if policy == "warn":
+        warnings.warn(message, category, stacklevel=_user_stacklevel())
+    elif policy == "error":
+        raise category(message)
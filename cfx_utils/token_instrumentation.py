@@ -0,0 +1,288 @@
+import collections
+import functools
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    NamedTuple,
+    Tuple,
+)
+
+from cfx_utils.decorators import (
+    combomethod,
+)
+from cfx_utils.exceptions import (
+    InvalidTokenOperation,
+)
+from cfx_utils.token_context import (
+    _token_context,
+)
+from cfx_utils.token_unit import (
+    AbstractBaseTokenUnit,
+    AbstractDerivedTokenUnit,
+    AbstractTokenUnit,
+)
+
+# the instrumented attributes of each class and the event they are counted as
+# `<=` and `>=` are implemented by `__gt__` and `__lt__`, so they are counted as the latter
+_INSTRUMENTED_ATTRIBUTES: Tuple[Tuple[type, Dict[str, str]], ...] = (
+    (AbstractTokenUnit, {
+        "to": "to",
+        "to_base_unit": "to_base_unit",
+        "__eq__": "__eq__",
+        "__lt__": "__lt__",
+        "__gt__": "__gt__",
+        "__add__": "__add__",
+        "__radd__": "__radd__",
+        "__sub__": "__sub__",
+        "__mul__": "__mul__",
+        "__rmul__": "__rmul__",
+        "__truediv__": "__truediv__",
+        "from_base_int_unchecked": "from_base_int_unchecked",
+        "interned": "interned",
+        "_to_base_int": "precision_check",
+        "_warn_float_value": "float_warning",
+        "_warn_negative_token_value": "negative_warning",
+    }),
+    (AbstractDerivedTokenUnit, {
+        "__init__": "__init__",
+        # a decimal.Decimal is created every time the value of a derived unit is read
+        "value": "decimal",
+    }),
+    (AbstractBaseTokenUnit, {
+        "__init__": "__init__",
+        "_to_base_int": "precision_check",
+        "from_hex_many": "from_hex_many",
+    }),
+)
+
+
+# the methods are replaced process-wide once, and the installed wrappers count for every enabled instance
+# guards the installation and _active
+_install_lock = threading.Lock()
+_originals: List[Tuple[type, str, Any]] = []
+# replaced rather than mutated, so the wrappers read it without the lock
+_active: Tuple["TokenInstrumentation", ...] = ()
+
+
+def _unit_of(cls_or_self: Any) -> type:
+    return cls_or_self if isinstance(cls_or_self, type) else type(cls_or_self)
+
+
+class TokenEventStats(NamedTuple):
+    count: int
+    errors: int
+    time_ns: int
+
+
+class TokenInstrumentation:
+    """
+    Opt-in counters of token operations in :mod:`cfx_utils.token_unit`, grouped by token unit class.
+    When any instance is enabled, the methods of the abstract token unit classes are replaced by wrappers
+    counting for every enabled instance.
+    When all instances are disabled (the default), the original methods are restored, so there is no overhead at all.
+
+    The counted events are conversions (`to`, `to_base_unit`), operators, constructor paths
+    (`__init__`, `interned`, `from_base_int_unchecked`, `from_hex_many`), `decimal` which is a
+    :class:`decimal.Decimal` created from a derived unit value, `precision_check` which is a check whether
+    a number is representable in the base unit, and `float_warning`/`negative_warning` which are warnings emitted, i.e. not counted if the policy is "ignore".
+    Errors are the :class:`~cfx_utils.exceptions.InvalidTokenOperation` raised by an event.
+    Counts might be slightly lower than the truth when many threads operate token values concurrently.
+
+    >>> from cfx_utils.token_unit import CFX
+    >>> from cfx_utils.token_instrumentation import token_instrumentation
+    >>> token_instrumentation.enable()
+    >>> CFX(1).to("Drip")
+    1000000000000000000 Drip
+    >>> token_instrumentation.disable()
+    >>> token_instrumentation.snapshot()["CFX"]
+    {'__init__': TokenEventStats(count=1, errors=0, time_ns=0), 'precision_check': TokenEventStats(count=1, errors=0, time_ns=0), ...}
+    """
+
+    def __init__(self) -> None:
+        self._timing = False
+        # keyed by (token unit class, event)
+        self._counts: DefaultDict[Tuple[type, str], int] = collections.defaultdict(int)
+        self._errors: DefaultDict[Tuple[type, str], int] = collections.defaultdict(int)
+        self._time_ns: DefaultDict[Tuple[type, str], int] = collections.defaultdict(int)
+
+    @property
+    def enabled(self) -> bool:
+        return self in _active
+
+    @property
+    def timing(self) -> bool:
+        return self._timing
+
+    def enable(self, timing: bool = False) -> None:
+        """
+        Start counting token operations. If already enabled, the instrumentation is reinstalled with `timing`.
+
+        :param bool timing: whether to also measure the time spent in each event,
+            which costs 2 extra clock reads per event
+        """
+        global _active
+        with _install_lock:
+            self._timing = timing
+            if self not in _active:
+                _active += (self,)
+            _reinstall()
+
+    def disable(self) -> None:
+        """
+        Stop counting. The original methods are restored when no instance is enabled. The collected counters are kept.
+        """
+        global _active
+        with _install_lock:
+            _active = tuple(instrumentation for instrumentation in _active if instrumentation is not self)
+            _reinstall()
+
+    def reset(self) -> None:
+        """
+        Clear the collected counters
+        """
+        self._counts.clear()
+        self._errors.clear()
+        self._time_ns.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, TokenEventStats]]:
+        """
+        :return: the collected counters as `{unit_name: {event: TokenEventStats}}`
+        """
+        result: Dict[str, Dict[str, TokenEventStats]] = {}
+        for key, count in list(self._counts.items()):
+            unit, event = key
+            result.setdefault(unit.__name__, {})[event] = TokenEventStats(
+                count, self._errors.get(key, 0), self._time_ns.get(key, 0)
+            )
+        return result
+
+    def to_prometheus(self, prefix: str = "cfx_utils_token") -> str:
+        """
+        :return: the collected counters in Prometheus text exposition format
+        """
+        snapshot = self.snapshot()
+        metrics = (
+            ("events_total", "Number of token events by unit and event", lambda stats: stats.count),
+            ("errors_total", "Number of InvalidTokenOperation raised by unit and event", lambda stats: stats.errors),
+        )
+        if self._timing:
+            metrics += (
+                ("event_seconds_total", "Time spent in token events by unit and event", lambda stats: stats.time_ns / 1e9),
+            )
+        lines: List[str] = []
+        for suffix, description, getter in metrics:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for unit, events in sorted(snapshot.items()):
+                for event, stats in sorted(events.items()):
+                    lines.append(
+                        f'{name}{{unit="{_escape_label(unit)}",event="{_escape_label(event)}"}} {getter(stats)}'
+                    )
+        return "\n".join(lines) + "\n"
+
+
+
+def _reinstall() -> None:
+    """
+    Install the wrappers for the enabled instances, or restore the original methods if none is enabled.
+    Must be called with _install_lock held.
+    """
+    for cls, name, original in reversed(_originals):
+        setattr(cls, name, original)
+    _originals.clear()
+    if not _active:
+        return
+    # the time is measured if any instance needs it
+    timing = any(instrumentation._timing for instrumentation in _active)
+    for cls, attributes in _INSTRUMENTED_ATTRIBUTES:
+        for name, event in attributes.items():
+            original = cls.__dict__[name]
+            setattr(cls, name, _instrument(original, event, timing))
+            _originals.append((cls, name, original))
+
+
+def _instrument(original: Any, event: str, timing: bool) -> Any:
+    if isinstance(original, property):
+        return property(
+            _wrap(original.fget, event, timing), original.fset, original.fdel, original.__doc__  # type: ignore
+        )
+    if isinstance(original, classmethod):
+        return classmethod(_wrap(original.__func__, event, timing))
+    if isinstance(original, combomethod):
+        return combomethod(_wrap(original.method, event, timing))
+    return _wrap(original, event, timing)
+
+
+def _wrap(func: Callable[..., Any], event: str, timing: bool) -> Callable[..., Any]:
+    # warning checks are called on every construction, so only the warnings emitted by the policy are counted
+    if event == "float_warning":
+        @functools.wraps(func)
+        def warning_wrapper(cls_or_self: Any, value: Any) -> Any:
+            if isinstance(value, float) and _token_context.get().float_warning != "ignore":
+                key = (_unit_of(cls_or_self), event)
+                for instrumentation in _active:
+                    instrumentation._counts[key] += 1
+            return func(cls_or_self, value)
+        return warning_wrapper
+    if event == "negative_warning":
+        @functools.wraps(func)
+        def warning_wrapper(cls_or_self: Any, value: Any) -> Any:
+            if value < 0 and _token_context.get().negative_warning != "ignore":
+                key = (_unit_of(cls_or_self), event)
+                for instrumentation in _active:
+                    instrumentation._counts[key] += 1
+            return func(cls_or_self, value)
+        return warning_wrapper
+
+    if not timing:
+        @functools.wraps(func)
+        def wrapper(cls_or_self: Any, *args: Any, **kwargs: Any) -> Any:
+            key = (_unit_of(cls_or_self), event)
+            # the same instances are counted for the whole event even if _active is replaced meanwhile
+            active = _active
+            for instrumentation in active:
+                instrumentation._counts[key] += 1
+            try:
+                return func(cls_or_self, *args, **kwargs)
+            except InvalidTokenOperation:
+                for instrumentation in active:
+                    instrumentation._errors[key] += 1
+                raise
+        return wrapper
+
+    perf_counter_ns = time.perf_counter_ns
+    @functools.wraps(func)
+    def timing_wrapper(cls_or_self: Any, *args: Any, **kwargs: Any) -> Any:
+        key = (_unit_of(cls_or_self), event)
+        active = _active
+        for instrumentation in active:
+            instrumentation._counts[key] += 1
+        start = perf_counter_ns()
+        try:
+            return func(cls_or_self, *args, **kwargs)
+        except InvalidTokenOperation:
+            for instrumentation in active:
+                instrumentation._errors[key] += 1
+            raise
+        finally:
+            elapsed = perf_counter_ns() - start
+            for instrumentation in active:
+                if instrumentation._timing:
+                    instrumentation._time_ns[key] += elapsed
+    return timing_wrapper
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+token_instrumentation = TokenInstrumentation()
+"""
+The global :class:`TokenInstrumentation`, which is disabled by default
+"""
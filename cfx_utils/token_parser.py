@@ -0,0 +1,189 @@
+import re
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from cfx_utils.exceptions import (
+    InvalidTokenValuePrecision,
+    InvalidTokenValueType,
+    TokenUnitNotFound,
+    TokenUnitNotMatch,
+)
+from cfx_utils.token_unit import (
+    AbstractBaseTokenUnit,
+    AbstractTokenUnit,
+    Drip,
+)
+
+# a fixed-point number optionally followed by a unit name, e.g. "1.5 CFX", "-.5cfx" or "30"
+# re.ASCII so that only ASCII digits and spaces are accepted as the fast path does, e.g. not "١٢ CFX"
+_AMOUNT_PATTERN = re.compile(
+    r"\s*(?P<sign>[+-]?)(?P<integer>\d*)(?:\.(?P<fraction>\d*))?\s*(?P<unit>[A-Za-z_][A-Za-z0-9_]*)?\s*",
+    re.ASCII,
+)
+_SCIENTIFIC_PATTERN = re.compile(r"\d\.?\d*[eE][+-]?\d", re.ASCII)
+
+# token unit family -> {unit_name: (unit, decimals)} of the unit names found in parsed amounts
+# registered names are never removed or changed, so the entries are always valid
+_unit_caches: Dict[Type[AbstractBaseTokenUnit], Dict[str, Tuple[Type[AbstractTokenUnit[Any]], int]]] = {}
+
+
+def _invalid_amount(amount: Any) -> InvalidTokenValueType:
+    if isinstance(amount, str) and _SCIENTIFIC_PATTERN.search(amount):
+        return InvalidTokenValueType(
+            f"Scientific notation is not supported in amount {amount!r}, use a fixed-point number such as '1.5 CFX'"
+        )
+    return InvalidTokenValueType(f"{amount!r} is not a valid amount, which is expected to be like '1.5 CFX'")
+
+
+def _parse_base_int(
+    amount: str,
+    unit_cache: Dict[str, Tuple[Type[AbstractTokenUnit[Any]], int]],
+    family: Type[AbstractBaseTokenUnit],
+) -> Tuple[Type[AbstractTokenUnit[Any]], int]:
+    """
+    Parse an amount of any accepted form to its unit and base unit integer.
+    Found units are cached in `unit_cache` as `unit_name -> (unit, decimals)`, where amounts without a unit name use `""`.
+    """
+    if not isinstance(amount, str):
+        raise InvalidTokenValueType(f"An amount is expected to be a str, received {type(amount)} {amount!r}")
+    match = _AMOUNT_PATTERN.fullmatch(amount)
+    if match is None:
+        raise _invalid_amount(amount)
+    sign, integer, fraction, unit_name = match.group("sign", "integer", "fraction", "unit")
+    if not integer and not fraction:
+        raise _invalid_amount(amount)
+
+    entry = unit_cache.get(unit_name or "")
+    if entry is None:
+        if unit_name is None:
+            raise InvalidTokenValueType(f"The unit of amount {amount!r} is not specified")
+        # a unit name starting with an exponent, e.g. "e18" of "1e18" or "E5CFX" of "1E5CFX", is not a unit
+        if _SCIENTIFIC_PATTERN.search(amount):
+            raise _invalid_amount(amount)
+        unit = family._registry.get(unit_name)
+        if unit is None:
+            raise TokenUnitNotFound(
+                f"{unit_name} in amount {amount!r} is not a registered unit of {family.__name__}"
+            )
+        entry = unit_cache[unit_name] = (unit, unit._decimals)
+
+    unit, decimals = entry
+    if fraction:
+        if len(fraction) > decimals:
+            # trailing zeros do not change the value
+            fraction = fraction.rstrip("0")
+            if len(fraction) > decimals:
+                raise InvalidTokenValuePrecision(
+                    f"Amount {amount!r} has {len(fraction)} fractional digits, "
+                    f"but {unit.__name__} supports at most {decimals}"
+                )
+        # the fixed-point string is shifted to an exact integer of the base unit by padding zeros
+        digits = integer + fraction + "0" * (decimals - len(fraction))
+    else:
+        digits = integer + "0" * decimals
+    try:
+        base_value = int(digits)
+    except ValueError:
+        # exceeds the limit of int string conversion (sys.get_int_max_str_digits)
+        raise InvalidTokenValueType(
+            f"Amount {amount[:32]!r}... has {len(digits)} digits in {unit.__name__}, which is too many"
+        )
+    return unit, -base_value if sign == "-" else base_value
+
+
+def parse_amount(
+    amount: str,
+    family: Type[AbstractBaseTokenUnit] = Drip,
+    default_unit: Optional[Type[AbstractTokenUnit[Any]]] = None,
+) -> AbstractTokenUnit[Any]:
+    """
+    Parse a human readable amount such as "1.5 CFX" or "30 GDrip" to a token object in the unit.
+    The fixed-point number is converted to an exact integer of the base unit directly,
+    without creating any :class:`decimal.Decimal` or float.
+    Unit names and aliases are looked up case-insensitively in the registry of the token unit family.
+
+    :param str amount: a fixed-point number followed by an optional unit name
+    :param Type[AbstractBaseTokenUnit] family: the base unit of the token unit family, defaults to :class:`~cfx_utils.token_unit.Drip`
+    :param Optional[Type[AbstractTokenUnit]] default_unit: the unit of amounts without a unit name
+    :raises InvalidTokenValueType: the amount is not a str of a fixed-point number, uses scientific notation,
+        has too many digits, or has no unit name while `default_unit` is not specified
+    :raises InvalidTokenValuePrecision: the amount has more fractional digits than the decimals of the unit
+    :raises TokenUnitNotFound: the unit name is not registered in the token unit family
+    :raises TokenUnitNotMatch: `default_unit` is not in the token unit family
+    :raises NegativeTokenValueWarning: the amount is less than :const:`0`
+
+    >>> from cfx_utils.token_parser import parse_amount
+    >>> parse_amount("1.5 CFX")
+    1.5 CFX
+    >>> parse_amount("30gdrip")
+    30 GDrip
+    >>> parse_amount("1e18 Drip")
+    Traceback (most recent call last):
+        ...
+    cfx_utils.exceptions.InvalidTokenValueType: Scientific notation is not supported in amount '1e18 Drip', use a fixed-point number such as '1.5 CFX'
+    """
+    return parse_amounts((amount,), family, default_unit)[0]
+
+
+def parse_amounts(
+    amounts: Iterable[str],
+    family: Type[AbstractBaseTokenUnit] = Drip,
+    default_unit: Optional[Type[AbstractTokenUnit[Any]]] = None,
+) -> List[AbstractTokenUnit[Any]]:
+    """
+    Parse human readable amounts in batch, which is the same as calling :func:`parse_amount` on each amount,
+    but amounts in the form of "<digits>[.<digits>] <unit name>" skip the regex matching.
+
+    :raises InvalidTokenValueType: any of the amounts is invalid, see :func:`parse_amount`
+    :raises InvalidTokenValuePrecision: any of the amounts has too many fractional digits
+    :raises TokenUnitNotFound: any of the unit names is not registered in the token unit family
+
+    >>> from cfx_utils.token_parser import parse_amounts
+    >>> parse_amounts(["1 CFX", "0.5 cfx", "20 GDrip"])
+    [1 CFX, 0.5 CFX, 20 GDrip]
+    """
+    unit_cache = _unit_caches.get(family)
+    if unit_cache is None:
+        # atomic, so concurrent first calls share one cache
+        unit_cache = _unit_caches.setdefault(family, {})
+    if default_unit is not None:
+        if default_unit._base_unit is not family:
+            raise TokenUnitNotMatch(f"{default_unit} is not a unit of {family.__name__}")
+        unit_cache = {**unit_cache, "": (default_unit, default_unit._decimals)}
+    results: List[AbstractTokenUnit[Any]] = []
+    append = results.append
+    for amount in amounts:
+        # fast path for the canonical form "<digits>[.<digits>] <unit>" with a seen unit,
+        # which needs no regex and is the same as _from_base_int inlined
+        try:
+            number, _, unit_name = amount.partition(" ")
+            entry = unit_cache.get(unit_name)
+            integer, _, fraction = number.partition(".")
+            if (
+                entry is not None
+                and integer.isdigit() and integer.isascii()
+                and (not fraction or (fraction.isdigit() and fraction.isascii()))
+                and len(fraction) <= entry[1]
+            ):
+                unit, decimals = entry
+                instance = unit.__new__(unit)
+                instance._base_value = int(integer + fraction + "0" * (decimals - len(fraction)))
+                append(instance)
+                continue
+        except (AttributeError, TypeError, ValueError):
+            # not a str or too many digits, which is reported by _parse_base_int
+            pass
+        unit, base_value = _parse_base_int(amount, unit_cache, family)
+        if base_value < 0:
+            # warns according to the token context
+            append(unit._from_operation_result(base_value))
+        else:
+            append(unit._from_base_int(base_value))
+    return results
@@ -11,11 +11,27 @@ from typing import (
     Generic,
     Callable,
     ClassVar,
+    Tuple,
+    Iterable,
+    List,
+    Mapping,
+    AsyncIterable,
+    AsyncIterator,
+    NamedTuple,
+    Optional,
+)
+from collections import (
+    OrderedDict,
 )
 
 import decimal
 import numbers
 import functools
+import itertools
+import sys
+import threading
+import types
+import weakref
 from typing_extensions import (
     Self,
     ParamSpec,
@@ -23,6 +39,10 @@ from typing_extensions import (
 )
 import warnings
 from cfx_utils.decorators import combomethod
+from cfx_utils.token_context import (
+    _token_context,
+    emit_warning,
+)
 from cfx_utils.exceptions import (
     DangerEqualWarning,
     InvalidTokenValueType,
@@ -32,6 +52,7 @@ from cfx_utils.exceptions import (
     FloatWarning,
     NegativeTokenValueWarning,
     TokenUnitNotFound,
+    TokenError,
 )
 
 BaseTokenUnit = TypeVar("BaseTokenUnit", bound="AbstractBaseTokenUnit")
@@ -72,13 +93,251 @@ def warn_float_value(func: Callable[P, T]) -> Callable[P, T]:
     @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         assert len(args) == 2
-        cls_or_self = args[0]
-        cls_or_self._warn_float_value(args[1])  # type: ignore
+        if isinstance(args[1], float):
+            cls_or_self = args[0]
+            cls_or_self._warn_float_value(args[1])  # type: ignore
         return func(*args, **kwargs)
 
     return wrapper
 
 
+def _as_integer_ratio(value: Union[int, decimal.Decimal, float, str]) -> Tuple[int, int]:
+    """
+    Return the exact (numerator, denominator) pair of a number, the denominator is always positive.
+
+    :raises InvalidTokenValueType: value is not a finite number
+    """
+    if isinstance(value, int):
+        return value, 1
+    try:
+        if not isinstance(value, (float, decimal.Decimal)):
+            value = decimal.Decimal(value)
+        return value.as_integer_ratio()
+    except (ArithmeticError, ValueError, TypeError):
+        raise InvalidTokenValueType(
+            f"Not able to operate token value with {type(value)} {value}. "
+            f"{int} or {decimal.Decimal} typed value is recommended"
+        )
+
+
+def _base_int_to_decimal(value: int, decimals: int, scale: int) -> decimal.Decimal:
+    """
+    Exactly convert an amount of base unit to a :class:`decimal.Decimal` in a unit with `decimals`.
+    The conversion is not affected by the precision of current decimal context,
+    and trailing zeros of the fraction part are removed, e.g. 10**18 Drip -> Decimal('1') CFX
+
+    :param int scale: should be `10**decimals`, which is precomputed as :attr:`AbstractTokenUnit._scale`
+    """
+    quotient, remainder = divmod(value, scale)
+    if not remainder:
+        return decimal.Decimal(quotient)
+    if value < 0:
+        sign = "-"
+        value = -value
+    else:
+        sign = ""
+    digits = str(value).rjust(decimals + 1, "0")
+    integer_part = digits[:-decimals]
+    fraction_part = digits[-decimals:].rstrip("0")
+    if fraction_part:
+        return decimal.Decimal(f"{sign}{integer_part}.{fraction_part}")
+    return decimal.Decimal(f"{sign}{integer_part}")
+
+
+# rounding functions of a non-negative quotient `q` with a non-zero remainder `r` of divisor `d`,
+# `negative` is whether the rounded number is negative
+_ROUNDINGS: Dict[str, Callable[[int, int, int, bool], int]] = {
+    decimal.ROUND_DOWN: lambda q, r, d, negative: q,
+    decimal.ROUND_UP: lambda q, r, d, negative: q + 1,
+    decimal.ROUND_HALF_UP: lambda q, r, d, negative: q + (2 * r >= d),
+    decimal.ROUND_HALF_DOWN: lambda q, r, d, negative: q + (2 * r > d),
+    decimal.ROUND_HALF_EVEN: lambda q, r, d, negative: q + (2 * r > d or (2 * r == d and q % 2 == 1)),
+    decimal.ROUND_CEILING: lambda q, r, d, negative: q + (not negative),
+    decimal.ROUND_FLOOR: lambda q, r, d, negative: q + negative,
+    decimal.ROUND_05UP: lambda q, r, d, negative: q + (q % 5 == 0),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _get_formatter(
+    unit: Type["AbstractTokenUnit[Any]"],
+    decimals: Optional[int],
+    separator: str,
+    rounding: str,
+    trim: bool,
+    with_unit: bool,
+) -> Callable[[int], str]:
+    """
+    Return a function formatting an amount of base unit as a fixed-point string in `unit`.
+    The format parameters are computed once for each combination of arguments.
+
+    :raises ValueError: `decimals` is negative or `rounding` is not a rounding mode of :mod:`decimal`
+    """
+    unit_decimals = unit._decimals
+    if decimals is None:
+        decimals, trim = unit_decimals, True
+    if decimals < 0:
+        raise ValueError(f"decimals should be a non-negative integer, received {decimals}")
+    if rounding not in _ROUNDINGS:
+        raise ValueError(f"{rounding!r} is not a rounding mode of {decimal}")
+    round_quotient = _ROUNDINGS[rounding]
+    # the number is represented as an integer of 10**-decimals unit before formatting
+    divisor = 10 ** (unit_decimals - decimals) if decimals < unit_decimals else 1
+    multiplier = 10 ** (decimals - unit_decimals) if decimals > unit_decimals else 1
+    fraction_scale = 10**decimals
+    suffix = f" {unit.__name__}" if with_unit else ""
+
+    def formatter(base_value: int) -> str:
+        negative = base_value < 0
+        magnitude = -base_value if negative else base_value
+        if divisor == 1:
+            quotient = magnitude * multiplier
+        else:
+            quotient, remainder = divmod(magnitude, divisor)
+            if remainder:
+                quotient = round_quotient(quotient, remainder, divisor, negative)
+        integer, fraction = divmod(quotient, fraction_scale)
+        if separator:
+            text = f"{integer:,}"
+            if separator != ",":
+                text = text.replace(",", separator)
+        else:
+            text = str(integer)
+        if decimals:
+            # zero padded without parsing a format spec, e.g. 10000 + 12 -> "10012" -> "0012"
+            fraction_text = str(fraction_scale + fraction)[1:]
+            if trim:
+                fraction_text = fraction_text.rstrip("0")
+            if fraction_text:
+                text = f"{text}.{fraction_text}"
+        if negative and quotient:
+            text = "-" + text
+        return text + suffix
+
+    return formatter
+
+
+def _format_unit(
+    base_unit: Type["AbstractBaseTokenUnit"], unit: Union[str, Type["AbstractTokenUnit[Any]"]]
+) -> Type["AbstractTokenUnit[Any]"]:
+    """
+    Resolve the unit to format a token value of the token unit family in
+
+    :raises TokenUnitNotFound: `unit` is a name not registered in the token unit family
+    :raises TokenUnitNotMatch: `unit` is not in the token unit family
+    """
+    if isinstance(unit, str):
+        found = base_unit._registry.get(unit)
+        if found is None:
+            raise TokenUnitNotFound(f"Cannot format {base_unit} values in {unit} because {unit} is not registered")
+        return found
+    if unit._base_unit is not base_unit:
+        raise TokenUnitNotMatch(f"Cannot format {base_unit} values in {unit} because of different token unit")
+    return unit
+
+
+def _warn_value_setter() -> None:
+    # called by the value setters, stacklevel 3 points to the assignment in user code
+    warnings.warn(
+        "Setting the value of a token object is deprecated, as token objects are hashable and might be shared. "
+        "Create a new token object instead",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def _grouping_separator(grouping: Union[bool, str]) -> str:
+    if grouping is True:
+        return ","
+    return grouping or ""
+
+
+# token values are encoded as uint256, the type of value fields in Conflux transactions and ABI
+UINT256_SIZE = 32
+_UINT256_LIMIT = 1 << 256
+
+
+def _uint256_error(value: int) -> InvalidTokenValueType:
+    if value < 0:
+        return InvalidTokenValueType(f"Negative token value {value} cannot be encoded as uint256")
+    return InvalidTokenValueType(f"Token value {value} overflows uint256")
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    """
+    Append the unsigned LEB128 encoding of a uint256 value to `out`
+
+    :raises InvalidTokenValueType: the value is negative or overflows uint256
+    """
+    if value < 0 or value >= _UINT256_LIMIT:
+        raise _uint256_error(value)
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[int, int]:
+    """
+    Decode an unsigned LEB128 value starting at `offset`
+
+    :return: the value and the offset after it
+    :raises InvalidTokenValueType: the data is truncated or the value overflows uint256
+    """
+    value = 0
+    shift = 0
+    try:
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+            if shift >= 256:
+                # a uint256 takes at most 37 bytes, stop before reading more of a malicious input
+                raise InvalidTokenValueType("Varint token value overflows uint256")
+    except IndexError:
+        raise InvalidTokenValueType("Truncated varint token value")
+    if value >= _UINT256_LIMIT:
+        raise _uint256_error(value)
+    return value, offset
+
+
+def _parse_hex_quantities(values: Iterable[str]) -> List[int]:
+    """
+    Parse JSON-RPC hex quantities (e.g. "0x1f") to integers in one pass.
+    A hex quantity can only go wrong by missing the "0x" prefix or containing non-hex characters,
+    and it is never negative or fractional, so no other check is done.
+    `int(value, 16)` also accepts underscores, whitespace and non-ASCII digits,
+    so the values are checked to be ASCII letters and digits only, all at once on the joined string.
+
+    :raises InvalidTokenValueType: any of the values is not a hex quantity
+    """
+    values = values if isinstance(values, list) else list(values)
+    if not values:
+        return []
+    try:
+        joined = "".join(values)
+        if (
+            joined.isascii() and joined.isalnum()
+            and all(map(str.startswith, values, itertools.repeat("0x")))
+        ):
+            return list(map(int, values, itertools.repeat(16)))
+    except (TypeError, ValueError):
+        pass
+    # locate the invalid value only when the fast path fails
+    for value in values:
+        try:
+            if value.startswith("0x") and value.isascii() and value.isalnum():
+                int(value, 16)
+                continue
+        except (AttributeError, TypeError, ValueError):
+            pass
+        raise InvalidTokenValueType(f"{value!r} is not a valid hex quantity")
+    raise InvalidTokenValueType("Unreachable")
+
+
 class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
     """
     :class:`~AbstractTokenUnit` provides the implementation of token units computing operations,
@@ -100,6 +359,10 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
     cfx_utils.exceptions.InvalidTokenOperation: ...
     """
 
+    # token objects only hold the base unit integer,
+    # subclasses should also declare empty __slots__ so that no per-instance __dict__ is created
+    __slots__ = ("_base_value",)
+
     _decimals: ClassVar[int]
     """
     The class variable to defining relation between current token unit and :attr:`~_base_unit`.
@@ -118,7 +381,29 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
     >>> CFX._base_unit
     <class 'cfx_utils.token_unit.Drip'>
     """
-    _value: Union[int, decimal.Decimal]
+    _scale: ClassVar[int]
+    """
+    The conversion factor from current token unit to :attr:`~_base_unit`, i.e. `10**_decimals`.
+    It is precomputed when the token unit is registered by :meth:`AbstractBaseTokenUnit.register_derived_unit`.
+
+    >>> from cfx_utils import CFX
+    >>> CFX._scale
+    1000000000000000000
+    """
+    _inexact_error: ClassVar[Type[TokenError]]
+    """
+    The error type raised if a value cannot be exactly represented by the token unit
+    """
+    _base_value: int
+    """
+    The token value stored as an exact integer count of :attr:`~_base_unit`.
+    All operations inside a token unit family are done on this integer,
+    and :class:`decimal.Decimal` is only created when :attr:`value` or :meth:`__str__` is visited.
+
+    >>> from cfx_utils import CFX
+    >>> CFX(1)._base_value
+    1000000000000000000
+    """
 
     @abc.abstractmethod
     def __init__(
@@ -126,19 +411,146 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         value: Union["AbstractTokenUnit[BaseTokenUnit]", int, decimal.Decimal, float],
     ):
         if isinstance(value, AbstractTokenUnit):
-            if self._decimals == 0:
-                self._value = value.to_base_unit().value
-            else:
-                self._value = decimal.Decimal(value.to_base_unit().value) / decimal.Decimal(10**self._decimals)
+            if value._base_unit is not self._base_unit:
+                raise TokenUnitNotMatch(
+                    f"Cannot init {type(self)} with {value} because of different base token unit"
+                )
+            self._base_value = value._base_value
             return
         elif isinstance(value, float):
             raise Exception("unreachable")
         else:
-            self._value = value
+            self._base_value = self._to_base_int(value)
+
+    @classmethod
+    def _from_base_int(cls, value: int) -> Self:
+        """
+        Create a token object directly from an amount of :attr:`~_base_unit` without any check.
+        It is used to wrap results of internal operations whose precision is already guaranteed.
+        """
+        instance = cls.__new__(cls)
+        instance._base_value = value
+        return instance
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the token value as a 32-byte big-endian uint256 of :attr:`~_base_unit`.
+        Use :func:`~cfx_utils.token_codec.encode_many` to encode token values in batch.
+
+        :raises InvalidTokenValueType: the token value is negative or overflows uint256
+
+        >>> from cfx_utils.token_unit import Drip
+        >>> Drip(1).to_bytes().hex()
+        '0000000000000000000000000000000000000000000000000000000000000001'
+        """
+        try:
+            return self._base_value.to_bytes(UINT256_SIZE, "big")
+        except OverflowError:
+            raise _uint256_error(self._base_value)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> Self:
+        """
+        Decode a token value from the 32-byte big-endian uint256 encoding, see :meth:`to_bytes`
+
+        :raises InvalidTokenValueType: the data is not 32 bytes
+        """
+        if len(data) != UINT256_SIZE:
+            raise InvalidTokenValueType(f"{UINT256_SIZE} bytes are expected to decode {cls}, received {len(data)}")
+        return cls._from_base_int(int.from_bytes(data, "big"))
+
+    def to_varint(self) -> bytes:
+        """
+        Encode the token value as an unsigned LEB128 varint of :attr:`~_base_unit`,
+        which is 1 byte for values less than 128 and at most 37 bytes.
+
+        :raises InvalidTokenValueType: the token value is negative or overflows uint256
+
+        >>> from cfx_utils.token_unit import GDrip
+        >>> GDrip(1).to_varint().hex()
+        '8094ebdc03'
+        """
+        out = bytearray()
+        _encode_varint(self._base_value, out)
+        return bytes(out)
+
+    @classmethod
+    def from_varint(cls, data: Union[bytes, bytearray, memoryview]) -> Self:
+        """
+        Decode a token value from the varint encoding, see :meth:`to_varint`
+
+        :raises InvalidTokenValueType: the data is not exactly one varint encoded uint256
+        """
+        value, end = _decode_varint(data, 0)
+        if end != len(data):
+            raise InvalidTokenValueType(f"{len(data) - end} unexpected trailing bytes after varint token value")
+        return cls._from_base_int(value)
+
+    @classmethod
+    def from_base_int_unchecked(cls, value: int) -> Self:
+        """
+        Create a token object from an amount of :attr:`~_base_unit` (e.g. Drip) skipping all value checks.
+        It is designed for values from authoritative sources such as a node's response,
+        which are known to be non-negative integers.
+        User supplied values should be passed to the constructor, which checks the value strictly.
+
+        :param int value: the token value in :attr:`~_base_unit`, which must be an int
+
+        >>> from cfx_utils.token_unit import CFX, Drip
+        >>> Drip.from_base_int_unchecked(10**18)
+        1000000000000000000 Drip
+        >>> CFX.from_base_int_unchecked(10**18)
+        1 CFX
+        """
+        return cls._from_base_int(value)
+
+    @classmethod
+    def _from_operation_result(cls, numerator: int, denominator: int = 1) -> Self:
+        """
+        Create a token object from the result of an arithmetic operation, which is `numerator / denominator` in :attr:`~_base_unit`.
+
+        :raises cls._inexact_error: the result is not an integer in :attr:`~_base_unit`
+        :raises NegativeTokenValueWarning: the result is less than :const:`0`
+        """
+        if denominator == 1:
+            value = numerator
+        else:
+            value, remainder = divmod(numerator, denominator)
+            if remainder:
+                raise cls._inexact_error(
+                    f"Not able to represent {numerator}/{denominator} {cls._base_unit} in {cls} due to unexpected precision"
+                )
+        instance = cls._from_base_int(value)
+        if value < 0:
+            cls._warn_negative_token_value(instance.value)
+        return instance
+
+    @classmethod
+    def _to_base_int(cls, value: Union[int, decimal.Decimal, str, float]) -> int:
+        """
+        Convert a number in current unit to an exact amount of :attr:`~_base_unit`.
+
+        :raises InvalidTokenValueType: the value is not a valid number
+        :raises cls._inexact_error: the value cannot be represented in :attr:`~_base_unit` exactly
+        """
+        cls._warn_float_value(value)
+        if isinstance(value, int):
+            base_value = value * cls._scale
+        else:
+            numerator, denominator = _as_integer_ratio(value)
+            base_value, remainder = divmod(numerator * cls._scale, denominator)
+            if remainder:
+                raise cls._inexact_error(
+                    f"Not able to initialize {cls} with {type(value)} {value} due to unexpected precision. "
+                    f"Try representing {value} in {decimal.Decimal} properly, or init token value in int from {cls._base_unit}"
+                )
+        if base_value < 0:
+            cls._warn_negative_token_value(_base_int_to_decimal(base_value, cls._decimals, cls._scale))
+        return base_value
 
     @property
-    def value(self):
-        return self._value
+    def value(self) -> Union[int, decimal.Decimal]:
+        return _base_int_to_decimal(self._base_value, self._decimals, self._scale)
 
     @overload
     def to(self, target_unit: str) -> "AbstractTokenUnit[BaseTokenUnit]":
@@ -165,36 +577,25 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         1000000000 GDrip
         >>> val.to("Drip")
         1000000000000000000 Drip
+        >>> val.to("gdrip")
+        1000000000 GDrip
         """
         # self -> base --> target
         if isinstance(target_unit, str):
-            target_unit = cast(
-                Type[AnyTokenUnit],
-                self._base_unit.get_derived_units_dict().get(target_unit, target_unit),
-            )
-            # if no type object is found,
-            if isinstance(target_unit, str):
+            found = self._base_unit._registry.get(target_unit)
+            if found is None:
                 raise TokenUnitNotFound(
                     f"Cannot convert {type(self)} to {target_unit} because {target_unit} is not registered"
                 )
+            target_unit = cast(Type[AnyTokenUnit], found)
         else:
-            if target_unit._base_unit != self._base_unit:
+            if target_unit._base_unit is not self._base_unit:
                 raise TokenUnitNotMatch(
                     f"Cannot convert {type(self)} to {target_unit} because of different token unit"
                 )
 
-        value = (
-            decimal.Decimal(self._value)
-            * decimal.Decimal(10**self._decimals)
-            / decimal.Decimal(10**target_unit._decimals)
-        )
-        if issubclass(target_unit, AbstractBaseTokenUnit):
-            if value % 1 != 0:
-                # expected to be unreachable because check is done when self is inited
-                raise InvalidTokenValuePrecision("Unreachable")
-
-        # conversion_factor = self._base_unit.derived_units_conversions[target_unit]
-        return cast(AnyTokenUnit, target_unit(value))
+        # the value is stored in base unit, so no arithmetic is required
+        return cast(AnyTokenUnit, target_unit._from_base_int(self._base_value))
 
     def to_base_unit(self) -> BaseTokenUnit:
         """
@@ -206,16 +607,93 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         >>> CFX(1).to_base_unit()
         1000000000000000000 Drip
         """
-        return self.to(self._base_unit)
+        return self._base_unit._from_base_int(self._base_value)
 
-    @combomethod
-    def _check_value(cls, value: Union[int, float, decimal.Decimal]) -> None:
-        return decimal.Decimal(value) * (10**cls._decimals) % 1 == 0
+    def format(
+        self,
+        unit: Optional[Union[str, Type["AbstractTokenUnit[BaseTokenUnit]"]]] = None,
+        decimals: Optional[int] = None,
+        grouping: Union[bool, str] = False,
+        rounding: Optional[str] = None,
+        trim: bool = False,
+        with_unit: bool = True,
+    ) -> str:
+        """
+        Format the token value as a fixed-point string, which is computed from the base unit integer
+        without creating a :class:`decimal.Decimal`.
+        Use :func:`format_many` to format a column of token values.
+
+        :param unit: the unit (or the name of the unit) to format in, defaults to the unit of the token value
+        :param Optional[int] decimals: the number of fractional digits.
+            If not specified, all significant fractional digits are kept
+        :param Union[bool,str] grouping: the thousands separator of the integer part, `True` for ","
+        :param Optional[str] rounding: a rounding mode of :mod:`decimal`, e.g. `decimal.ROUND_DOWN`,
+            defaults to the rounding of current :class:`~cfx_utils.token_context.TokenContext`
+        :param bool trim: whether to remove trailing zeros of the fractional digits
+        :param bool with_unit: whether to append the unit name
+        :raises TokenUnitNotMatch: `unit` is not in the same token unit family
+        :raises TokenUnitNotFound: `unit` is a name not registered in the token unit family
+        :raises ValueError: `decimals` is negative or `rounding` is invalid
+
+        >>> from cfx_utils.token_unit import CFX, Drip
+        >>> Drip(1234567890123456789012).format(CFX, decimals=4, grouping=True)
+        '1,234.5679 CFX'
+        >>> CFX(1).format(decimals=2)
+        '1.00 CFX'
+        """
+        target_unit = type(self) if unit is None else _format_unit(self._base_unit, unit)
+        formatter = _get_formatter(
+            target_unit,
+            decimals,
+            _grouping_separator(grouping),
+            rounding or _token_context.get().rounding,
+            trim,
+            with_unit,
+        )
+        return formatter(self._base_value)
+
+    @classmethod
+    def interned(
+        cls, value: Union[int, decimal.Decimal, str, float, "AbstractTokenUnit[BaseTokenUnit]"]
+    ) -> Self:
+        """
+        Return a shared token object from :data:`token_intern_cache` for frequently used values,
+        e.g. `Drip.interned(0)` or `GDrip.interned(20)`.
+        The value is checked as strictly as the constructor.
+        The returned object is shared, so setting its :attr:`value` raises an error.
+        The cache does not evict an object still referenced elsewhere, so it stays shared as long as it is used.
+
+        :raises InvalidTokenOperation: when the :attr:`value` of the returned object is set
+
+        >>> from cfx_utils.token_unit import GDrip
+        >>> GDrip.interned(20) is GDrip.interned(20)
+        True
+        """
+        if type(value) is int and value >= 0:
+            # fast path for the most common case, which needs no check
+            base_value = value * cls._scale
+        elif isinstance(value, AbstractTokenUnit):
+            if value._base_unit is not cls._base_unit:
+                raise TokenUnitNotMatch(
+                    f"Cannot init {cls} with {value} because of different base token unit"
+                )
+            base_value = value._base_value
+        else:
+            base_value = cls._to_base_int(value)
+        return token_intern_cache.get(cls, base_value)
+
+    def _ensure_mutable(self) -> None:
+        # interned objects are recognized by identity, as the caches keep the objects still referenced elsewhere
+        if TokenInternCache._shares(self):
+            raise InvalidTokenOperation(
+                f"{self!r} is an interned token object shared by others, which is not allowed to change value"
+            )
 
     @combomethod
     def _warn_float_value(cls, value: Any) -> None:
         if isinstance(value, float):
-            warnings.warn(
+            emit_warning(
+                _token_context.get().float_warning,
                 f"{float} {value} is used to init token value, which might result in potential precision problem",
                 FloatWarning,
             )
@@ -225,7 +703,8 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         cls, value: Union[int, float, decimal.Decimal]
     ) -> None:
         if value < 0:
-            warnings.warn(
+            emit_warning(
+                _token_context.get().negative_warning,
                 f"A negative value {value} is found to init token value, please check if it is expected.",
                 NegativeTokenValueWarning,
             )
@@ -250,10 +729,10 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         """
         if isinstance(other, AbstractTokenUnit):
             return (self._base_unit is other._base_unit) and (
-                self.to_base_unit().value == other.to_base_unit().value
+                self._base_value == other._base_value
             )
         if other == 0:
-            return self._value == 0
+            return self._base_value == 0
         if (
             isinstance(other, int)
             or isinstance(other, float)
@@ -270,16 +749,14 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         self,
         other: Union["AbstractTokenUnit[BaseTokenUnit]", Literal[0]],
     ) -> bool:
-        if type(self) == type(other):
-            return self._value < other._value  # type: ignore
         if isinstance(other, AbstractTokenUnit):
-            if self._base_unit != other._base_unit:
+            if self._base_unit is not other._base_unit:
                 raise TokenUnitNotMatch(
                     f"Cannot compare token value with different base unit {other._base_unit} and {self._base_unit}"
                 )
-            return self._value < self.__class__(other)._value
+            return self._base_value < other._base_value
         if other == 0:
-            return self._value < 0
+            return self._base_value < 0
         raise InvalidTokenOperation(
             f"not able to compare {self} and {other} because {other} is not a token unit"
         )
@@ -297,16 +774,14 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         self,
         other: Union["AbstractTokenUnit[BaseTokenUnit]", Literal[0]],
     ) -> bool:
-        if type(self) == type(other):
-            return self._value > other._value  # type: ignore
-        if other == 0:
-            return self._value > 0
         if isinstance(other, AbstractTokenUnit):
-            if self._base_unit != other._base_unit:
+            if self._base_unit is not other._base_unit:
                 raise TokenUnitNotMatch(
                     f"Cannot compare token value with different base unit {other._base_unit} and {self._base_unit}"
                 )
-            return self._value > self.__class__(other)._value
+            return self._base_value > other._base_value
+        if other == 0:
+            return self._base_value > 0
         raise InvalidTokenOperation(
             f"not able to compare {self} and {other} because {other} is not a token unit"
         )
@@ -320,10 +795,10 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         return not (self < other)
 
     def __str__(self):
-        return f"{self._value} {self.__class__.__name__}"
+        return f"{self.value} {self.__class__.__name__}"
 
     def __repr__(self):
-        return f"{self._value} {self.__class__.__name__}"
+        return f"{self.value} {self.__class__.__name__}"
 
     @overload
     def __add__(self, other: Self) -> Self:
@@ -363,23 +838,34 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         1000000001000000000 Drip
         """
         if isinstance(other, AbstractTokenUnit):
-            if other._base_unit != self._base_unit:
+            if other._base_unit is not self._base_unit:
                 raise TokenUnitNotMatch(
                     f"Cannot add token value with different base token unit {other._base_unit} and {self._base_unit}"
                 )
-            if other.__class__ != self.__class__:
-                return self.to_base_unit() + other.to_base_unit()
-            return self.__class__(
-                decimal.Decimal(self._value) + decimal.Decimal(other._value)
-            )
+            if other.__class__ is not self.__class__:
+                return self._base_unit._from_base_int(self._base_value + other._base_value)
+            return self._from_base_int(self._base_value + other._base_value)
         raise InvalidTokenValueType
         # return self + self.__class__(other)
 
-    # int/float/decimal.Decimal + CFX(1)
-    # @warn_float_value
-    # @token_operation_error
-    # def __radd__(self, other: Union[int, decimal.Decimal, float]) -> Self:
-    #     return self + other
+    # 0 + CFX(1), which makes builtin sum() work with token values
+    # other numbers are still not allowed to be added to token values
+    @token_operation_error
+    def __radd__(self, other: Literal[0]) -> Self:
+        """
+        :const:`0` is the identity of token value addition, which allows :func:`sum` to be used on token values.
+        Use :func:`~cfx_utils.token_accumulator.token_sum` to sum a large amount of token values more efficiently.
+
+        :raises InvalidTokenOperation: :obj:`other` is not :const:`0`
+
+        >>> from cfx_utils.token_unit import CFX
+        >>> sum([CFX(1), CFX(2)])
+        3 CFX
+        """
+        # exactly int, so False is not taken as 0
+        if type(other) is int and other == 0:
+            return self._from_base_int(self._base_value)
+        raise InvalidTokenValueType
 
     @overload
     def __sub__(self, other: Self) -> Self:
@@ -421,15 +907,13 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         -999999999000000000 Drip
         """
         if isinstance(other, AbstractTokenUnit):
-            if other._base_unit != self._base_unit:
+            if other._base_unit is not self._base_unit:
                 raise TokenUnitNotMatch(
                     f"Cannot add token value with different base token unit {other._base_unit} and {self._base_unit}"
                 )
-            if other.__class__ != self.__class__:
-                return self.to_base_unit() - other.to_base_unit()
-            return self.__class__(
-                decimal.Decimal(self._value) - decimal.Decimal(other._value)
-            )
+            if other.__class__ is not self.__class__:
+                return self._base_unit._from_operation_result(self._base_value - other._base_value)
+            return self._from_operation_result(self._base_value - other._base_value)
         raise InvalidTokenValueType
         # return self.__class__(self._value - decimal.Decimal(other))
 
@@ -463,7 +947,8 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
             raise InvalidTokenOperation(
                 f"{self.__class__} is not allowed to multiply a token unit"
             )
-        return self.__class__(self._value * decimal.Decimal(other))
+        numerator, denominator = _as_integer_ratio(other)
+        return self._from_operation_result(self._base_value * numerator, denominator)
 
     @warn_float_value
     @token_operation_error
@@ -472,7 +957,8 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
             raise InvalidTokenOperation(
                 f"{self.__class__} is not allowed to multiply a token unit"
             )
-        return self.__class__(self._value * decimal.Decimal(other))
+        numerator, denominator = _as_integer_ratio(other)
+        return self._from_operation_result(self._base_value * numerator, denominator)
 
     @overload
     def __truediv__(self, other: "AbstractTokenUnit[BaseTokenUnit]") -> decimal.Decimal:
@@ -505,24 +991,36 @@ class AbstractTokenUnit(Generic[BaseTokenUnit], numbers.Number):
         1 Drip
         """
         if isinstance(other, AbstractTokenUnit):
-            if other._base_unit != self._base_unit:
+            if other._base_unit is not self._base_unit:
                 raise TokenUnitNotMatch(
                     f"Cannot operate __div__ on token values with different base token unit {other._base_unit} and {self._base_unit}"
                 )
-            if other.__class__ != self.__class__:
-                return decimal.Decimal(
-                    self.to_base_unit().value / other.to_base_unit().value
-                )
-            return decimal.Decimal(self._value) / decimal.Decimal(other._value)
-        return self.__class__(self._value / decimal.Decimal(other))
+            # the ratio is irrelevant to the units
+            return _token_context.get().divide(
+                decimal.Decimal(self._base_value), decimal.Decimal(other._base_value)
+            )
+        numerator, denominator = _as_integer_ratio(other)
+        if numerator < 0:
+            numerator, denominator = -numerator, -denominator
+        return self._from_operation_result(self._base_value * denominator, numerator)
 
     def __hash__(self):
-        return hash(str(self))
+        """
+        Hash on the token unit family and the exact base unit value, which is consistent with :meth:`__eq__`.
+        Zero values hash as :const:`0` because they equal to :const:`0`.
+
+        >>> hash(CFX(1)) == hash(Drip(10**18))
+        True
+        """
+        if not self._base_value:
+            return 0
+        return hash((self._base_unit, self._base_value))
 
 
 class AbstractDerivedTokenUnit(AbstractTokenUnit[BaseTokenUnit]):
+    __slots__ = ()
     _decimals: ClassVar[int]
-    _value: decimal.Decimal
+    _inexact_error: ClassVar[Type[TokenError]] = InvalidTokenValuePrecision
 
     def __init__(
         self,
@@ -533,8 +1031,7 @@ class AbstractDerivedTokenUnit(AbstractTokenUnit[BaseTokenUnit]):
         if isinstance(value, AbstractTokenUnit):
             super().__init__(value)
             return
-        # set using value setter
-        self.value = value
+        self._base_value = self._to_base_int(value)
 
     @property
     def value(self) -> decimal.Decimal:
@@ -543,74 +1040,165 @@ class AbstractDerivedTokenUnit(AbstractTokenUnit[BaseTokenUnit]):
 
         :return decimal.Decimal: returns the token value
 
-        Can be set using an int, decimal.Decimal, str or float
+        Setting the value is deprecated because token objects are hashable and might be shared,
+        create a new token object instead, e.g. `CFX(0.5)`.
+        It can still be set using an int, decimal.Decimal, str or float
 
+        :raises DeprecationWarning: the value is set
         :raises FloatWarning: it is recommended to use decimal.Decimal,
             when a float-typed value is used to set value, a warning will be raised
         :raises InvalidTokenValueType: the value type is not int, Decimal, str or float
         :raises InvalidTokenValuePrecision: the value cannot be divided
             exactly by its base unit
+        :raises InvalidTokenOperation: the token object is shared by :meth:`~AbstractTokenUnit.interned`
 
         :examples:
 
         >>> from cfx_utils import CFX
-        >>> val = CFX(1)
-        >>> val.value = 0.5 # will raise a FloatWarning
-        >>> val
-        0.5 CFX
-        >>> val.value = 1/3
-        Traceback (most recent call last):
-            ...
-        cfx_utils.exceptions.InvalidTokenValuePrecision: Not able to initialize <class 'cfx_utils.token_unit.CFX'>
-        with <class 'decimal.Decimal'> 0.333333333333333314829616256247390992939472198486328125 due to unexpected precision.
-        Try representing 0.333333333333333314829616256247390992939472198486328125 in <class 'decimal.Decimal'> properly,
-        or init token value in int from <class 'cfx_utils.token_unit.Drip'>
+        >>> CFX(1).value
+        Decimal('1')
         """
-        return self._value
+        return _base_int_to_decimal(self._base_value, self._decimals, self._scale)
 
     @value.setter
     def value(self, value: Union[int, decimal.Decimal, str, float]) -> None:
-        self._warn_float_value(value)
-        cls = self.__class__
-        try:
-            value = decimal.Decimal(value)
-        except:
-            raise InvalidTokenValueType(
-                f"Not able to initialize {cls} with {type(value)} {value}. "
-                f"{int} or {decimal.Decimal} typed value is recommended"
-            )
-
+        self._ensure_mutable()
+        _warn_value_setter()
         # Token Value is of great importance, so we always check value validity
-        if not self._check_value(value):
-            raise InvalidTokenValuePrecision(
-                f"Not able to initialize {cls} with {type(value)} {value} due to unexpected precision. "
-                f"Try representing {value} in {decimal.Decimal} properly, or init token value in int from {cls._base_unit}"
-            )
-        self._warn_negative_token_value(value)
-        self._value = value
+        self._base_value = self._to_base_int(value)
+
+
+class TokenUnitRegistry:
+    """
+    The index of the token units in one token unit family.
+    Every base unit owns a registry, so units of different families never collide.
+    Names and aliases are looked up case-insensitively.
+
+    >>> from cfx_utils.token_unit import Drip
+    >>> registry = Drip.get_unit_registry()
+    >>> registry.get("gdrip")
+    <class 'cfx_utils.token_unit.GDrip'>
+    >>> registry.get_by_decimals(18)
+    <class 'cfx_utils.token_unit.CFX'>
+    """
+
+    __slots__ = ("base_unit", "_units", "_by_name", "_by_decimals", "_lock")
+
+    def __init__(self, base_unit: Type["AbstractBaseTokenUnit"]) -> None:
+        self.base_unit = base_unit
+        # the dicts are never mutated once published, mutations copy them under the lock and swap the references,
+        # so lookups need no lock and always see a consistent index
+        # unit name -> unit
+        self._units: Dict[str, Type[AbstractTokenUnit[Any]]] = {}
+        # names and aliases, both as registered and lower-cased -> unit
+        self._by_name: Dict[str, Type[AbstractTokenUnit[Any]]] = {}
+        # decimals -> the first registered unit with the decimals
+        self._by_decimals: Dict[int, Type[AbstractTokenUnit[Any]]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def units(self) -> Mapping[str, Type[AbstractTokenUnit[Any]]]:
+        """
+        The read-only `unit_name -> unit` mapping of the registered units, which is a snapshot not changed by later registrations
+        """
+        return types.MappingProxyType(self._units)
+
+    def register(self, unit: Type[AbstractTokenUnit[Any]], aliases: Iterable[str] = ()) -> None:
+        """
+        :raises ValueError: the unit is already registered, or any of its name and aliases
+            case-insensitively equals to the name or an alias of another unit
+        """
+        aliases = tuple(aliases)
+        with self._lock:
+            self._check_registrable(unit, aliases)
+            by_decimals = dict(self._by_decimals)
+            by_decimals.setdefault(unit._decimals, unit)
+            self._by_decimals = by_decimals
+            self._add_names(unit, (unit.__name__, *aliases))
+            # published last, so a unit listed in units is always found by name
+            self._units = {**self._units, unit.__name__: unit}
+
+    def add_alias(self, alias: str, unit: Type[AbstractTokenUnit[Any]]) -> None:
+        """
+        :raises ValueError: the unit is not registered, or the alias is used by another unit
+        """
+        with self._lock:
+            if self._units.get(unit.__name__) is not unit:
+                raise ValueError(f"{unit} is not registered to {self.base_unit.__name__}")
+            self._check_names(unit, (alias,))
+            self._add_names(unit, (alias,))
+
+    def get(self, name: str) -> Optional[Type[AbstractTokenUnit[Any]]]:
+        """
+        Return the unit with the name or alias, or :const:`None` if not found
+        """
+        # registered names hit the first lookup, others are lower-cased once
+        by_name = self._by_name
+        unit = by_name.get(name)
+        if unit is None:
+            unit = by_name.get(name.lower())
+        return unit
+
+    def get_by_decimals(self, decimals: int) -> Optional[Type[AbstractTokenUnit[Any]]]:
+        """
+        Return the first registered unit with the decimals, or :const:`None` if not found
+        """
+        return self._by_decimals.get(decimals)
+
+    def _check_registrable(self, unit: Type[AbstractTokenUnit[Any]], aliases: Tuple[str, ...]) -> None:
+        if unit.__name__ in self._units:
+            raise ValueError(f"{unit.__name__} is already registered to {self.base_unit.__name__}")
+        self._check_names(unit, (unit.__name__, *aliases))
+
+    def _check_names(self, unit: Type[AbstractTokenUnit[Any]], names: Tuple[str, ...]) -> None:
+        for name in names:
+            registered = self._by_name.get(name.lower())
+            if registered is not None and registered is not unit:
+                raise ValueError(
+                    f"{name} is already used by {registered.__name__} in {self.base_unit.__name__} token unit family"
+                )
+
+    def _add_names(self, unit: Type[AbstractTokenUnit[Any]], names: Tuple[str, ...]) -> None:
+        by_name = dict(self._by_name)
+        for name in names:
+            by_name[name] = unit
+            by_name[name.lower()] = unit
+        self._by_name = by_name
+
+    def __repr__(self) -> str:
+        return f"TokenUnitRegistry({self.base_unit.__name__}: {', '.join(self._units)})"
 
 
 class AbstractBaseTokenUnit(AbstractTokenUnit[Self], abc.ABC):
-    _derived_units: Dict[str, Type["AbstractTokenUnit[Self]"]] = {}
+    __slots__ = ()
+    _registry: ClassVar[TokenUnitRegistry]
     _decimals: ClassVar[int] = 0
+    _scale: ClassVar[int] = 1
     _base_unit: Type[Self]
-    _value: int
+    _inexact_error: ClassVar[Type[TokenError]] = InvalidTokenValueType
 
     @property
     def value(self) -> int:
-        return self._value
+        return self._base_value
 
     @value.setter
     def value(self, value: Union[int, decimal.Decimal, float]) -> None:
-        self._warn_float_value(value)
-        if value % 1 != 0:
-            raise InvalidTokenValueType(
-                f"An integer is expected to init {self.__class__}, "
-                f"received type {type(value)} argument: {value}"
-            )
-        value = int(value)
-        self._warn_negative_token_value(value)
-        self._value = value
+        self._ensure_mutable()
+        _warn_value_setter()
+        self._base_value = self._to_base_int(value)
+
+    @classmethod
+    def _to_base_int(cls, value: Union[int, decimal.Decimal, float]) -> int:
+        cls._warn_float_value(value)
+        if not isinstance(value, int):
+            if value % 1 != 0:
+                raise InvalidTokenValueType(
+                    f"An integer is expected to init {cls}, "
+                    f"received type {type(value)} argument: {value}"
+                )
+            value = int(value)
+        cls._warn_negative_token_value(value)
+        return value
 
     @overload
     def __init__(self, value: str, base: int = 10):
@@ -648,16 +1236,25 @@ class AbstractBaseTokenUnit(AbstractTokenUnit[Self], abc.ABC):
             return
         if isinstance(value, str):
             value = int(value, base)
-        self.value = value  # type: ignore
+        self._base_value = self._to_base_int(value)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # each token unit family has its own registry
+        cls._registry = TokenUnitRegistry(cls)
 
     @classmethod
     def register_derived_unit(
-        cls, derived_unit: Type["AbstractDerivedTokenUnit[Self]"]
+        cls, derived_unit: Type["AbstractDerivedTokenUnit[Self]"], aliases: Iterable[str] = ()
     ) -> None:
         """
         Register a new derived token unit to a base unit
 
-        :raises ValueError: if a token unit with the same name is already registered
+        :param Type[AbstractDerivedTokenUnit[Self]] derived_unit: the token unit to register
+        :param Iterable[str] aliases: other names of the token unit, which can be used in :meth:`~AbstractTokenUnit.to`
+        :raises ValueError: if the name or any alias of the token unit case-insensitively equals to
+            the name or an alias of a registered token unit of the same family,
+            or the token unit is registered to another base unit
 
         >>> from cfx_utils import Drip, AbstractDerivedTokenUnit
         >>> # The AbstractDerivedTokenUnit[Drip] is used for type hints
@@ -670,10 +1267,74 @@ class AbstractBaseTokenUnit(AbstractTokenUnit[Self], abc.ABC):
         >>> uCFX(1).to_base_unit()
         1000000000000 Drip
         """
-        if derived_unit.__name__ in cls._derived_units:
-            raise ValueError
-        derived_unit._base_unit = cls
-        cls._derived_units[derived_unit.__name__] = derived_unit
+        aliases = tuple(aliases)
+        registry = cls._registry
+        with registry._lock:
+            # checked before the unit is changed, so a rejected unit is left as is,
+            # and the unit is configured before it can be found in the registry by other threads
+            registry._check_registrable(derived_unit, aliases)
+            # only the unit's own base unit counts, a _base_unit inherited from the parent unit does not,
+            # e.g. `class MyDrip(Drip)` registers itself as a new base unit
+            current_base_unit = derived_unit.__dict__.get("_base_unit")
+            if current_base_unit is not None and current_base_unit is not cls:
+                raise ValueError(f"{derived_unit.__name__} is already registered to {current_base_unit.__name__}")
+            derived_unit._base_unit = cls
+            derived_unit._scale = 10**derived_unit._decimals
+            registry.register(derived_unit, aliases)
+
+    @classmethod
+    def register_unit_alias(cls, alias: str, unit: Type["AbstractTokenUnit[Self]"]) -> None:
+        """
+        Register an alias of a registered token unit
+
+        :raises ValueError: if the unit is not registered, or the alias is used by another token unit
+
+        >>> from cfx_utils import CFX, Drip, GDrip
+        >>> Drip.register_unit_alias("gwei", GDrip)
+        >>> CFX(1).to("gwei")
+        1000000000 GDrip
+        """
+        cls._registry.add_alias(alias, unit)
+
+    @classmethod
+    def get_unit_registry(cls) -> TokenUnitRegistry:
+        """
+        :return TokenUnitRegistry: the registry of the token unit family
+        """
+        return cls._registry
+
+    @classmethod
+    def from_hex_many(cls, values: Iterable[str]) -> List[Self]:
+        """
+        Create token objects from JSON-RPC hex quantities, such as the results of `cfx_getBalance` or `cfx_gasPrice`.
+        The values are parsed in one pass and only checked to be hex quantities,
+        which is much cheaper than initializing token objects one by one.
+        Use :meth:`~cfx_utils.token_array.TokenArray.from_hex_many` if a column is preferred.
+
+        :param Iterable[str] values: hex quantities such as "0x1f"
+        :raises InvalidTokenValueType: any of the values is not a hex quantity
+
+        >>> from cfx_utils.token_unit import Drip
+        >>> Drip.from_hex_many(["0x0", "0x3b9aca00"])
+        [0 Drip, 1000000000 Drip]
+        """
+        from_base_int = cls._from_base_int
+        return [from_base_int(value) for value in _parse_hex_quantities(values)]
+
+    @classmethod
+    async def afrom_hex_many(cls, pages: AsyncIterable[Iterable[str]]) -> AsyncIterator[List[Self]]:
+        """
+        The asynchronous counterpart of :meth:`from_hex_many`.
+        Each page of hex quantities from `pages` is parsed in one pass and yielded as a list of token objects.
+
+        :param AsyncIterable[Iterable[str]] pages: an async iterable of hex quantity pages, e.g. RPC responses
+        :raises InvalidTokenValueType: any of the values is not a hex quantity
+
+        >>> async for balances in Drip.afrom_hex_many(fetch_balance_pages()):
+        ...     process(balances)
+        """
+        async for page in pages:
+            yield cls.from_hex_many(page)
 
     @classmethod
     def get_derived_units_dict(cls) -> Dict[str, Type["AbstractTokenUnit[Self]"]]:
@@ -686,7 +1347,131 @@ class AbstractBaseTokenUnit(AbstractTokenUnit[Self], abc.ABC):
         'CFX': <class 'cfx_utils.token_unit.CFX'>,
         'GDrip': <class 'cfx_utils.token_unit.GDrip'>}
         """
-        return cls._derived_units
+        # a copy, so changing it does not corrupt the registry
+        return dict(cls._registry._units)
+
+
+# the max count of least recently used objects checked for eviction on a cache miss
+_EVICTION_ATTEMPTS = 8
+
+
+class TokenInternCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class TokenInternCache:
+    """
+    A bounded LRU cache of shared token objects keyed on (token unit, base unit integer),
+    which is used by :meth:`AbstractTokenUnit.interned`.
+    Interning avoids allocating new objects for values repeating constantly, e.g. `Drip(0)` or `GDrip(20)`.
+
+    >>> from cfx_utils.token_unit import Drip, token_intern_cache
+    >>> token_intern_cache.resize(4096)
+    >>> Drip.interned(0)
+    0 Drip
+    >>> token_intern_cache.cache_info()
+    TokenInternCacheInfo(hits=0, misses=1, evictions=0, maxsize=4096, currsize=1)
+
+    An object still referenced elsewhere is not evicted but moved to the most recently used end,
+    so it is shared and immutable as long as it is used, and the cache might exceed `maxsize` for it.
+    """
+
+    # every live cache, so that token objects shared by any cache are recognized as immutable
+    _caches: ClassVar["weakref.WeakSet[TokenInternCache]"] = weakref.WeakSet()
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        :param int maxsize: the max count of cached token objects, 0 means no new object is cached
+        """
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[Tuple[type, int], AbstractTokenUnit[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        TokenInternCache._caches.add(self)
+
+    @classmethod
+    def _shares(cls, instance: "AbstractTokenUnit[Any]") -> bool:
+        return any(cache.contains(instance) for cache in list(cls._caches))
+
+    def get(self, unit: Type[AnyTokenUnit], base_value: int) -> AnyTokenUnit:
+        """
+        Return the cached token object of `unit` with `base_value`, the object will be created and cached if missed
+        """
+        key = (unit, base_value)
+        with self._lock:
+            instance = self._cache.get(key)
+            if instance is not None:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return cast(AnyTokenUnit, instance)
+            self._misses += 1
+            instance = unit._from_base_int(base_value)
+            if self._maxsize > 0:
+                self._cache[key] = instance
+                if len(self._cache) > self._maxsize:
+                    # a few candidates at most, so a cache full of referenced objects does not slow down misses
+                    self._evict(self._maxsize, _EVICTION_ATTEMPTS)
+            return instance
+
+    def _evict(self, maxsize: int, attempts: int) -> None:
+        """
+        Evict the least recently used objects till at most `maxsize` objects are cached,
+        checking at most `attempts` objects. The caller should hold the lock.
+        """
+        cache = self._cache
+        while len(cache) > maxsize and attempts > 0:
+            attempts -= 1
+            key, instance = cache.popitem(last=False)
+            # referenced by `instance` and the argument of getrefcount only, otherwise it is still shared
+            if sys.getrefcount(instance) > 2:
+                cache[key] = instance
+            else:
+                self._evictions += 1
+
+    def contains(self, instance: "AbstractTokenUnit[Any]") -> bool:
+        """
+        Whether the token object is shared by the cache
+        """
+        # locked, as a referenced object is popped and put back during eviction
+        with self._lock:
+            return self._cache.get((type(instance), instance._base_value)) is instance
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the max count of cached token objects, the least recently used objects are evicted if necessary
+        """
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict(max(maxsize, 0), len(self._cache))
+
+    def cache_info(self) -> TokenInternCacheInfo:
+        """
+        Return the statistics of the cache, which is helpful to tune :meth:`resize` for the workload.
+        """
+        with self._lock:
+            return TokenInternCacheInfo(
+                self._hits, self._misses, self._evictions, self._maxsize, len(self._cache)
+            )
+
+    def cache_clear(self) -> None:
+        """
+        Remove all cached objects not referenced elsewhere and reset the statistics
+        """
+        with self._lock:
+            self._evict(0, len(self._cache))
+            self._hits = self._misses = self._evictions = 0
+
+
+token_intern_cache = TokenInternCache()
+"""
+The global :class:`TokenInternCache` used by :meth:`AbstractTokenUnit.interned`
+"""
 
 
 # This class is unused because type hint is not friendly if registered by factory
@@ -695,17 +1480,18 @@ class AbstractBaseTokenUnit(AbstractTokenUnit[Self], abc.ABC):
 class TokenUnitFactory:
     @classmethod
     def factory_derived_unit(
-        cls, unit_name: str, decimals: int, base_unit: Type[BaseTokenUnit]
+        cls, unit_name: str, decimals: int, base_unit: Type[BaseTokenUnit], aliases: Iterable[str] = ()
     ) -> Type["AbstractDerivedTokenUnit[BaseTokenUnit]"]:
         derived_unit = cast(
             Type[AbstractDerivedTokenUnit[type(base_unit)]],
-            type(
+            # type() cannot resolve generic aliases such as AbstractDerivedTokenUnit[Drip] as bases
+            types.new_class(
                 unit_name,
-                (AbstractDerivedTokenUnit[type(base_unit)],),
-                {"_decimals": decimals, "_base_unit": base_unit},
+                (AbstractDerivedTokenUnit[base_unit],),
+                exec_body=lambda ns: ns.update({"__slots__": (), "_decimals": decimals, "_base_unit": base_unit}),
             ),
         )
-        base_unit.register_derived_unit(derived_unit)
+        base_unit.register_derived_unit(derived_unit, aliases)
         return derived_unit
 
     @classmethod
@@ -719,7 +1505,7 @@ class TokenUnitFactory:
             type(
                 unit_name,
                 (AbstractBaseTokenUnit,),
-                {},
+                {"__slots__": ()},
             ),
         )
         BaseUnit.register_derived_unit(BaseUnit)  # type: ignore
@@ -731,7 +1517,7 @@ class TokenUnitFactory:
 if TYPE_CHECKING:
 
     class Drip(AbstractBaseTokenUnit["Drip"]):
-        pass
+        __slots__ = ()
 
 else:
 
@@ -742,7 +1528,7 @@ else:
         so it supports :meth:`__eq__`, :meth:`__le__`, :meth:`__add__`, etc.
         """
 
-        pass
+        __slots__ = ()
 
     Drip.register_derived_unit(Drip)
 
@@ -755,6 +1541,7 @@ class CFX(AbstractDerivedTokenUnit[Drip]):
     1 CFX = 10**18 Drip.
     """
 
+    __slots__ = ()
     _decimals: ClassVar[int] = 18
 
 
@@ -767,6 +1554,7 @@ class GDrip(AbstractDerivedTokenUnit[Drip]):
     1 GDrip = 10**9 Drip
     """
 
+    __slots__ = ()
     _decimals: ClassVar[int] = 9
 
 
@@ -799,6 +1587,44 @@ def to_int_if_drip_units(value: Union[AbstractTokenUnit[Drip], T]) -> Union[int,
     'a string'
     """
     if isinstance(value, AbstractTokenUnit):
-        # TokenUnitNotMatch might arise
-        return value.to(Drip).value
+        if value._base_unit is not Drip:
+            raise TokenUnitNotMatch(
+                f"Cannot convert {type(value)} to {Drip} because of different token unit"
+            )
+        return value._base_value
     return value
+
+
+def format_many(
+    values: Iterable[AbstractTokenUnit[Any]],
+    unit: Optional[Union[str, Type[AbstractTokenUnit[Any]]]] = None,
+    decimals: Optional[int] = None,
+    grouping: Union[bool, str] = False,
+    rounding: Optional[str] = None,
+    trim: bool = False,
+    with_unit: bool = True,
+) -> List[str]:
+    """
+    Format a column of token values, which is the same as calling :meth:`AbstractTokenUnit.format` on each value,
+    but the format parameters are only resolved once for each unit.
+
+    :raises InvalidTokenValueType: any of the values is not a token value
+    :raises TokenUnitNotMatch: `unit` is not in the token unit family of any of the values
+
+    >>> from cfx_utils.token_unit import CFX, GDrip, format_many
+    >>> format_many([CFX(1), GDrip(1)], unit=GDrip)
+    ['1000000000 GDrip', '1 GDrip']
+    """
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    separator = _grouping_separator(grouping)
+    rounding = rounding or _token_context.get().rounding
+    formatters: Dict[type, Callable[[int], str]] = {}
+    for value_unit in set(map(type, values)):
+        if not issubclass(value_unit, AbstractTokenUnit):
+            raise InvalidTokenValueType(f"{value_unit} is not a token unit")
+        target_unit = value_unit if unit is None else _format_unit(value_unit._base_unit, unit)
+        formatters[value_unit] = _get_formatter(target_unit, decimals, separator, rounding, trim, with_unit)
+    if len(formatters) == 1:
+        formatter = formatters.popitem()[1]
+        return [formatter(value._base_value) for value in values]
+    return [formatters[type(value)](value._base_value) for value in values]
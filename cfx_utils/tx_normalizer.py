@@ -0,0 +1,220 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from typing_extensions import (
+    Literal,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from cfx_utils.exceptions import (
+    InvalidTransaction,
+)
+from cfx_utils.token_unit import (
+    AbstractTokenUnit,
+    Drip,
+)
+from cfx_utils.types import (
+    CIP1559TxDict,
+    LegacyTxDict,
+    TxParam,
+    TypedTxDict,
+)
+
+DataFormat = Literal["hex", "bytes"]
+"""
+The format of the normalized `data` field, "hex" for a "0x" prefixed hex string and "bytes" for :class:`bytes`
+"""
+
+_UINT256_LIMIT = 1 << 256
+
+
+def _to_uint(value: Any) -> int:
+    if type(value) is not int:
+        if isinstance(value, str) and value[:2] in ("0x", "0X"):
+            digits = value[2:]
+            # int(..., 16) also accepts underscores, surrounding whitespace and a sign
+            if not (digits.isascii() and digits.isalnum()):
+                raise InvalidTransaction(f"{value!r} is not a valid hex string")
+            try:
+                value = int(digits, 16)
+            except ValueError:
+                raise InvalidTransaction(f"{value!r} is not a valid hex string")
+        elif isinstance(value, int) and not isinstance(value, bool):
+            value = int(value)
+        else:
+            raise InvalidTransaction(f"an int or a hex string is expected, received {type(value)} {value!r}")
+    if 0 <= value < _UINT256_LIMIT:
+        return value
+    raise InvalidTransaction(f"{value} is out of uint256 range")
+
+
+# token unit classes of the Drip family which have been seen, to skip the slow isinstance check of ABC
+_drip_units: Set[type] = set()
+
+
+def _to_drip_int(value: Any) -> int:
+    value_type = type(value)
+    if value_type not in _drip_units:
+        if not isinstance(value, AbstractTokenUnit):
+            return _to_uint(value)
+        if value._base_unit is not Drip:
+            raise InvalidTransaction(f"a token value in Drip units is expected, received {value!r}")
+        _drip_units.add(value_type)
+    base_value = value._base_value
+    if 0 <= base_value < _UINT256_LIMIT:
+        return base_value
+    raise InvalidTransaction(f"{base_value} Drip is out of uint256 range")
+
+
+def _data_to_bytes(value: Any) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, str):
+        digits = value[2:] if value[:2] in ("0x", "0X") else value
+        # bytes.fromhex also skips the whitespace between the bytes
+        if not (digits.isascii() and (digits.isalnum() or not digits)):
+            raise InvalidTransaction(f"{value!r} is not a valid hex string")
+        try:
+            return bytes.fromhex(digits)
+        except ValueError:
+            raise InvalidTransaction(f"{value!r} is not a valid hex string")
+    raise InvalidTransaction(f"bytes or a hex string is expected, received {type(value)} {value!r}")
+
+
+def _data_to_hex(value: Any) -> str:
+    return "0x" + _data_to_bytes(value).hex()
+
+
+def _compile_field(annotation: Any, data_format: DataFormat) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the normalizer of a field according to its annotation, or :const:`None` if the field is kept as is
+    """
+    options = get_args(annotation) or (annotation,)
+    for option in options:
+        option_type = get_origin(option) or option
+        if isinstance(option_type, type) and issubclass(option_type, AbstractTokenUnit):
+            return _to_drip_int
+    if bytes in options:
+        return _data_to_hex if data_format == "hex" else _data_to_bytes
+    for option in options:
+        # NewType such as Nonce is an int
+        if option is int or getattr(option, "__supertype__", None) is int:
+            return _to_uint
+    return None
+
+
+def _compile_plan(tx_dicts: Tuple[type, ...], data_format: DataFormat) -> Dict[str, Callable[[Any], Any]]:
+    plan: Dict[str, Callable[[Any], Any]] = {}
+    for tx_dict in tx_dicts:
+        for field, annotation in get_type_hints(tx_dict).items():
+            normalizer = _compile_field(annotation, data_format)
+            if normalizer is not None:
+                plan[field] = normalizer
+    return plan
+
+
+# (tx flavor, data format) -> {field: normalizer}, fields not in the plan are kept as is
+# typed transactions other than CIP-1559, i.e. CIP-2930 transactions, are priced by gasPrice
+_TX_PLANS: Dict[Tuple[type, str], Dict[str, Callable[[Any], Any]]] = {
+    (flavor, data_format): _compile_plan(tx_dicts, data_format)
+    for flavor, tx_dicts in (
+        (LegacyTxDict, (LegacyTxDict,)),
+        (TypedTxDict, (TypedTxDict, LegacyTxDict)),
+        (CIP1559TxDict, (CIP1559TxDict,)),
+    )
+    for data_format in ("hex", "bytes")
+}
+
+
+def detect_tx_flavor(tx: TxParam) -> Type[Any]:
+    """
+    Detect the flavor of a transaction dict from its `type` and fee fields
+
+    :return: one of :class:`~cfx_utils.types.LegacyTxDict`, :class:`~cfx_utils.types.TypedTxDict`
+        and :class:`~cfx_utils.types.CIP1559TxDict`
+    :raises InvalidTransaction: the fee fields conflict with each other or with the `type`
+
+    >>> from cfx_utils.tx_normalizer import detect_tx_flavor
+    >>> detect_tx_flavor({"maxFeePerGas": 1})
+    <class 'cfx_utils.types.CIP1559TxDict'>
+    """
+    tx_type = tx.get("type")
+    if tx_type is not None:
+        try:
+            tx_type = _to_uint(tx_type)
+        except InvalidTransaction as e:
+            raise InvalidTransaction(f"Invalid field type: {e}") from None
+    if "maxFeePerGas" in tx or "maxPriorityFeePerGas" in tx:
+        if "gasPrice" in tx:
+            raise InvalidTransaction("gasPrice cannot be used together with maxFeePerGas or maxPriorityFeePerGas")
+        if tx_type not in (None, 2):
+            raise InvalidTransaction(f"maxFeePerGas and maxPriorityFeePerGas are not allowed in type {tx_type} transactions")
+        return CIP1559TxDict
+    if tx_type == 2:
+        if "gasPrice" in tx:
+            raise InvalidTransaction("gasPrice is not allowed in type 2 transactions, use maxFeePerGas instead")
+        return CIP1559TxDict
+    if tx_type is None:
+        return LegacyTxDict
+    return TypedTxDict
+
+
+def normalize_tx(tx: TxParam, data_format: DataFormat = "hex") -> Dict[str, Any]:
+    """
+    Normalize a transaction dict in one pass and return a new dict:
+    token values (`value`, `gasPrice`, `maxFeePerGas` and `maxPriorityFeePerGas`) are converted to Drip ints,
+    integer fields accept ints or hex strings and are converted to ints,
+    all numbers are checked to be in uint256 range and `data` is converted to `data_format`.
+    The conversion of each field is compiled from the TypedDict of the transaction flavor once at import.
+    Fields not defined by the TypedDicts, such as `from`, `to` or `accessList`, are kept as is.
+
+    :param TxParam tx: the transaction dict, which is not modified
+    :param DataFormat data_format: "hex" or "bytes"
+    :raises InvalidTransaction: the transaction flavor is ambiguous or any field is invalid
+
+    >>> from cfx_utils.token_unit import CFX, GDrip
+    >>> from cfx_utils.tx_normalizer import normalize_tx
+    >>> normalize_tx({"value": CFX(1), "gasPrice": GDrip(1), "nonce": "0x1", "data": b"\\x01"})
+    {'value': 1000000000000000000, 'gasPrice': 1000000000, 'nonce': 1, 'data': '0x01'}
+    """
+    if data_format not in ("hex", "bytes"):
+        raise ValueError(f"Invalid data format {data_format!r}, expected 'hex' or 'bytes'")
+    plan = _TX_PLANS[(detect_tx_flavor(tx), data_format)]
+    normalized: Dict[str, Any] = {}
+    for field, value in tx.items():
+        normalizer = plan.get(field)
+        if normalizer is None:
+            normalized[field] = value
+            continue
+        try:
+            normalized[field] = normalizer(value)
+        except InvalidTransaction as e:
+            raise InvalidTransaction(f"Invalid field {field}: {e}") from None
+    return normalized
+
+
+def normalize_txs(txs: Iterable[TxParam], data_format: DataFormat = "hex") -> List[Dict[str, Any]]:
+    """
+    Normalize transaction dicts in batch, see :func:`normalize_tx`
+
+    :raises InvalidTransaction: any of the transactions is invalid, the message contains its index
+    """
+    results: List[Dict[str, Any]] = []
+    append = results.append
+    for index, tx in enumerate(txs):
+        try:
+            append(normalize_tx(tx, data_format))
+        except InvalidTransaction as e:
+            raise InvalidTransaction(f"Invalid transaction at index {index}: {e}") from None
+    return results
@@ -11,9 +11,11 @@ from typing_extensions import (
     TypedDict,
 )
 
-from hexbytes import (
-    HexBytes,
-)
+if TYPE_CHECKING:
+    # hexbytes takes long to import and HexBytes is only re-exported, so it is imported on first access
+    from hexbytes import (
+        HexBytes,
+    )
 from eth_typing.evm import (
     # Address,
     HexAddress,
@@ -89,6 +91,13 @@ class CIP1559TxDict(TypedTxDict, total=False):
 TxDict = Union[LegacyTxDict, TypedTxDict, CIP1559TxDict]
 TxParam = Union[TxDict, Dict[str, Any]]
 
+def __getattr__(name: str) -> Any:
+    if name == "HexBytes":
+        from hexbytes import HexBytes
+        globals()["HexBytes"] = HexBytes
+        return HexBytes
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "HexAddress",
     "HexBytes",
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+from eth_utils import (
+    to_checksum_address,
+)
+from cfx_utils.address import (
+    checksum_cache_clear,
+    checksum_cache_info,
+    is_hex_address,
+    to_checksum_hex_address,
+    validate_conflux_hex_address,
+    validate_hex_address,
+    validate_hex_addresses,
+)
+from cfx_utils.exceptions import (
+    AddressNotMatch,
+    InvalidConfluxHexAddress,
+    InvalidHexAddress,
+)
+
+user_address = "0x1ecde7223747601823f7535d7968ba98b4881e09"
+contract_address = "0x8ecde7223747601823f7535d7968ba98b4881e09"
+builtin_address = "0x0888000000000000000000000000000000000002"
+
+
+def test_checksum_consistent_with_eth_utils():
+    _random = random.Random(0)
+    checksum_cache_clear()
+    for _ in range(200):
+        address = "0x" + "".join(_random.choice("0123456789abcdef") for _ in range(40))
+        assert to_checksum_hex_address(address) == to_checksum_address(address)
+        assert to_checksum_hex_address(address.upper().replace("0X", "0x")) == to_checksum_address(address)
+        assert validate_hex_address(to_checksum_address(address))
+    assert checksum_cache_info().hits > 0
+    with pytest.raises(InvalidHexAddress):
+        to_checksum_hex_address("0x123")
+
+
+def test_validate_hex_address():
+    checksum_address = to_checksum_address(user_address)
+    for address in [user_address, "0x" + user_address[2:].upper(), checksum_address]:
+        assert validate_hex_address(address)
+        assert is_hex_address(address)
+    # flips the case of a letter
+    bad_checksum = checksum_address.replace("0x1EC", "0x1Ec")
+    for address in [bad_checksum, user_address[2:], user_address + "0", "0x" + "g" * 40, 1, None, b"0x00"]:
+        assert not is_hex_address(address)
+        with pytest.raises(InvalidHexAddress):
+            validate_hex_address(address)
+
+
+def test_validate_conflux_hex_address():
+    assert validate_conflux_hex_address(user_address, "user")
+    assert validate_conflux_hex_address(contract_address, "contract")
+    assert validate_conflux_hex_address(builtin_address, "builtin")
+    assert validate_conflux_hex_address(contract_address)
+    with pytest.raises(InvalidConfluxHexAddress):
+        validate_conflux_hex_address("0x2ecde7223747601823f7535d7968ba98b4881e09")
+    with pytest.raises(AddressNotMatch):
+        validate_conflux_hex_address(user_address, "contract")
+    with pytest.raises(InvalidHexAddress):
+        validate_conflux_hex_address("0x123")
+
+
+def test_validate_hex_addresses():
+    addresses = [user_address, "0x123", contract_address, to_checksum_address(user_address), None, "0x2" + user_address[3:]]
+    assert validate_hex_addresses(addresses) == 0b101101
+    assert validate_hex_addresses(iter(addresses), conflux=True) == 0b001101
+    assert validate_hex_addresses(addresses, address_type="user") == 0b001001
+    assert validate_hex_addresses([]) == 0
+    # unhashable values are reported as invalid too
+    assert validate_hex_addresses([user_address, [user_address]]) == 0b01
+    errors = validate_hex_addresses(addresses, conflux=True, return_errors=True)
+    assert [index for index, _ in errors] == [1, 4, 5]
+    assert isinstance(errors[0][1], InvalidHexAddress)
+    assert isinstance(errors[2][1], InvalidConfluxHexAddress)
+    assert validate_hex_addresses([user_address], return_errors=True) == []
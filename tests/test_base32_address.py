@@ -0,0 +1,145 @@
+import random
+
+import pytest
+from cfx_address import (
+    Base32Address,
+)
+from cfx_utils.base32_address import (
+    CHARSET,
+    decode_base32_address,
+    decode_many,
+    encode_base32_address,
+    encode_many,
+    is_valid_base32_address,
+    _encode,
+    _prefix_checksum,
+)
+from cfx_utils.exceptions import (
+    Base32AddressNotMatch,
+    InvalidBase32Address,
+    InvalidConfluxHexAddress,
+    InvalidHexAddress,
+    InvalidNetworkId,
+)
+
+_random = random.Random(0)
+hex_addresses = ["0x" + "0" * 40, "0x0888000000000000000000000000000000000002"] + [
+    f"0x{_random.choice('018')}{_random.getrandbits(156):039x}" for _ in range(200)
+]
+network_ids = [1, 1029, 71, 8888]
+
+
+def test_encode_consistent_with_cfx_address():
+    for hex_address in hex_addresses:
+        for network_id in network_ids:
+            for verbose in (False, True):
+                expected = Base32Address(hex_address, network_id, verbose)
+                assert encode_base32_address(hex_address, network_id, verbose) == expected
+                assert encode_base32_address(bytes.fromhex(hex_address[2:]), network_id, verbose) == expected
+    invalid_type_address = "0x2" + "0" * 39
+    assert encode_base32_address(invalid_type_address, 1, ignore_invalid_type=True) == Base32Address(
+        invalid_type_address, 1, _ignore_invalid_type=True
+    )
+    with pytest.raises(InvalidConfluxHexAddress):
+        encode_base32_address(invalid_type_address, 1)
+    with pytest.raises(InvalidHexAddress):
+        encode_base32_address("0x123", 1)
+    for network_id in [0, -1, 1.0, True, None]:
+        with pytest.raises(InvalidNetworkId):
+            encode_base32_address(hex_addresses[2], network_id)  # type: ignore
+
+
+def test_decode_consistent_with_cfx_address():
+    for hex_address in hex_addresses:
+        for network_id in network_ids:
+            for verbose in (False, True):
+                address = Base32Address(hex_address, network_id, verbose)
+                expected = Base32Address.decode(address)
+                parts = decode_base32_address(address)
+                assert parts._asdict() == expected
+
+
+def test_invalid_base32_address_consistent_with_cfx_address():
+    address = Base32Address(hex_addresses[5], 1029)
+    payload_start = address.index(":") + 1
+    candidates = [
+        address.upper(),
+        "CFX:TYPE.CONTRACT:" + address.upper()[payload_start:],
+        "CFX:GOD:" + address.upper()[payload_start:],
+        "cfx:type.null:" + address[payload_start:],
+        address[:-1],
+        address + "a",
+        address.replace("cfx:", "cfxtest:"),
+        address.replace("cfx:", "net1029:"),
+        address.replace("cfx:", "eth:"),
+        address.replace("cfx:", ""),
+        "cfx:" + address,
+        address[:-1].upper() + address[-1],
+        "cfx:" + "aa" + address[payload_start + 2:],
+        "",
+        1,
+        None,
+    ]
+    # substitute a character of the payload or checksum, except the version byte and the padding bits
+    for _ in range(300):
+        position = _random.randrange(payload_start + 2, len(address))
+        if position == payload_start + 33:
+            continue
+        candidates.append(address[:position] + _random.choice(CHARSET + "ilo!é ") + address[position + 1:])
+    for candidate in candidates:
+        assert is_valid_base32_address(candidate) == Base32Address.is_valid_base32(candidate), candidate
+    with pytest.raises(InvalidBase32Address):
+        decode_base32_address(address[:-1])
+    # cfx-address ignores the version byte and the padding bits, but CIP-37 requires them to be 0
+    with pytest.raises(InvalidBase32Address):
+        decode_base32_address(address[:payload_start] + "w" + address[payload_start + 1:])
+    padding_position = payload_start + 33
+    padded = address[:padding_position] + CHARSET[CHARSET.index(address[padding_position]) ^ 1] + address[padding_position + 1:]
+    assert Base32Address.is_valid_base32(padded)
+    with pytest.raises(InvalidBase32Address):
+        decode_base32_address(padded)
+    # cfx-address accepts any "net<digits>" prefix, but CIP-37 requires positive network ids without leading zeros,
+    # and the named prefixes for mainnet and testnet
+    address_bytes = bytes.fromhex(hex_addresses[5][2:])
+    for prefix in ["net0", "net00", "net010", "net1", "net1029"]:
+        forbidden = _encode(address_bytes, prefix, _prefix_checksum(prefix))
+        assert Base32Address.is_valid_base32(forbidden)
+        assert not is_valid_base32_address(forbidden), forbidden
+    allowed = _encode(address_bytes, "net10", _prefix_checksum("net10"))
+    assert decode_base32_address(allowed)._asdict() == Base32Address.decode(allowed)
+
+
+def test_encode_decode_many():
+    data = b"".join(bytes.fromhex(hex_address[2:]) for hex_address in hex_addresses)
+    addresses = encode_many(data, 1029)
+    assert addresses == [Base32Address(hex_address, 1029) for hex_address in hex_addresses]
+    assert encode_many(data, 1, verbose=True)[2] == Base32Address(hex_addresses[2], 1, True)
+    assert encode_many(memoryview(data), 1029, offset=20, count=2) == addresses[1:3]
+    assert encode_many(b"", 1029) == []
+
+    out = bytearray(len(data) + 1)
+    assert decode_many(addresses, out, offset=1, network_id=1029) == len(data)
+    assert bytes(out[1:]) == data
+
+    with pytest.raises(InvalidBase32Address):
+        encode_many(data[:-1], 1029)
+    with pytest.raises(InvalidConfluxHexAddress):
+        encode_many(bytes.fromhex("2" + "0" * 39), 1029)
+    with pytest.raises(InvalidBase32Address, match="index 1"):
+        decode_many([addresses[0], addresses[1][:-1]], out)
+    with pytest.raises(Base32AddressNotMatch):
+        decode_many(addresses, out, network_id=1)
+    with pytest.raises(ValueError):
+        decode_many(addresses, bytearray(20))
+    for offset in (-1, -20):
+        with pytest.raises(ValueError, match="negative"):
+            decode_many(addresses, bytearray(len(data)), offset=offset)
+        with pytest.raises(InvalidBase32Address, match="negative"):
+            encode_many(data, 1029, offset=offset)
+    with pytest.raises(InvalidBase32Address, match="negative"):
+        encode_many(data, 1029, count=-1)
+    # nothing is written if the buffer is too small
+    out = bytearray(len(data) - 1)
+    with pytest.raises(ValueError):
+        decode_many(iter(addresses), out)
+    assert out == bytearray(len(data) - 1)
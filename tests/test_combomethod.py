@@ -10,3 +10,15 @@ def test_combomethod_type_hint():
     f2 = A().a
     f1(1)
     f2(1)
+
+class B:
+    @combomethod
+    def who(cls_or_self, i: int) -> object:
+        return cls_or_self, i
+
+def test_combomethod_binding():
+    b = B()
+    assert B.who(1) == (B, 1)
+    assert b.who(2) == (b, 2)
+    assert B.who.__name__ == "who"
+    assert B.__dict__["who"].__name__ == "who"
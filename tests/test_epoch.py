@@ -0,0 +1,121 @@
+import pytest
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from cfx_utils.epoch import (
+    EpochRangePlanner,
+    EpochWindow,
+    normalize_epoch,
+)
+from cfx_utils.exceptions import (
+    InvalidEpochNumebrParam,
+)
+
+class TooManyLogsError(Exception):
+    pass
+
+class FakeLogRpc:
+    """
+    A stand-in of cfx_getLogs, which has `logs_per_epoch[epoch]` logs in each epoch
+    and rejects queries returning more than `max_results` logs like a node does
+    """
+    def __init__(self, logs_per_epoch: List[int], max_results: int):
+        self.logs_per_epoch = logs_per_epoch
+        self.max_results = max_results
+        self.calls = 0
+
+    def cfx_getLogs(self, params: Dict[str, str]) -> List[Any]:
+        self.calls += 1
+        from_epoch, to_epoch = int(params["fromEpoch"], 16), int(params["toEpoch"], 16)
+        logs = [
+            (epoch, i) for epoch in range(from_epoch, to_epoch + 1) for i in range(self.logs_per_epoch[epoch])
+        ]
+        if len(logs) > self.max_results:
+            raise TooManyLogsError
+        return logs
+
+def query_all(planner: EpochRangePlanner, rpc: FakeLogRpc, stop_after: int = -1) -> List[Any]:
+    logs: List[Any] = []
+    for window in planner:
+        try:
+            result = rpc.cfx_getLogs(window.to_filter_params())
+        except TooManyLogsError:
+            planner.shrink(window)
+            continue
+        planner.complete(window, len(result))
+        logs.extend(result)
+        if rpc.calls == stop_after:
+            break
+    return logs
+
+def test_normalize_epoch():
+    assert normalize_epoch(0) == "0x0"
+    assert normalize_epoch(100) == "0x64"
+    assert normalize_epoch("0x0064") == "0x64"
+    for literal in ["earliest", "latest_checkpoint", "latest_finalized", "latest_confirmed", "latest_state", "latest_mined", "pending"]:
+        assert normalize_epoch(literal) == literal
+    for param in [-1, "latest", "100", "0xzz", "0x", "0x1_0", " 0x10 ", "0x10\n", "0x-1", "0x\uff11", True, 1.0, None]:
+        with pytest.raises(InvalidEpochNumebrParam):
+            normalize_epoch(param) # type: ignore
+
+def test_planner_covers_range():
+    planner = EpochRangePlanner(5, "0x3e7", window=100)
+    windows: List[EpochWindow] = []
+    for window in planner:
+        windows.append(window)
+        planner.complete(window, 0)
+    assert windows[0] == EpochWindow(5, 104)
+    assert windows[-1].to_epoch == 999
+    assert all(a.to_epoch + 1 == b.from_epoch for a, b in zip(windows, windows[1:]))
+    # window doubles when results are few
+    assert [window.size for window in windows[:3]] == [100, 200, 400]
+    assert planner.done and planner.checkpoint == 1000
+
+def test_planner_adapts_to_results():
+    # dense epochs in the middle
+    logs_per_epoch = [1] * 2000 + [50] * 500 + [1] * 2000
+    rpc = FakeLogRpc(logs_per_epoch, max_results=1000)
+    planner = EpochRangePlanner(0, len(logs_per_epoch) - 1, window=500, max_window=1000, target_results=500)
+    logs = query_all(planner, rpc)
+    assert len(logs) == sum(logs_per_epoch)
+    assert len(set(logs)) == len(logs)
+
+def test_planner_resume_from_checkpoint():
+    logs_per_epoch = [3] * 1000
+    rpc = FakeLogRpc(logs_per_epoch, max_results=1000)
+    planner = EpochRangePlanner(0, 999, window=50)
+    first = query_all(planner, rpc, stop_after=3)
+    resumed = EpochRangePlanner(0, 999, window=50, checkpoint=planner.checkpoint)
+    rest = query_all(resumed, rpc)
+    assert sorted(first + rest) == sorted(FakeLogRpc(logs_per_epoch, 10**9).cfx_getLogs({"fromEpoch": "0x0", "toEpoch": hex(999)}))
+
+def test_planner_errors():
+    with pytest.raises(InvalidEpochNumebrParam):
+        EpochRangePlanner("latest_state", 100)
+    with pytest.raises(InvalidEpochNumebrParam):
+        EpochRangePlanner(10, 1)
+    with pytest.raises(InvalidEpochNumebrParam):
+        EpochRangePlanner(0, 10, checkpoint=12)
+    with pytest.raises(InvalidEpochNumebrParam):
+        EpochRangePlanner(0, 10, checkpoint=True)
+    with pytest.raises(InvalidEpochNumebrParam):
+        EpochRangePlanner(0, 10, checkpoint="0xzz")
+    with pytest.raises(InvalidEpochNumebrParam):
+        EpochRangePlanner(0, 10, checkpoint="0x_5")
+    with pytest.raises(InvalidEpochNumebrParam):
+        EpochRangePlanner(0, 10, checkpoint="latest_state")
+    assert EpochRangePlanner(0, 10, checkpoint="0x5").checkpoint == 5
+    with pytest.raises(ValueError):
+        EpochRangePlanner(0, 10, window=0)
+    planner = EpochRangePlanner(0, 10, window=1)
+    window = planner.next_window()
+    assert window is not None
+    with pytest.raises(ValueError):
+        planner.shrink(window)
+    with pytest.raises(ValueError):
+        planner.complete(EpochWindow(3, 4), 0)
+    with pytest.raises(RuntimeError):
+        for window in planner:
+            pass
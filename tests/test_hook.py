@@ -1,5 +1,10 @@
+import importlib
+import sys
+
 import pytest
 from cfx_utils.post_import_hook import (
+    _finder,
+    _post_import_hooks,
     when_imported
 )
 
@@ -15,3 +20,54 @@ def test_post_hook_import():
     assert str(s) == "spam_with_eggs"
     
 
+
+def test_finder_only_installed_while_hooks_pending(tmp_path, monkeypatch):
+    (tmp_path / "_cfx_hooked_module.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert _finder not in sys.meta_path
+    calls = []
+    when_imported("_cfx_hooked_module")(calls.append)
+    when_imported("_cfx_hooked_module")(lambda module: calls.append(module.VALUE))
+    assert _finder in sys.meta_path
+
+    # a module not found keeps its hooks pending
+    when_imported("_cfx_module_not_exist")(calls.append)
+    with pytest.raises(ModuleNotFoundError):
+        import _cfx_module_not_exist
+    assert "_cfx_module_not_exist" in _post_import_hooks
+    _post_import_hooks.pop("_cfx_module_not_exist")
+
+    import _cfx_hooked_module
+    assert calls == [_cfx_hooked_module, 1]
+    assert _finder not in sys.meta_path
+    assert not _post_import_hooks
+
+    # hooks are run exactly once
+    importlib.reload(_cfx_hooked_module)
+    assert calls == [_cfx_hooked_module, 1]
+    # the module is imported, so the hook is called immediately without installing the finder
+    when_imported("_cfx_hooked_module")(calls.append)
+    assert calls == [_cfx_hooked_module, 1, _cfx_hooked_module]
+    assert _finder not in sys.meta_path
+    sys.modules.pop("_cfx_hooked_module")
+
+def test_hooks_kept_when_import_fails(tmp_path, monkeypatch):
+    module_path = tmp_path / "_cfx_failing_module.py"
+    module_path.write_text("raise RuntimeError('not ready')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    calls = []
+    when_imported("_cfx_failing_module")(calls.append)
+    with pytest.raises(RuntimeError):
+        import _cfx_failing_module
+    # the hooks stay pending for the next import
+    assert calls == []
+    assert "_cfx_failing_module" in _post_import_hooks
+    assert _finder in sys.meta_path
+
+    module_path.write_text("VALUE = 'ready'\n")
+    importlib.invalidate_caches()
+    import _cfx_failing_module
+    assert calls == [_cfx_failing_module]
+    assert not _post_import_hooks
+    assert _finder not in sys.meta_path
+    sys.modules.pop("_cfx_failing_module")
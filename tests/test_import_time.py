@@ -0,0 +1,68 @@
+import subprocess
+import sys
+from typing import (
+    Dict,
+)
+
+import pytest
+
+# cumulative microseconds of a cold `import cfx_utils`, the token units are only imported on first access
+IMPORT_BUDGET_US = 30_000
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """
+    Run the statement in a fresh interpreter with `-X importtime`
+    and return the cumulative import time in microseconds of each imported module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cold_import_under_budget():
+    times = import_times("import cfx_utils")
+    assert "cfx_utils.token_unit" not in times
+    assert times["cfx_utils"] < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("module, deferred", [
+    ("cfx_utils.types", "hexbytes"),
+    ("cfx_utils.address", "eth_utils"),
+    ("cfx_utils.base32_address", "eth_utils"),
+])
+def test_heavy_imports_deferred(module: str, deferred: str):
+    assert deferred not in import_times(f"import {module}")
+
+
+def test_lazy_exports():
+    statement = "; ".join([
+        "import sys, cfx_utils",
+        "assert 'cfx_utils.token_unit' not in sys.modules",
+        "from cfx_utils import CFX",
+        "assert CFX is sys.modules['cfx_utils.token_unit'].CFX",
+        "assert 'CFX' in dir(cfx_utils)",
+        "from cfx_utils.types import HexBytes",
+        "assert HexBytes is sys.modules['hexbytes'].HexBytes",
+    ])
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    statement = "; ".join([
+        "import sys, cfx_utils",
+        "assert 'cfx_utils.exceptions' not in sys.modules",
+        "assert cfx_utils.token_unit.CFX is cfx_utils.CFX",
+        "assert cfx_utils.exceptions is sys.modules['cfx_utils.exceptions']",
+        "assert cfx_utils.decorators.combomethod is sys.modules['cfx_utils.decorators'].combomethod",
+        "assert cfx_utils.token_array.TokenArray is sys.modules['cfx_utils.token_array'].TokenArray",
+    ])
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    with pytest.raises(AttributeError):
+        import cfx_utils
+        cfx_utils.not_exist
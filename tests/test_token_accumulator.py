@@ -0,0 +1,78 @@
+import decimal
+import pytest
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from cfx_utils.token_accumulator import (
+    TokenAccumulator,
+    token_sum,
+)
+from cfx_utils.exceptions import (
+    InvalidTokenOperation,
+    NegativeTokenValueWarning,
+    TokenUnitNotMatch,
+)
+from tests.test_token_unit import (
+    Wei,
+)
+
+def test_accumulate():
+    acc = TokenAccumulator(CFX)
+    acc.add(CFX(1))
+    acc.add_many([GDrip(1), Drip(1)])
+    acc.add_many(iter([]))
+    acc += GDrip(2)
+    acc.sub(CFX(1))
+    acc -= Drip(1)
+    assert acc.total == 3 * 10**9
+    assert type(acc.result()) is Drip
+    assert acc.result() == Drip(3 * 10**9)
+    assert type(acc.result(GDrip)) is GDrip
+    assert acc.result(GDrip).value == 3
+    acc.reset()
+    assert acc.result(CFX) == 0
+
+def test_invalid_values():
+    acc = TokenAccumulator(Drip)
+    acc.add(Drip(1))
+    with pytest.raises(InvalidTokenOperation):
+        acc.add(Wei(1))
+    with pytest.raises(InvalidTokenOperation):
+        acc.add(1) # type: ignore
+    with pytest.raises(InvalidTokenOperation):
+        acc.add_many([Drip(1), Wei(1)])
+    assert acc.total == 1
+    with pytest.raises(TokenUnitNotMatch):
+        acc.result(Wei)
+    acc.sub(Drip(2))
+    with pytest.warns(NegativeTokenValueWarning):
+        assert acc.result() == Drip(-1)
+
+def test_builtin_sum():
+    assert 0 + CFX(1) == CFX(1)
+    assert type(sum([CFX(1), CFX(2)])) is CFX
+    assert sum([CFX(1), CFX(2)]) == CFX(3)
+    assert sum([CFX(1), GDrip(1)]) == Drip(10**18 + 10**9)
+    with pytest.raises(InvalidTokenOperation):
+        1 + CFX(1) # type: ignore
+    for other in [False, 0.0, decimal.Decimal(0)]:
+        with pytest.raises(InvalidTokenOperation):
+            other + CFX(1) # type: ignore
+
+def test_token_sum():
+    assert type(token_sum([CFX(1), CFX(2)])) is CFX
+    assert token_sum([CFX(1), CFX(2)]) == CFX(3)
+    assert type(token_sum([CFX(1), GDrip(1)])) is Drip
+    assert token_sum(iter([CFX(1), GDrip(1)])) == Drip(10**18 + 10**9)
+    assert type(token_sum([CFX(1), GDrip(1)], unit=GDrip)) is GDrip
+    assert token_sum([], unit=CFX) == CFX(0)
+    with pytest.raises(InvalidTokenOperation):
+        token_sum([])
+    with pytest.raises(InvalidTokenOperation):
+        token_sum([CFX(1), Wei(1)])
+    with pytest.raises(InvalidTokenOperation):
+        token_sum([CFX(1)], unit=Wei)
+    with pytest.raises(InvalidTokenOperation):
+        token_sum([CFX(1), 1]) # type: ignore
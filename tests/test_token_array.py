@@ -0,0 +1,108 @@
+import decimal
+import pytest
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from cfx_utils.token_array import (
+    TokenArray,
+)
+from cfx_utils.exceptions import (
+    InvalidTokenOperation,
+    InvalidTokenValueType,
+    NegativeTokenValueWarning,
+    TokenUnitNotMatch,
+)
+from tests.test_token_unit import (
+    Wei,
+)
+
+def test_from_and_to_units():
+    arr = TokenArray.from_units([CFX(1), CFX(2)])
+    assert arr.unit is CFX
+    assert arr.base_values == [10**18, 2 * 10**18]
+    assert arr.to_units() == [CFX(1), CFX(2)]
+    assert list(arr) == [CFX(1), CFX(2)]
+    assert arr[1] == CFX(2) and type(arr[1]) is CFX
+    assert arr[:1].to_units() == [CFX(1)]
+    
+    mixed = TokenArray.from_units([CFX(1), GDrip(1)])
+    assert mixed.unit is Drip
+    explicit = TokenArray.from_units([Drip(1)], unit=CFX)
+    assert explicit.unit is CFX
+    assert explicit.to_units() == [CFX(decimal.Decimal("1e-18"))]
+    assert TokenArray.from_units([CFX(1), GDrip(1)], unit=GDrip).unit is GDrip
+    with pytest.raises(TokenUnitNotMatch):
+        TokenArray.from_units([Drip(1), Wei(1)])
+
+def test_init_checks_base_values():
+    column = [1, 2]
+    arr = TokenArray(Drip, column)
+    column.append(3)
+    assert arr.base_values == [1, 2]
+    assert TokenArray(Drip, iter([5])).base_values == [5]
+    for values in [[1.5], [True], ["1"], [None], [1, decimal.Decimal(2)]]:
+        with pytest.raises(InvalidTokenValueType):
+            TokenArray(Drip, values)
+    with pytest.warns(NegativeTokenValueWarning):
+        TokenArray(Drip, [1, -1])
+
+def test_to_view():
+    arr = TokenArray.from_units([CFX(1), CFX(2)])
+    view = arr.to(GDrip)
+    assert view.to_units() == [GDrip(10**9), GDrip(2 * 10**9)]
+    assert type(view[0]) is GDrip
+    with pytest.raises(TokenUnitNotMatch):
+        arr.to(Wei)
+
+def test_arithmetic():
+    a = TokenArray.from_units([CFX(1), CFX(2)])
+    b = TokenArray.from_units([CFX(3), CFX(4)])
+    assert (a + b).to_units() == [CFX(4), CFX(6)]
+    assert (a + b).unit is CFX
+    assert (a + b.to(Drip)).unit is Drip
+    assert (a + GDrip(1)).to_units() == [Drip(10**18 + 10**9), Drip(2 * 10**18 + 10**9)]
+    with pytest.warns(NegativeTokenValueWarning):
+        assert (a - b).to_units() == [CFX(-2), CFX(-2)]
+    assert (a * 2).to_units() == [CFX(2), CFX(4)]
+    assert (3 * a).to_units() == [CFX(3), CFX(6)]
+    assert (a / 4).to_units() == [CFX(decimal.Decimal("0.25")), CFX(decimal.Decimal("0.5"))]
+    with pytest.raises(InvalidTokenOperation):
+        TokenArray.from_units([Drip(1)]) / 2
+    with pytest.raises(InvalidTokenOperation):
+        a + TokenArray.from_units([Wei(1), Wei(2)])
+    with pytest.raises(InvalidTokenOperation):
+        a + TokenArray.from_units([CFX(1)])
+
+def test_reduce_and_compare():
+    arr = TokenArray.from_units([CFX(3), CFX(1), CFX(2)])
+    assert arr.sum() == CFX(6)
+    assert arr.min() == CFX(1)
+    assert arr.max() == CFX(3)
+    with pytest.raises(InvalidTokenOperation):
+        TokenArray(CFX).min()
+    with pytest.raises(InvalidTokenOperation):
+        TokenArray(CFX).max()
+    assert (arr > Drip(10**18)) == [True, False, True]
+    assert (arr <= CFX(2)) == [False, True, True]
+    assert (arr == arr.to(Drip)) == [True, True, True]
+    assert (arr > 0) == [True, True, True]
+    assert arr.compress(arr >= CFX(2)).to_units() == [CFX(3), CFX(2)]
+    assert (arr == None) == [False, False, False]
+    assert (arr != "1 CFX") == [True, True, True]
+    for other in [None, 1, False, "1 CFX"]:
+        with pytest.raises(InvalidTokenOperation):
+            arr < other # type: ignore
+        with pytest.raises(InvalidTokenOperation):
+            arr >= other # type: ignore
+
+def test_from_hex_many():
+    arr = TokenArray.from_hex_many(GDrip, ["0x3b9aca00", "0x0"])
+    assert arr.unit is GDrip
+    assert arr.to_units() == [GDrip(1), GDrip(0)]
+
+def test_format():
+    arr = TokenArray.from_units([CFX(1), CFX(2)])
+    assert arr.format(decimals=2) == ["1.00 CFX", "2.00 CFX"]
+    assert arr.format("GDrip", grouping=True, with_unit=False) == ["1,000,000,000", "2,000,000,000"]
@@ -0,0 +1,106 @@
+import pytest
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from cfx_utils.token_array import (
+    TokenArray,
+)
+from cfx_utils.token_context import (
+    token_context,
+)
+from cfx_utils.token_codec import (
+    decode_many,
+    encode_many,
+    encoded_size,
+)
+from cfx_utils.exceptions import (
+    InvalidTokenValueType,
+)
+
+MAX_UINT256 = 2**256 - 1
+
+def test_scalar_codec():
+    assert Drip(1).to_bytes() == bytes(31) + b"\x01"
+    assert CFX.from_bytes(CFX(3).to_bytes()) == CFX(3)
+    assert type(GDrip.from_bytes(bytearray(32))) is GDrip
+    assert Drip(0).to_varint() == b"\x00"
+    assert Drip(300).to_varint() == b"\xac\x02"
+    assert len(Drip(MAX_UINT256).to_varint()) == 37
+    for value in [0, 1, 127, 128, 10**18, MAX_UINT256]:
+        assert Drip.from_bytes(Drip(value).to_bytes()) == Drip(value)
+        assert Drip.from_varint(Drip(value).to_varint()) == Drip(value)
+
+def test_scalar_codec_errors():
+    for value in [-1, MAX_UINT256 + 1]:
+        with token_context(negative_warning="ignore"):
+            token = Drip(value)
+        with pytest.raises(InvalidTokenValueType):
+            token.to_bytes()
+        with pytest.raises(InvalidTokenValueType):
+            token.to_varint()
+    with pytest.raises(InvalidTokenValueType):
+        Drip.from_bytes(b"\x01")
+    with pytest.raises(InvalidTokenValueType):
+        Drip.from_varint(b"\x80")
+    with pytest.raises(InvalidTokenValueType):
+        Drip.from_varint(b"\x01\x01")
+    with pytest.raises(InvalidTokenValueType):
+        # 38 bytes varint exceeds uint256
+        Drip.from_varint(b"\xff" * 37 + b"\x01")
+    with pytest.raises(InvalidTokenValueType, match="overflows"):
+        # the decoding stops at the 37th byte instead of reading the whole input
+        Drip.from_varint(b"\xff" * 10**6)
+
+@pytest.mark.parametrize("encoding", ["uint256", "varint"])
+def test_bulk_codec(encoding: str):
+    values = [CFX(1), GDrip(2), Drip(0), Drip(MAX_UINT256)] * 3000
+    size = encoded_size(values, encoding) # type: ignore
+    out = bytearray(size + 2)
+    assert encode_many(values, out, offset=2, encoding=encoding) == size # type: ignore
+    decoded = decode_many(out, Drip, offset=2, encoding=encoding) # type: ignore
+    assert decoded == values
+    assert all(type(value) is Drip for value in decoded)
+    array = decode_many(memoryview(out), CFX, offset=2, count=2, encoding=encoding, as_array=True) # type: ignore
+    assert isinstance(array, TokenArray)
+    assert array.to_units() == [CFX(1), GDrip(2)]
+    # TokenArray is encoded from its column directly
+    assert encode_many(TokenArray.from_units(values), bytearray(size), encoding=encoding) == size # type: ignore
+
+def test_bulk_codec_errors():
+    with pytest.raises(ValueError):
+        encode_many([CFX(1)], bytearray(31))
+    with pytest.raises(ValueError):
+        encode_many([CFX(1)], bytearray(32), encoding="json") # type: ignore
+    with token_context(negative_warning="ignore"):
+        negative = Drip(-1)
+    with pytest.raises(InvalidTokenValueType, match="Negative"):
+        encode_many([CFX(1), negative], bytearray(64))
+    with pytest.raises(InvalidTokenValueType, match="overflows"):
+        encode_many([Drip(MAX_UINT256 + 1)], bytearray(64))
+    with pytest.raises(InvalidTokenValueType):
+        encode_many([1, 2], bytearray(64)) # type: ignore
+    with pytest.raises(InvalidTokenValueType):
+        decode_many(bytes(33), Drip)
+    with pytest.raises(InvalidTokenValueType):
+        decode_many(bytes(32), Drip, count=2)
+    with pytest.raises(InvalidTokenValueType):
+        decode_many(b"\x01\x80", Drip, encoding="varint")
+    for encoding in ("uint256", "varint"):
+        with pytest.raises(ValueError):
+            encode_many([CFX(1)], bytearray(64), offset=-32, encoding=encoding) # type: ignore
+        with pytest.raises(InvalidTokenValueType):
+            decode_many(bytes(64), Drip, offset=-32, encoding=encoding) # type: ignore
+    # nothing is written if the buffer is too small
+    out = bytearray(40)
+    with pytest.raises(ValueError):
+        encode_many([CFX(1), CFX(2)], out)
+    assert out == bytearray(40)
+    with pytest.raises(ValueError):
+        encode_many([Drip(1)] * 5000, out, encoding="varint")
+    assert out == bytearray(40)
+    out = bytearray(6000)
+    with pytest.raises(InvalidTokenValueType):
+        encode_many([Drip(1)] * 5000 + [Drip(MAX_UINT256 + 1)], out, encoding="varint")
+    assert out == bytearray(6000)
@@ -0,0 +1,100 @@
+import asyncio
+import decimal
+import threading
+import warnings
+import pytest
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+)
+from cfx_utils.token_context import (
+    TokenContext,
+    get_token_context,
+    reset_token_context,
+    set_token_context,
+    token_context,
+)
+from cfx_utils.exceptions import (
+    FloatWarning,
+    NegativeTokenValueWarning,
+)
+
+def test_default_context():
+    context = get_token_context()
+    assert context.precision == 78
+    assert context.rounding == decimal.ROUND_HALF_EVEN
+    assert (context.float_warning, context.negative_warning) == ("warn", "warn")
+    with pytest.raises(ValueError):
+        TokenContext(float_warning="loud") # type: ignore
+
+def test_independent_of_global_decimal_context():
+    with decimal.localcontext() as ctx:
+        ctx.prec = 3
+        assert str(CFX(1) / Drip(3))== "333333333333333333." + "3" * 60
+    with token_context(precision=5):
+        assert CFX(1) / Drip(3) == decimal.Decimal("3.3333E+17")
+    with token_context(precision=5, rounding=decimal.ROUND_UP):
+        assert CFX(1) / Drip(3) == decimal.Decimal("3.3334E+17")
+
+def test_warning_policy():
+    with token_context(negative_warning="ignore", float_warning="ignore"):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            CFX(-1)
+            CFX(0.5)
+    with token_context(negative_warning="error"):
+        with pytest.raises(NegativeTokenValueWarning):
+            CFX(-1)
+        with pytest.raises(NegativeTokenValueWarning):
+            CFX(1) - CFX(2)
+    with token_context(float_warning="error"):
+        with pytest.raises(FloatWarning):
+            CFX(0.5)
+    with pytest.warns(FloatWarning):
+        CFX(0.5)
+
+def test_set_and_reset():
+    token = set_token_context(TokenContext(precision=10))
+    try:
+        assert get_token_context().precision == 10
+    finally:
+        reset_token_context(token)
+    assert get_token_context().precision == 78
+
+def test_context_isolation():
+    results = {}
+    
+    def in_thread():
+        results["thread"] = get_token_context().precision
+    
+    async def in_task(precision: int):
+        with token_context(precision=precision):
+            await asyncio.sleep(0)
+            return get_token_context().precision
+    
+    async def gather():
+        return await asyncio.gather(in_task(10), in_task(20))
+
+    with token_context(precision=30):
+        thread = threading.Thread(target=in_thread)
+        thread.start()
+        thread.join()
+    assert results["thread"] == 78
+    assert asyncio.run(gather()) == [10, 20]
+
+def test_context_immutable():
+    context = get_token_context()
+    with pytest.raises(AttributeError):
+        context.float_warning = "ignore" # type: ignore
+    with pytest.raises(AttributeError):
+        context._decimal_context = decimal.Context(prec=5) # type: ignore
+    context.decimal_context.prec = 5
+    assert get_token_context().precision == 78
+    assert str(CFX(1) / Drip(3))== "333333333333333333." + "3" * 60
+
+def test_warning_stacklevel():
+    with pytest.warns(FloatWarning) as record:
+        CFX(0.5)
+    with pytest.warns(NegativeTokenValueWarning) as negative_record:
+        CFX(1) - CFX(2)
+    assert record[0].filename == negative_record[0].filename == __file__
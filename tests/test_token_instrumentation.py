@@ -0,0 +1,117 @@
+import pytest
+from cfx_utils.token_unit import (
+    AbstractTokenUnit,
+    CFX,
+    Drip,
+    GDrip,
+)
+from cfx_utils.token_context import (
+    token_context,
+)
+from cfx_utils.token_instrumentation import (
+    TokenEventStats,
+    TokenInstrumentation,
+)
+from cfx_utils.exceptions import (
+    FloatWarning,
+    InvalidTokenOperation,
+    NegativeTokenValueWarning,
+)
+
+@pytest.fixture
+def instrumentation():
+    instrumentation = TokenInstrumentation()
+    instrumentation.enable()
+    try:
+        yield instrumentation
+    finally:
+        instrumentation.disable()
+
+def test_disabled_restores_originals():
+    originals = dict(AbstractTokenUnit.__dict__)
+    instrumentation = TokenInstrumentation()
+    instrumentation.enable(timing=True)
+    assert instrumentation.enabled
+    assert AbstractTokenUnit.__dict__["to"] is not originals["to"]
+    instrumentation.disable()
+    assert not instrumentation.enabled
+    for name in ("to", "__add__", "interned", "_to_base_int", "_warn_float_value"):
+        assert AbstractTokenUnit.__dict__[name] is originals[name]
+    # nothing is counted after disabled
+    CFX(1).to(Drip)
+    assert "to" not in instrumentation.snapshot().get("CFX", {})
+
+def test_count_events(instrumentation: TokenInstrumentation):
+    val = CFX(1)
+    val.to("Drip")
+    val.to(GDrip)
+    str(val)
+    val + GDrip(1)
+    GDrip.interned(20)
+    Drip.from_hex_many(["0x1", "0x2"])
+    with token_context(float_warning="ignore", negative_warning="ignore"):
+        CFX(0.5)
+        CFX(1) - CFX(2)
+    # the ignored warnings are not counted
+    assert "float_warning" not in instrumentation.snapshot()["CFX"]
+    assert "negative_warning" not in instrumentation.snapshot()["CFX"]
+    with pytest.warns(FloatWarning):
+        CFX(0.25)
+    with pytest.raises(NegativeTokenValueWarning):
+        with token_context(negative_warning="error"):
+            CFX(-1)
+    snapshot = instrumentation.snapshot()
+    assert snapshot["CFX"]["to"] == TokenEventStats(2, 0, 0)
+    assert snapshot["CFX"]["__init__"].count == 6
+    assert snapshot["CFX"]["precision_check"].count == 6
+    # str() and the negative warning of the subtraction
+    assert snapshot["CFX"]["decimal"].count == 2
+    assert snapshot["CFX"]["__add__"].count == 1
+    assert snapshot["CFX"]["float_warning"].count == 1
+    assert snapshot["CFX"]["negative_warning"].count == 1
+    assert snapshot["GDrip"]["interned"].count == 1
+    assert snapshot["Drip"]["from_hex_many"].count == 1
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
+
+def test_count_errors(instrumentation: TokenInstrumentation):
+    with pytest.raises(InvalidTokenOperation):
+        with token_context(float_warning="ignore"):
+            CFX(1) * 0.3
+    with pytest.raises(InvalidTokenOperation):
+        CFX(1) + 1 # type: ignore
+    snapshot = instrumentation.snapshot()
+    assert snapshot["CFX"]["__mul__"] == TokenEventStats(1, 1, 0)
+    assert snapshot["CFX"]["__add__"] == TokenEventStats(1, 1, 0)
+
+def test_timing_and_prometheus():
+    instrumentation = TokenInstrumentation()
+    instrumentation.enable(timing=True)
+    try:
+        CFX(1) / Drip(3)
+    finally:
+        instrumentation.disable()
+    assert instrumentation.snapshot()["CFX"]["__truediv__"].time_ns > 0
+    text = instrumentation.to_prometheus(prefix="test")
+    assert "# TYPE test_events_total counter" in text
+    assert 'test_events_total{unit="CFX",event="__truediv__"} 1' in text
+    assert 'test_errors_total{unit="CFX",event="__truediv__"} 0' in text
+    assert "test_event_seconds_total" in text
+
+def test_overlapping_instances():
+    originals = dict(AbstractTokenUnit.__dict__)
+    first = TokenInstrumentation()
+    second = TokenInstrumentation()
+    first.enable()
+    second.enable(timing=True)
+    CFX(1).to(Drip)
+    first.disable()
+    assert second.enabled and not first.enabled
+    CFX(1).to(Drip)
+    second.disable()
+    for name in ("to", "__add__", "interned", "_to_base_int", "_warn_float_value"):
+        assert AbstractTokenUnit.__dict__[name] is originals[name]
+    CFX(1).to(Drip)
+    assert first.snapshot()["CFX"]["to"] == TokenEventStats(1, 0, 0)
+    assert second.snapshot()["CFX"]["to"].count == 2
+    assert second.snapshot()["CFX"]["to"].time_ns > 0
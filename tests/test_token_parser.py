@@ -0,0 +1,73 @@
+import decimal
+import pytest
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from cfx_utils.token_context import (
+    token_context,
+)
+from cfx_utils.token_parser import (
+    parse_amount,
+    parse_amounts,
+)
+from cfx_utils.exceptions import (
+    InvalidTokenValuePrecision,
+    InvalidTokenValueType,
+    NegativeTokenValueWarning,
+    TokenUnitNotFound,
+    TokenUnitNotMatch,
+)
+from tests.test_token_unit import (
+    Wei,
+)
+
+def test_parse_amount():
+    assert type(parse_amount("1.5 CFX")) is CFX
+    assert parse_amount("1.5 CFX")._base_value == 15 * 10**17
+    assert parse_amount("30gdrip") == GDrip(30)
+    assert parse_amount(" .5 cfx ") == CFX(decimal.Decimal("0.5"))
+    assert parse_amount("+7 Drip") == Drip(7)
+    assert parse_amount("1. CFX") == CFX(1)
+    assert parse_amount("1.100000000000000000000 CFX") == CFX(decimal.Decimal("1.1"))
+    assert parse_amount("0.000000000000000001 CFX") == Drip(1)
+    assert parse_amount("12", default_unit=GDrip) == GDrip(12)
+    assert type(parse_amount("3 Wei", family=Wei)) is Wei
+    with pytest.warns(NegativeTokenValueWarning):
+        assert parse_amount("-1 CFX") == CFX(-1)
+
+def test_parse_amount_errors():
+    for amount in ["1e18 Drip", "1e18", "1.5E-3 CFX", "1E5CFX"]:
+        with pytest.raises(InvalidTokenValueType, match="Scientific notation"):
+            parse_amount(amount)
+    for amount in ["", ". CFX", "1 2 CFX", "1,000 CFX", "0x10 Drip", "\u0661\u0662 CFX", "1.\u0665 CFX", "\uff11 CFX", None]:
+        with pytest.raises(InvalidTokenValueType):
+            parse_amount(amount) # type: ignore
+    for amount in [b"1 CFX", 1, ["1 CFX"]]:
+        with pytest.raises(InvalidTokenValueType, match="expected to be a str"):
+            parse_amount(amount) # type: ignore
+    for amount in ["1" * 5000 + " Drip", "1" * 4290 + " CFX", "1" * 5000]:
+        with pytest.raises(InvalidTokenValueType, match="too many"):
+            parse_amount(amount, default_unit=Drip)
+    with pytest.raises(InvalidTokenValueType, match="not specified"):
+        parse_amount("1")
+    with pytest.raises(InvalidTokenValuePrecision, match="19 fractional digits"):
+        parse_amount("1.0000000000000000001 CFX")
+    with pytest.raises(InvalidTokenValuePrecision):
+        parse_amount("1.5 Drip")
+    with pytest.raises(TokenUnitNotFound):
+        parse_amount("1 ETH")
+    with pytest.raises(TokenUnitNotFound):
+        parse_amount("1 CFX", family=Wei)
+    with pytest.raises(TokenUnitNotMatch):
+        parse_amount("1", family=Wei, default_unit=CFX)
+
+def test_parse_amounts():
+    amounts = parse_amounts(["1 CFX", "0.5 cfx", "20 GDrip", "3"], default_unit=Drip)
+    assert amounts == [CFX(1), CFX(decimal.Decimal("0.5")), GDrip(20), Drip(3)]
+    assert [type(amount) for amount in amounts] == [CFX, CFX, GDrip, Drip]
+    assert parse_amounts(iter([])) == []
+    with token_context(negative_warning="error"):
+        with pytest.raises(NegativeTokenValueWarning):
+            parse_amounts(["1 CFX", "-1 CFX"])
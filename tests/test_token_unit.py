@@ -1,4 +1,9 @@
+import asyncio
+import concurrent.futures
+import copy
 import decimal
+import numbers
+import pickle
 from typing import (
     Any,
     Type,
@@ -9,7 +14,8 @@ from typing_extensions import (
 )
 import pytest
 from cfx_utils.token_unit import (
-    AbstractTokenUnit, Drip, CFX, GDrip, TokenUnitFactory
+    AbstractTokenUnit, AbstractDerivedTokenUnit, Drip, CFX, GDrip, TokenUnitFactory, to_int_if_drip_units,
+    TokenInternCache, TokenInternCacheInfo, token_intern_cache, format_many
 )
 from cfx_utils.exceptions import (
     DangerEqualWarning,
@@ -170,13 +176,256 @@ def test_value():
     assert_type_and_value(CFX(2).value, decimal.Decimal, 2)
     assert_type_and_value(Drip(2).value, int, 2)
     tmp = Drip(2)
-    tmp.value = 3
+    with pytest.warns(DeprecationWarning) as record:
+        tmp.value = 3
+    assert record[0].filename == __file__
     assert_type_and_value(tmp, Drip, 3)
-    with pytest.warns(FloatWarning):
+    with pytest.warns(FloatWarning), pytest.warns(DeprecationWarning):
         tmp.value = 3.0
-    with pytest.raises(InvalidTokenValueType):
+    with pytest.raises(InvalidTokenValueType), pytest.warns(DeprecationWarning):
         tmp.value = 0.5
+    derived = CFX(1)
+    with pytest.warns(DeprecationWarning):
+        derived.value = decimal.Decimal("0.5")
+    assert derived == Drip(5 * 10**17)
 
 def test_min():
     a = Drip(120*10**9)+GDrip(3)
     assert min(a, GDrip(150)) == a
+
+def test_base_value():
+    assert CFX(1)._base_value == 10**18
+    assert GDrip(decimal.Decimal("1.5"))._base_value == 15 * 10**8
+    assert Drip(10)._base_value == 10
+    assert (CFX(1) + GDrip(1))._base_value == 10**18 + 10**9
+    assert CFX(1).to(GDrip)._base_value == 10**18
+
+def test_precision_independent_of_decimal_context():
+    amount = "123456789012345678901234567.123456789012345678"
+    with decimal.localcontext() as ctx:
+        ctx.prec = 6
+        val = CFX(decimal.Decimal(amount))
+        assert val._base_value == 123456789012345678901234567123456789012345678
+        assert val.value == decimal.Decimal(amount)
+        assert str(val + CFX(1)) == "123456789012345678901234568.123456789012345678 CFX"
+        assert (val * 10**18).to(Drip).value == val._base_value * 10**18
+
+def test_from_hex_many():
+    assert Drip.from_hex_many(["0x0", "0x1f4515", hex(10**30)]) == [Drip(0), Drip(0x1f4515), Drip(10**30)]
+    assert Drip.from_hex_many(iter(["0x10"]))[0]._base_value == 16
+    assert Drip.from_hex_many([]) == []
+    # int(x, 16) accepts underscores, whitespace and non-ASCII digits, which are not JSON-RPC quantities
+    for invalid in ["10", "-0x1", "0xg", "0x", None, "0x1_f", "0x1f ", "0x\u0661"]:
+        with pytest.raises(InvalidTokenValueType):
+            Drip.from_hex_many(["0x1", invalid]) # type: ignore
+
+def test_afrom_hex_many():
+    async def pages():
+        yield ["0x1", "0x2"]
+        yield ("0x3",)
+    
+    async def collect():
+        return [page async for page in Drip.afrom_hex_many(pages())]
+    
+    assert asyncio.run(collect()) == [[Drip(1), Drip(2)], [Drip(3)]]
+
+def test_scale():
+    assert CFX._scale == 10**18
+    assert GDrip._scale == 10**9
+    assert Drip._scale == 1
+    Microether = TokenUnitFactory.factory_derived_unit("Microether", 12, Wei)
+    assert Microether._scale == 10**12
+    assert Microether(1).to(Wei) == Wei(10**12)
+
+def test_to_int_if_drip_units():
+    assert to_int_if_drip_units(CFX(1)) == 10**18
+    assert type(to_int_if_drip_units(GDrip(decimal.Decimal("1.5")))) is int
+    assert to_int_if_drip_units(Drip(3)) == 3
+    assert to_int_if_drip_units("a string") == "a string"
+    with pytest.raises(TokenUnitNotMatch):
+        to_int_if_drip_units(Wei(1))
+
+def test_slots():
+    for instance in [Drip(1), CFX(1), GDrip(1), Wei(1)]:
+        assert not hasattr(instance, "__dict__")
+        assert copy.copy(instance) == instance
+    for instance in [Drip(1), CFX(1), GDrip(1)]:
+        assert pickle.loads(pickle.dumps(instance)) == instance
+    assert isinstance(CFX(1), numbers.Number)
+    
+    # a family owned by the test, so the global Drip registry is not changed
+    Sun = TokenUnitFactory.factory_base_unit("Sun")
+    class mTRX(AbstractDerivedTokenUnit[Sun]): # type: ignore
+        __slots__ = ()
+        _decimals = 3
+    Sun.register_derived_unit(mTRX)
+    assert not hasattr(Sun(1), "__dict__")
+    assert not hasattr(mTRX(1), "__dict__")
+    assert mTRX(1) == Sun(1000)
+
+def test_interned():
+    token_intern_cache.cache_clear()
+    assert GDrip.interned(20) is GDrip.interned(20)
+    assert GDrip.interned(20) is GDrip.interned(Drip(20 * 10**9))
+    assert Drip.interned(0) is not CFX.interned(0)
+    assert GDrip.interned(20) == GDrip(20)
+    info = token_intern_cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 3, 3)
+    
+    with pytest.raises(InvalidTokenOperation):
+        Drip.interned(0).value = 1
+    assert Drip.interned(0) == 0
+    with pytest.raises(InvalidTokenValuePrecision):
+        CFX.interned(decimal.Decimal("1e-19"))
+    with pytest.raises(TokenUnitNotMatch):
+        Drip.interned(Wei(1))
+    token_intern_cache.cache_clear()
+
+def test_intern_cache_eviction():
+    cache = TokenInternCache(maxsize=2)
+    first = id(cache.get(Drip, 1))
+    cache.get(Drip, 2)
+    assert id(cache.get(Drip, 1)) == first
+    cache.get(Drip, 3)
+    assert cache.cache_info() == TokenInternCacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+    assert id(cache.get(Drip, 1)) == first
+    cache.resize(0)
+    assert cache.get(Drip, 1) is not cache.get(Drip, 1)
+    assert cache.cache_info().currsize == 0
+
+def test_interned_kept_while_referenced():
+    cache = TokenInternCache(maxsize=1)
+    held = cache.get(Drip, 1)
+    cache.get(Drip, 2)
+    # not evicted as it is still referenced, so it stays shared
+    assert cache.contains(held)
+    assert cache.get(Drip, 1) is held
+    with pytest.raises(InvalidTokenOperation):
+        held.value = 3
+    cache.resize(0)
+    cache.cache_clear()
+    assert cache.contains(held)
+    with pytest.raises(InvalidTokenOperation):
+        held.value = 3
+    assert held == Drip(1)
+    assert cache.cache_info().currsize == 1
+    del held
+    cache.resize(0)
+    assert cache.cache_info().currsize == 0
+    # ordinary token objects are not affected
+    mutable = Drip(1)
+    with pytest.warns(DeprecationWarning):
+        mutable.value = 3
+    assert mutable == Drip(3)
+
+def test_hash():
+    assert hash(CFX(1)) == hash(Drip(10**18)) == hash(GDrip(10**9))
+    assert len({CFX(1), Drip(10**18), GDrip(10**9), CFX(2)}) == 2
+    assert {CFX(1): "a"}[Drip(10**18)] == "a"
+    assert hash(Drip(0)) == hash(0)
+    assert len({0, Drip(0), CFX(0)}) == 1
+    assert len({Drip(1), Wei(1)}) == 2
+
+def test_from_base_int_unchecked():
+    assert_type_and_value(Drip.from_base_int_unchecked(10**18), Drip, 10**18)
+    assert_type_and_value(CFX.from_base_int_unchecked(10**18), CFX, 1)
+    assert_type_and_value(GDrip.from_base_int_unchecked(1), GDrip, decimal.Decimal("1e-9"))
+    assert CFX.from_base_int_unchecked(5 * 10**17) + CFX(1) == Drip(15 * 10**17)
+
+def test_unit_registry():
+    assert CFX(1).to("cfx") == CFX(1)
+    assert type(CFX(1).to("GDRIP")) is GDrip
+    assert Drip.get_unit_registry().get_by_decimals(9) is GDrip
+    assert Drip.get_unit_registry().get("Wei") is None
+    assert set(Drip.get_derived_units_dict()) >= {"Drip", "CFX", "GDrip"}
+    assert "Drip" not in Wei.get_derived_units_dict()
+    Drip.get_derived_units_dict().pop("CFX")
+    assert Drip.get_derived_units_dict()["CFX"] is CFX
+    with pytest.raises(TypeError):
+        Drip.get_unit_registry().units["CFX"] = GDrip # type: ignore
+    with pytest.raises(TokenUnitNotFound):
+        Wei(1).to("CFX")
+    
+    Gas = TokenUnitFactory.factory_base_unit("Gas")
+    KGas = TokenUnitFactory.factory_derived_unit("KGas", 3, Gas, aliases=["kilogas"])
+    Gas.register_unit_alias("k", KGas)
+    assert type(Gas(1000).to("KiloGas")) is KGas
+    assert Gas(1000).to("K") == KGas(1)
+    assert Gas.get_unit_registry().get_by_decimals(3) is KGas
+    # names are unique case-insensitively in a family, but can be reused in other families
+    with pytest.raises(ValueError):
+        TokenUnitFactory.factory_derived_unit("kgas", 6, Gas)
+    with pytest.raises(ValueError):
+        Gas.register_unit_alias("gas", KGas)
+    with pytest.raises(ValueError):
+        Gas.register_unit_alias("kg", CFX)
+    TokenUnitFactory.factory_derived_unit("KGas", 3, Wei)
+    # a rejected unit is not changed
+    with pytest.raises(ValueError):
+        Gas.register_derived_unit(CFX)
+    assert CFX._base_unit is Drip
+    # subclasses of registered units inherit _base_unit but are not registered yet
+    class MyDrip(Drip):
+        __slots__ = ()
+    MyDrip.register_derived_unit(MyDrip)
+    assert MyDrip._base_unit is MyDrip
+    assert Drip._base_unit is Drip
+    class MyCFX(CFX):
+        __slots__ = ()
+    MyDrip.register_derived_unit(MyCFX)
+    assert MyCFX(1).to_base_unit() == MyDrip(10**18)
+    assert CFX._base_unit is Drip
+
+def test_unit_registry_concurrent_registration():
+    Energy = TokenUnitFactory.factory_base_unit("Energy")
+    registry = Energy.get_unit_registry()
+    snapshots = []
+
+    def register(i: int) -> None:
+        unit = TokenUnitFactory.factory_derived_unit(f"Energy{i}", i % 30 + 1, Energy, aliases=[f"e{i}"])
+        # readers never lock and always see a consistent index
+        snapshots.append(len(registry.units))
+        assert registry.get(f"E{i}") is unit
+        assert Energy(10**30).to(f"energy{i}") == Energy(10**30)
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        list(executor.map(register, range(200)))
+    assert len(registry.units) == 201
+    assert all(registry.get(f"e{i}") is registry.units[f"Energy{i}"] for i in range(200))
+    assert max(snapshots) <= 201
+
+def test_format():
+    assert Drip(1234567890123456789012).format(CFX, decimals=4, grouping=True) == "1,234.5679 CFX"
+    assert CFX(1).format(decimals=2) == "1.00 CFX"
+    assert CFX(decimal.Decimal("1.5")).format() == "1.5 CFX"
+    assert Drip(5).format("cfx") == "0.000000000000000005 CFX"
+    assert GDrip(1234567).format(grouping="_", decimals=20, trim=True, with_unit=False) == "1_234_567"
+    assert CFX(decimal.Decimal("1.25")).format(decimals=1, rounding=decimal.ROUND_DOWN) == "1.2 CFX"
+    with pytest.raises(TokenUnitNotMatch):
+        CFX(1).format(Wei)
+    with pytest.raises(ValueError):
+        CFX(1).format(decimals=-1)
+    with pytest.raises(ValueError):
+        CFX(1).format(decimals=1, rounding="ROUND_RANDOM")
+
+@pytest.mark.parametrize("rounding", [
+    decimal.ROUND_DOWN, decimal.ROUND_UP, decimal.ROUND_HALF_UP, decimal.ROUND_HALF_DOWN,
+    decimal.ROUND_HALF_EVEN, decimal.ROUND_CEILING, decimal.ROUND_FLOOR, decimal.ROUND_05UP,
+])
+def test_format_rounding_consistent_with_decimal(rounding: str):
+    # compare with decimal.Decimal.quantize for values around the rounding boundaries
+    base_values = [n * 10**15 + offset for n in range(-30, 30) for offset in (-1, 0, 1, 5 * 10**14)]
+    for base_value in base_values:
+        expected = (decimal.Decimal(base_value) / 10**18).quantize(decimal.Decimal("0.01"), rounding=rounding)
+        if expected == 0:
+            expected = abs(expected)
+        assert Drip.from_base_int_unchecked(base_value).format(CFX, decimals=2, rounding=rounding, with_unit=False) == str(expected)
+
+def test_format_many():
+    assert format_many([CFX(1), GDrip(1)], unit=GDrip) == ["1000000000 GDrip", "1 GDrip"]
+    assert format_many(iter([CFX(1), GDrip(1)]), decimals=1) == ["1.0 CFX", "1.0 GDrip"]
+    assert format_many([], unit=CFX) == []
+    with pytest.raises(InvalidTokenValueType):
+        format_many([CFX(1), 1]) # type: ignore
+    with pytest.raises(TokenUnitNotMatch):
+        format_many([CFX(1), Wei(1)], unit=CFX)
@@ -0,0 +1,96 @@
+import pytest
+from cfx_utils.token_unit import (
+    CFX,
+    Drip,
+    GDrip,
+)
+from cfx_utils.types import (
+    CIP1559TxDict,
+    LegacyTxDict,
+    TypedTxDict,
+)
+from cfx_utils.tx_normalizer import (
+    detect_tx_flavor,
+    normalize_tx,
+    normalize_txs,
+)
+from cfx_utils.exceptions import (
+    InvalidTransaction,
+)
+from tests.test_token_unit import (
+    Wei,
+)
+
+def test_detect_tx_flavor():
+    assert detect_tx_flavor({"gasPrice": 1}) is LegacyTxDict
+    assert detect_tx_flavor({}) is LegacyTxDict
+    assert detect_tx_flavor({"type": "0x1", "gasPrice": 1}) is TypedTxDict
+    assert detect_tx_flavor({"type": 2}) is CIP1559TxDict
+    assert detect_tx_flavor({"maxFeePerGas": 1}) is CIP1559TxDict
+    for tx in [
+        {"gasPrice": 1, "maxFeePerGas": 1},
+        {"type": 1, "maxPriorityFeePerGas": 1},
+        {"type": 2, "gasPrice": 1},
+        {"type": "two"},
+    ]:
+        with pytest.raises(InvalidTransaction):
+            detect_tx_flavor(tx) # type: ignore
+
+def test_normalize_tx():
+    tx = {
+        "from": "cfxtest:aak2rra2njvd77ezwjvx04kkds9fzagfe6d5r8e957",
+        "value": CFX(1),
+        "gasPrice": GDrip(1),
+        "nonce": "0x1",
+        "gas": 21000,
+        "data": "0xABCD",
+        "accessList": [],
+    }
+    normalized = normalize_tx(tx) # type: ignore
+    assert normalized == {
+        "from": "cfxtest:aak2rra2njvd77ezwjvx04kkds9fzagfe6d5r8e957",
+        "value": 10**18,
+        "gasPrice": 10**9,
+        "nonce": 1,
+        "gas": 21000,
+        "data": "0xabcd",
+        "accessList": [],
+    }
+    assert tx["value"] == CFX(1)
+    assert normalize_tx({"data": "abcd"}, data_format="bytes") == {"data": b"\xab\xcd"}
+    assert normalize_tx(
+        {"type": "0x2", "maxFeePerGas": GDrip(2), "maxPriorityFeePerGas": Drip(1), "data": b""}
+    ) == {"type": 2, "maxFeePerGas": 2 * 10**9, "maxPriorityFeePerGas": 1, "data": "0x"}
+
+def test_normalize_tx_errors():
+    for tx in [
+        {"value": Wei(1)},
+        {"value": 2**256},
+        {"gas": -1},
+        {"gas": True},
+        {"nonce": 1.0},
+        {"nonce": "0xzz"},
+        {"data": "0xabc"},
+        {"data": 1},
+        {"nonce": "0x1_0"},
+        {"nonce": " 0x10 "},
+        {"nonce": "0x 10"},
+        {"nonce": "0x-1"},
+        {"nonce": "0x"},
+        {"data": "0x01 02"},
+        {"data": "0x0102 "},
+        {"data": "0x01_02"},
+    ]:
+        with pytest.raises(InvalidTransaction):
+            normalize_tx(tx) # type: ignore
+    with pytest.raises(InvalidTransaction, match="Invalid field value"):
+        normalize_tx({"value": -1})
+    with pytest.raises(ValueError):
+        normalize_tx({}, data_format="json") # type: ignore
+
+def test_normalize_txs():
+    assert normalize_txs(iter([{"value": CFX(1)}, {"maxFeePerGas": GDrip(1)}])) == [
+        {"value": 10**18}, {"maxFeePerGas": 10**9}
+    ]
+    with pytest.raises(InvalidTransaction, match="index 1"):
+        normalize_txs([{"value": CFX(1)}, {"value": -1}])